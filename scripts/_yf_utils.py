@@ -0,0 +1,37 @@
+"""Shared yfinance helpers for the debug scripts."""
+
+import threading
+from typing import Dict, List
+
+import yfinance as yf
+
+# Ticker objects reused per symbol so repeated lookups share their fetched state
+_TICKERS: Dict[str, yf.Ticker] = {}
+_TICKERS_LOCK = threading.Lock()
+
+
+def yf_ticker(symbol: str, session=None) -> yf.Ticker:
+    """Get the cached yfinance Ticker for a symbol, creating it on first use."""
+    symbol = symbol.upper().strip()
+    with _TICKERS_LOCK:
+        ticker = _TICKERS.get(symbol)
+        if ticker is None:
+            ticker = yf.Ticker(symbol, session=session)
+            _TICKERS[symbol] = ticker
+    return ticker
+
+
+def yf_tickers(symbols: List[str], session=None) -> Dict[str, yf.Ticker]:
+    """Get cached Tickers for several symbols, creating missing ones with one yf.Tickers call."""
+    symbols = [symbol.upper().strip() for symbol in symbols]
+    with _TICKERS_LOCK:
+        missing = [symbol for symbol in symbols if symbol not in _TICKERS]
+        if missing:
+            _TICKERS.update(yf.Tickers(" ".join(missing), session=session).tickers)
+        return {symbol: _TICKERS[symbol] for symbol in symbols}
+
+
+def clear_cache() -> None:
+    """Drop all cached Ticker objects."""
+    with _TICKERS_LOCK:
+        _TICKERS.clear()
@@ -2,8 +2,11 @@
 """Check SOFI data in the database."""
 
 import sys
+import traceback
 sys.path.append('.')
 
+from sqlalchemy import select
+from sqlalchemy.orm import load_only
 from models.database import get_db
 from models.portfolio import WatchedItem, Watchlist
 from datetime import datetime
@@ -11,24 +14,34 @@ from datetime import datetime
 try:
     db = next(get_db())
     
-    # Find SOFI in watchlists
-    sofi_items = db.query(WatchedItem).filter(WatchedItem.symbol == 'SOFI').all()
+    # Find SOFI in watchlists, leaving the news JSON unloaded until it is printed
+    stmt = select(WatchedItem, WatchedItem.news_data.isnot(None)).options(
+        load_only(
+            WatchedItem.watchlist_id,
+            WatchedItem.symbol,
+            WatchedItem.last_price,
+            WatchedItem.last_news_update,
+            WatchedItem.added_date
+        )
+    ).where(WatchedItem.symbol == 'SOFI')
+    sofi_items = db.execute(stmt).all()
     
     print(f"🔍 Found {len(sofi_items)} SOFI entries in database:")
     
-    for item in sofi_items:
+    for item, has_news_data in sofi_items:
         print(f"\n📊 SOFI in Watchlist {item.watchlist_id}:")
         print(f"   Symbol: {item.symbol}")
         print(f"   Last Price: {item.last_price}")
-        print(f"   Has News Data: {item.news_data is not None}")
-        if item.news_data:
-            print(f"   News Articles Count: {len(item.news_data.get('articles', []))}")
+        print(f"   Has News Data: {has_news_data}")
+        news_data = item.news_data if has_news_data else None
+        if news_data:
+            print(f"   News Articles Count: {len(news_data.get('articles', []))}")
         print(f"   Last News Update: {item.last_news_update}")
         print(f"   Added Date: {item.added_date}")
         
         # Show sample news data if available
-        if item.news_data and 'articles' in item.news_data:
-            articles = item.news_data['articles'][:2]  # First 2 articles
+        if news_data and 'articles' in news_data:
+            articles = news_data['articles'][:2]  # First 2 articles
             for i, article in enumerate(articles, 1):
                 print(f"   Article {i}: {article.get('title', 'No title')[:50]}...")
     
@@ -40,5 +53,4 @@ try:
 
 except Exception as e:
     print(f"❌ Error: {e}")
-    import traceback
     traceback.print_exc()
\ No newline at end of file
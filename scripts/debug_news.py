@@ -2,6 +2,7 @@
 """Debug script to test news functionality step by step."""
 
 import sys
+import traceback
 from datetime import datetime
 
 sys.path.append('.')
@@ -17,10 +18,13 @@ try:
     # Check if we have watched items with mock data
     from models.database import get_db
     from models.portfolio import WatchedItem
+    from sqlalchemy.orm import load_only
     
     db = next(get_db())
     try:
-        watched_item = db.query(WatchedItem).filter(WatchedItem.symbol == 'AAPL').first()
+        watched_item = db.query(WatchedItem).options(
+            load_only(WatchedItem.symbol, WatchedItem.last_news_update, WatchedItem.news_data)
+        ).filter(WatchedItem.symbol == 'AAPL').first()
         if watched_item:
             print(f"✅ Found AAPL: news_data exists = {watched_item.news_data is not None}")
             print(f"   Last update: {watched_item.last_news_update}")
@@ -48,12 +52,15 @@ try:
             if articles:
                 print(f"   First article: {articles[0].title[:50]}...")
                 
+                # Format the update timestamp once per fetch cycle
+                last_iso = watched_item.last_news_update.isoformat() if watched_item.last_news_update else None
+                
                 # Test the response format
                 response_data = {
                     "symbol": watched_item.symbol,
                     "articles": [article.to_dict() for article in articles],
                     "cached": not was_fetched,
-                    "last_updated": watched_item.last_news_update.isoformat() if watched_item.last_news_update else None,
+                    "last_updated": last_iso,
                     "count": len(articles)
                 }
                 
@@ -84,5 +91,4 @@ try:
         
 except Exception as e:
     print(f"❌ Error: {e}")
-    import traceback
     traceback.print_exc()
\ No newline at end of file
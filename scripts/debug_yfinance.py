@@ -2,27 +2,49 @@
 """Debug script to test yfinance news extraction."""
 
 import sys
+import traceback
 sys.path.append('.')
 
 try:
-    import yfinance as yf
+    import asyncio
+    import httpx
     import json
-    from datetime import datetime
+    import time
+    
+    # Yahoo's search endpoint returns the same news items yfinance wraps
+    SEARCH_URL = "https://query1.finance.yahoo.com/v1/finance/search"
+    HEADERS = {"User-Agent": "Mozilla/5.0 (compatible; PortfolioManager debug)"}
     
     # Test symbols
     symbols = ['SOFI', 'AAPL', 'MSFT']
     
-    for symbol in symbols:
+    async def fetch_news(client, symbol):
+        """Fetch news for one symbol, returning (news_data, error)."""
+        try:
+            response = await client.get(SEARCH_URL, params={"q": symbol, "newsCount": 10})
+            response.raise_for_status()
+            return response.json().get('news', []), None
+        except Exception as e:
+            return None, e
+    
+    async def fetch_all():
+        async with httpx.AsyncClient(headers=HEADERS, timeout=10) as client:
+            return await asyncio.gather(*(fetch_news(client, symbol) for symbol in symbols))
+    
+    # Fetch all symbols concurrently (network-bound), then report in order
+    results = asyncio.run(fetch_all())
+    
+    for symbol, (news_data, error) in zip(symbols, results):
         print(f"\n{'='*60}")
         print(f"🔍 DEBUGGING {symbol}")
         print(f"{'='*60}")
         
         try:
-            ticker = yf.Ticker(symbol)
-            print(f"✅ Created ticker object for {symbol}")
+            if error is not None:
+                raise error
+            print(f"✅ Fetched search results for {symbol}")
             
             # Get news data
-            news_data = ticker.news
             print(f"📰 News data type: {type(news_data)}")
             print(f"📰 News data length: {len(news_data) if news_data else 0}")
             
@@ -55,7 +77,7 @@ try:
                         print(f"    Pub Time: {pub_time}")
                         
                         if pub_time and isinstance(pub_time, (int, float)):
-                            formatted_time = datetime.fromtimestamp(pub_time).isoformat() + 'Z'
+                            formatted_time = time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(pub_time))
                             print(f"    Formatted Time: {formatted_time}")
                     else:
                         print(f"    Not a dict: {type(item)}")
@@ -64,15 +86,13 @@ try:
                 
         except Exception as e:
             print(f"❌ Error with {symbol}: {e}")
-            import traceback
             traceback.print_exc()
     
     print(f"\n{'='*60}")
     print("🎯 Debug complete!")
     
 except ImportError:
-    print("❌ yfinance not available")
+    print("❌ httpx not available")
 except Exception as e:
     print(f"❌ Unexpected error: {e}")
-    import traceback
     traceback.print_exc()
\ No newline at end of file
@@ -2,11 +2,19 @@
 """Debug script to examine yfinance content structure."""
 
 import sys
+import traceback
 sys.path.append('.')
 
+# Alternative content keys yfinance has used for each field, checked in order
+URL_KEYS = ('canonicalUrl', 'url', 'link')
+TIME_KEYS = ('pubDate', 'providerPublishTime', 'publishedDate', 'timestamp')
+PUBLISHER_KEYS = ('provider', 'publisher', 'source')
+SUMMARY_KEYS = ('summary', 'description', 'excerpt')
+
 try:
-    import yfinance as yf
-    import json
+    from _yf_utils import yf_ticker
+    from utils.retry import call_with_backoff
+    import orjson
     from datetime import datetime
     
     # Test with SOFI
@@ -14,13 +22,13 @@ try:
     print(f"🔍 DETAILED CONTENT ANALYSIS FOR {symbol}")
     print("="*60)
     
-    ticker = yf.Ticker(symbol)
-    news_data = ticker.news
+    ticker = yf_ticker(symbol)
+    news_data = call_with_backoff(lambda: ticker.news, retry_on=(ValueError,))
     
     if news_data and len(news_data) > 0:
         first_item = news_data[0]
         print(f"📰 Full first item structure:")
-        print(json.dumps(first_item, indent=2, default=str))
+        print(orjson.dumps(first_item, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY).decode())
         
         if 'content' in first_item:
             content = first_item['content']
@@ -32,26 +40,22 @@ try:
             print(f"Title: {title}")
             
             # Check for URL variations
-            url_keys = ['canonicalUrl', 'url', 'link']
-            for key in url_keys:
+            for key in URL_KEYS:
                 if key in content:
                     print(f"{key}: {content[key]}")
             
             # Check for timestamp variations  
-            time_keys = ['pubDate', 'providerPublishTime', 'publishedDate', 'timestamp']
-            for key in time_keys:
+            for key in TIME_KEYS:
                 if key in content:
                     print(f"{key}: {content[key]} (type: {type(content[key])})")
             
             # Check for source/publisher
-            publisher_keys = ['provider', 'publisher', 'source']
-            for key in publisher_keys:
+            for key in PUBLISHER_KEYS:
                 if key in content:
                     print(f"{key}: {content[key]} (type: {type(content[key])})")
             
             # Check for summary
-            summary_keys = ['summary', 'description', 'excerpt']
-            for key in summary_keys:
+            for key in SUMMARY_KEYS:
                 if key in content:
                     print(f"{key}: {str(content[key])[:100]}...")
                     
@@ -60,5 +64,4 @@ try:
         
 except Exception as e:
     print(f"❌ Error: {e}")
-    import traceback
     traceback.print_exc()
\ No newline at end of file
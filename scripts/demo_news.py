@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""Demo the multi-source news controller against a few symbols."""
+
+import logging
+import sys
+sys.path.append('.')
+
+from controllers.news_controller import NewsController
+
+
+def main():
+    logging.basicConfig(level=logging.INFO)
+    print("🧪 TESTING MULTI-SOURCE NEWS CONTROLLER")
+    print("=" * 50)
+
+    controller = NewsController()
+
+    # Test with different symbols
+    test_symbols = ['AAPL', 'MSFT', 'BTC-USD', 'PSLV']
+
+    for symbol in test_symbols:
+        print(f"\n📰 Testing {symbol}...")
+        articles = controller.get_ticker_news(symbol, limit=3)
+
+        if articles:
+            print(f"✅ Got {len(articles)} articles:")
+            for i, article in enumerate(articles, 1):
+                print(f"   {i}. {article.title[:60]}... (Source: {article.source})")
+        else:
+            print(f"❌ No articles found for {symbol}")
+
+    print("\n🎯 Multi-source controller test complete!")
+
+
+if __name__ == "__main__":
+    main()
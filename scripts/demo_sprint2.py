@@ -10,6 +10,7 @@ This script demonstrates:
 """
 
 import sys
+import traceback
 import os
 
 # Add the project root to Python path
@@ -87,9 +88,11 @@ def test_database_operations():
             HoldingCreate(symbol="BND", shares=500, target_allocation=10.0)
         ]
         
-        for holding_data in holdings_to_add:
-            holding = controller.add_holding(portfolio.id, holding_data)
+        added_count, errors = controller.add_holdings_bulk(portfolio.id, holdings_to_add)
+        for holding in controller.get_portfolio_holdings(portfolio.id):
             print(f"✓ Added {holding.symbol}: {holding.shares} shares, {holding.target_allocation}%")
+        for error in errors:
+            print(f"✗ {error}")
         
         print("\n3. Portfolio summary...")
         summary = controller.calculate_portfolio_summary(portfolio.id)
@@ -196,7 +199,6 @@ def main():
         
     except Exception as e:
         print(f"\n❌ Demo failed with error: {e}")
-        import traceback
         traceback.print_exc()
 
 
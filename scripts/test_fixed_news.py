@@ -2,9 +2,12 @@
 """Test the fixed yfinance news controller."""
 
 import sys
+import traceback
 sys.path.append('.')
 
 try:
+    import asyncio
+    import random
     from controllers.news_controller import NewsController
     
     controller = NewsController()
@@ -12,13 +15,29 @@ try:
     # Test symbols including SOFI
     test_symbols = ['SOFI', 'AAPL', 'MSFT', 'GOOGL']
     
-    for symbol in test_symbols:
+    async def fetch(symbol):
+        """Fetch news for one symbol off the event loop, returning (symbol, articles, error)."""
+        # Random jitter so the requests don't hit Yahoo in one burst
+        await asyncio.sleep(random.uniform(0.1, 0.4))
+        try:
+            return symbol, await asyncio.to_thread(controller.get_ticker_news, symbol, 3), None
+        except Exception as e:
+            return symbol, None, e
+    
+    async def main():
+        return await asyncio.gather(*(fetch(symbol) for symbol in test_symbols))
+    
+    # Fetch all symbols concurrently (network-bound), then report in order
+    results = asyncio.run(main())
+    
+    for symbol, articles, error in results:
         print(f"\n{'='*60}")
         print(f"📰 TESTING {symbol}")
         print(f"{'='*60}")
         
         try:
-            articles = controller.get_ticker_news(symbol, limit=3)
+            if error is not None:
+                raise error
             
             if articles:
                 print(f"✅ Got {len(articles)} articles:")
@@ -37,7 +56,6 @@ try:
                 
         except Exception as e:
             print(f"❌ Error with {symbol}: {e}")
-            import traceback
             traceback.print_exc()
     
     print(f"\n{'='*60}")
@@ -45,5 +63,4 @@ try:
     
 except Exception as e:
     print(f"❌ Test failed: {e}")
-    import traceback
     traceback.print_exc()
\ No newline at end of file
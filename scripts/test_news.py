@@ -1,9 +1,13 @@
 #!/usr/bin/env python3
 """Test script for news integration using yfinance."""
 
+import asyncio
 import os
+import random
 import sys
+import traceback
 from datetime import datetime
+from pathlib import Path
 
 # Add current directory to Python path
 sys.path.append('.')
@@ -16,15 +20,24 @@ try:
     print("\n📁 Database Test:")
     from models.database import get_db, create_tables
     from models.portfolio import WatchedItem, Watchlist
+    from sqlalchemy.orm import defer
     
-    create_tables()
-    print("✅ Database tables created/verified")
+    # Schema DDL only needs to run once; pass --force-schema to re-run it
+    schema_sentinel = Path(".cache/schema_v1")
+    if "--force-schema" in sys.argv or not schema_sentinel.exists():
+        create_tables()
+        schema_sentinel.parent.mkdir(parents=True, exist_ok=True)
+        schema_sentinel.touch()
+        print("✅ Database tables created/verified")
+    else:
+        print("✅ Database tables already verified (use --force-schema to recheck)")
     
     # Test if we have any watchlists
     db = next(get_db())
     try:
         watchlists = db.query(Watchlist).all()
-        watched_items = db.query(WatchedItem).all()
+        # news_data is only needed for the few items shown below, so defer it
+        watched_items = db.query(WatchedItem).options(defer(WatchedItem.news_data)).all()
         print(f"✅ Found {len(watchlists)} watchlists, {len(watched_items)} watched items")
         
         if watched_items:
@@ -43,10 +56,24 @@ try:
     # Test with a few symbols
     test_symbols = ['AAPL', 'MSFT', 'GOOGL']
     
-    for symbol in test_symbols:
+    async def fetch(symbol):
+        """Fetch news for one symbol off the event loop, returning (symbol, articles, error)."""
+        # Random jitter so the requests don't hit Yahoo in one burst
+        await asyncio.sleep(random.uniform(0.1, 0.4))
+        try:
+            return symbol, await asyncio.to_thread(news_controller.get_ticker_news, symbol, 2), None
+        except Exception as e:
+            return symbol, None, e
+    
+    async def main():
+        return await asyncio.gather(*(fetch(symbol) for symbol in test_symbols))
+    
+    # Fetch all symbols concurrently (network-bound), then report in order
+    for symbol, articles, error in asyncio.run(main()):
         print(f"\n🔍 Testing {symbol}:")
         try:
-            articles = news_controller.get_ticker_news(symbol, limit=2)
+            if error is not None:
+                raise error
             if articles:
                 print(f"  ✅ Found {len(articles)} articles:")
                 for i, article in enumerate(articles, 1):
@@ -61,5 +88,4 @@ try:
     
 except Exception as e:
     print(f"❌ Test failed: {e}")
-    import traceback
     traceback.print_exc()
\ No newline at end of file
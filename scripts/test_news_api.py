@@ -2,8 +2,9 @@
 """Test script for news API integration without server."""
 
 import sys
+import traceback
 import json
-from datetime import datetime
+from datetime import datetime, timezone
 
 # Add current directory to Python path  
 sys.path.append('.')
@@ -19,11 +20,15 @@ try:
     # Test database setup
     from models.database import get_db
     from models.portfolio import WatchedItem, Watchlist
+    from sqlalchemy.orm import load_only
     
     db = next(get_db())
     try:
         # Find a watched item to test with
-        watched_item = db.query(WatchedItem).first()
+        watched_item = db.query(WatchedItem).options(
+            load_only(WatchedItem.symbol, WatchedItem.watchlist_id,
+                      WatchedItem.last_news_update, WatchedItem.news_data)
+        ).first()
         if not watched_item:
             print("❌ No watched items found. Please add a stock to a watchlist first.")
             exit(1)
@@ -82,7 +87,7 @@ try:
         
         # Update the database with mock data for testing
         watched_item.news_data = formatted_data
-        watched_item.last_news_update = datetime.utcnow()
+        watched_item.last_news_update = datetime.now(timezone.utc)
         db.commit()
         print(f"   ✅ Updated database with mock news data")
         
@@ -106,5 +111,4 @@ try:
 
 except Exception as e:
     print(f"❌ Test failed: {e}")
-    import traceback
     traceback.print_exc()
\ No newline at end of file
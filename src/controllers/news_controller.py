@@ -1,20 +1,61 @@
 """Multi-source news controller for fetching stock news with intelligent fallback."""
 
+import heapq
+import importlib.util
 import os
+import sys
+import threading
 import time
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple, Union
 from datetime import datetime, timedelta, timezone
 import logging
-from dataclasses import dataclass
+from collections import defaultdict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from functools import lru_cache
+from operator import attrgetter
+from types import MappingProxyType
+
+import orjson
+
+from utils.cache import TTLCache
+from utils.retry import RateLimited, TokenBucket, call_with_backoff
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Fetched news shared by every controller instance. The index maps a symbol to
+# the (limit, article keys) of its last fetch so smaller limits can be served
+# from a larger fetch; the articles themselves live once in the article cache.
+# Entries live as long as the database news cache (4 hours).
+_news_cache = TTLCache(maxsize=4096, ttl=4 * 60 * 60)
+_article_cache = TTLCache(maxsize=16384, ttl=4 * 60 * 60)
+# Symbols every source came back empty for; kept briefly so they aren't hammered
+_empty_news_cache = TTLCache(maxsize=4096, ttl=300)
+
+# C ISO 8601 parser when installed; datetime.fromisoformat otherwise
+try:
+    from ciso8601 import parse_datetime as _ciso_parse
+except ImportError:
+    _ciso_parse = None
+
+# Stored articles older than this are dropped on read (default one week)
+NEWS_TTL_SECONDS = int(os.getenv("NEWS_TTL_SECONDS", str(7 * 24 * 60 * 60)))
+
+# Merge articles from every live source instead of stopping at the first hit
+NEWS_AGGREGATE_SOURCES = os.getenv("NEWS_AGGREGATE_SOURCES", "").lower() in ("1", "true", "yes")
+
+
+# Slotted dataclasses need Python 3.10+; older interpreters fall back to __dict__
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class NewsArticle:
-    """Data class for news article information."""
+    """Data class for news article information.
+    
+    Instances are immutable and slotted, so the many articles held by the
+    in-process caches carry no per-instance ``__dict__``.
+    """
     title: str
     url: str
     published_utc: str
@@ -32,6 +73,104 @@ class NewsArticle:
         }
 
 
+@dataclass(**_SLOTS)
+class Source:
+    """A news source and the client and rate-limit state it needs."""
+    name: str
+    active: bool = True
+    api_key: Optional[str] = field(default=None, repr=False)
+    client: Any = None
+    yf: Any = None
+    # Transient failures worth retrying (JSON decode errors are ValueErrors)
+    retry_on: Tuple[type, ...] = (ValueError,)
+    bucket: Optional[TokenBucket] = None
+    min_interval: float = 0
+    last_request_time: float = 0
+    lock: Any = field(default_factory=threading.Lock, repr=False)
+
+
+# Serialized NewsArticle fields, read in one C-level call per article
+_ARTICLE_FIELDS = ('title', 'url', 'published_utc', 'source', 'summary')
+_article_values = attrgetter(*_ARTICLE_FIELDS)
+
+
+# Polygon's TickerNews model always defines these (missing values are None)
+_polygon_fields = attrgetter('title', 'article_url', 'published_utc', 'description', 'publisher')
+
+
+# Shared read-only default for missing nested objects in Yahoo payloads
+_EMPTY = MappingProxyType({})
+
+_OLDEST = datetime.min.replace(tzinfo=timezone.utc)
+
+
+def _parse_iso(value: Optional[str]) -> Optional[datetime]:
+    """Parse an ISO 8601 timestamp (``Z`` suffix allowed) as aware UTC, or None."""
+    if not value:
+        return None
+    try:
+        if _ciso_parse is not None:
+            parsed = _ciso_parse(value)
+        else:
+            # fromisoformat only accepts a trailing Z from Python 3.11
+            parsed = datetime.fromisoformat(value[:-1] + '+00:00' if value.endswith('Z') else value)
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def _published_key(article: NewsArticle) -> datetime:
+    """Sort key placing undated or unparseable articles last when sorted newest-first."""
+    return _parse_iso(article.published_utc) or _OLDEST
+
+
+def _cap(text: Optional[str], length: int = 200) -> Optional[str]:
+    """Truncate a summary to ``length`` characters, reusing it when already short enough."""
+    if not text:
+        return None
+    return text if len(text) <= length else text[:length]
+
+
+def _article_key(article: NewsArticle) -> str:
+    """Key an article by its URL, falling back to the title when a source omits it."""
+    return article.url or article.title
+
+
+def _merge_articles(article_lists: List[List[NewsArticle]], limit: int) -> List[NewsArticle]:
+    """Merge per-source article lists, dropping repeated URLs, newest first."""
+    seen = set()
+    merged = []
+    for articles in article_lists:
+        for article in articles:
+            key = _article_key(article)
+            if key not in seen:
+                seen.add(key)
+                merged.append(article)
+    merged.sort(key=_published_key, reverse=True)
+    return merged[:limit]
+
+
+# Mock articles as (title, url, published_utc, source, summary); ``{sym}`` is the ticker
+_MOCK_TEMPLATES = (
+    ('{sym} Earnings Report Shows Strong Performance', 'https://example.com/news/1',
+     '2025-01-06T14:30:00Z', 'Financial Times (Mock)',
+     'Latest earnings report for {sym} shows strong performance across key metrics.'),
+    ('Technical Analysis: {sym} Shows Bullish Patterns', 'https://example.com/news/2',
+     '2025-01-06T13:15:00Z', 'MarketWatch (Mock)',
+     'Technical indicators suggest positive momentum for this stock.'),
+)
+_NO_MOCK_NEWS_SYMBOLS = frozenset({'BTC-USD', 'PSLV', 'GOLD', 'SLV', 'ETH-USD'})
+
+
+@lru_cache(maxsize=128)
+def _build_mock_articles(symbol: str, limit: int) -> Tuple[NewsArticle, ...]:
+    """Build the mock articles for a symbol; safe to share since articles are frozen."""
+    return tuple(
+        NewsArticle(title.format(sym=symbol), url, published, source, summary.format(sym=symbol))
+        for title, url, published, source, summary in _MOCK_TEMPLATES[:limit]
+    )
+
+
 class NewsController:
     """Multi-source news controller with intelligent fallback between APIs."""
     
@@ -43,6 +182,8 @@ class NewsController:
         # Cache settings
         self.cache_duration = timedelta(hours=4)
         self.max_articles_per_symbol = 5
+        self.max_workers = 8
+        self.aggregate_sources = NEWS_AGGREGATE_SOURCES
     
     def _init_sources(self):
         """Initialize all available news sources."""
@@ -57,127 +198,203 @@ class NewsController:
         # 3. Mock data (last resort)
         self._init_mock_source()
         
-        logger.info(f"Initialized {len(self.sources)} news sources")
+        # Source name -> fetcher, resolved once instead of on every fetch
+        self._dispatch = {
+            'Polygon.io': self._get_polygon_news,
+            'Yahoo Finance': self._get_yahoo_news,
+            'Mock Data': lambda source, symbol, limit: self._get_mock_news(symbol, limit),
+        }
+        
+        logger.info("Initialized %d news sources", len(self.sources))
     
     def _init_polygon_source(self):
-        """Initialize Polygon.io source."""
+        """Initialize Polygon.io source.
+        
+        The client library is only imported on the first Polygon request.
+        """
         api_key = os.environ.get('POLYGON_API_KEY')
         if api_key:
-            try:
-                from polygon import RESTClient
-                client = RESTClient(api_key)
-                
+            if importlib.util.find_spec('polygon') is not None:
                 # Polygon source with rate limiting
-                source = {
-                    'name': 'Polygon.io',
-                    'client': client,
-                    'last_request_time': 0,
-                    'min_interval': 15,
-                    'request_times': [],
-                    'active': True
-                }
+                source = Source(
+                    name='Polygon.io',
+                    api_key=api_key,
+                    bucket=TokenBucket(capacity=5, refill_frequency=12)
+                )
                 self.sources.append(source)
                 logger.info("✅ Polygon.io source initialized")
-            except ImportError:
+            else:
                 logger.warning("❌ Polygon.io client not available (import error)")
         else:
             logger.warning("❌ Polygon.io source not available (no API key)")
     
     def _init_yahoo_source(self):
-        """Initialize Yahoo Finance source."""
-        try:
-            import yfinance as yf
-            source = {
-                'name': 'Yahoo Finance',
-                'yf': yf,
-                'last_request_time': 0,
-                'min_interval': 2,
-                'active': True
-            }
+        """Initialize Yahoo Finance source; yfinance is imported on first use."""
+        if importlib.util.find_spec('yfinance') is not None:
+            source = Source(name='Yahoo Finance', min_interval=2)
             self.sources.append(source)
             logger.info("✅ Yahoo Finance source initialized")
-        except ImportError:
+        else:
             logger.warning("❌ Yahoo Finance source not available (yfinance not installed)")
     
+    @staticmethod
+    def _polygon_client(source: Source):
+        """Return the source's Polygon client, creating it on first use."""
+        if source.client is None:
+            with source.lock:
+                if source.client is None:
+                    from polygon import RESTClient
+                    # One client (and its urllib3 connection pool) is kept for the
+                    # controller's lifetime so requests reuse keep-alive connections
+                    source.client = RESTClient(source.api_key, num_pools=32, retries=3,
+                                               custom_json=orjson)
+        return source.client
+    
+    @staticmethod
+    def _yahoo_module(source: Source):
+        """Return the yfinance module for the source, importing it on first use."""
+        if source.yf is None:
+            with source.lock:
+                if source.yf is None:
+                    import yfinance as yf
+                    try:
+                        from yfinance.exceptions import YFRateLimitError
+                        source.retry_on = (ValueError, YFRateLimitError)
+                    except ImportError:
+                        pass
+                    source.yf = yf
+        return source.yf
+    
     def _init_mock_source(self):
         """Initialize mock data source."""
-        source = {
-            'name': 'Mock Data',
-            'active': True
-        }
+        source = Source(name='Mock Data')
         self.sources.append(source)
         logger.info("✅ Mock data source initialized")
     
-    def get_ticker_news(self, symbol: str, limit: int = 5) -> List[NewsArticle]:
+    def get_ticker_news(self, symbol: str, limit: int = 5, use_cache: bool = True,
+                        block: bool = True) -> List[NewsArticle]:
         """
         Fetch news articles from multiple sources with intelligent fallback.
         
         Args:
             symbol: Stock ticker symbol (e.g., 'AAPL')
             limit: Maximum number of articles to return
+            use_cache: Serve recently fetched articles from the in-process cache
+            block: Wait out source rate limits. When False, ``RateLimited`` is
+                raised instead so the caller can retry later without holding a thread
             
         Returns:
             List of NewsArticle objects from the first successful source
         """
-        logger.info(f"Getting news for {symbol} from {len(self.sources)} potential sources")
+        if use_cache:
+            cached = self._get_cached_ticker_news(symbol, limit)
+            if cached is not None:
+                logger.info("Using in-process cached news for %s", symbol)
+                return cached
+            if _empty_news_cache.get(symbol):
+                logger.info("No news for %s on a recent fetch - skipping sources", symbol)
+                return []
+        
+        articles = self._fetch_ticker_news(symbol, limit, block)
+        if articles:
+            _empty_news_cache.remove(symbol)
+        else:
+            _empty_news_cache.set(symbol, True)
+        self._cache_ticker_news(symbol, limit, articles)
+        return articles
+    
+    def _cache_ticker_news(self, symbol: str, limit: int, articles: List[NewsArticle]) -> None:
+        """Store fetched articles in the in-process index and article caches."""
+        # Don't cache failures or mock data so real news is retried
+        if articles and not any("(Mock)" in article.source for article in articles):
+            keys = tuple(_article_key(article) for article in articles)
+            for key, article in zip(keys, articles):
+                _article_cache.set(key, article)
+            _news_cache.set(symbol, (limit, keys))
+    
+    def _get_cached_ticker_news(self, symbol: str, limit: int) -> Optional[List[NewsArticle]]:
+        """Assemble cached articles for ``symbol``, or None if a fetch is needed."""
+        entry = _news_cache.get(symbol)
+        if entry is None:
+            return None
+        
+        cached_limit, keys = entry
+        # A fetch that came back short already holds every available article
+        if cached_limit < limit and len(keys) == cached_limit:
+            return None
         
+        articles = []
+        for key in keys[:limit]:
+            article = _article_cache.get(key)
+            if article is None:
+                return None
+            articles.append(article)
+        return articles
+    
+    def _fetch_ticker_news(self, symbol: str, limit: int, block: bool = True) -> List[NewsArticle]:
+        """Fetch news from the first source that returns articles.
+        
+        With ``aggregate_sources`` set, every real source is queried and their
+        articles are merged instead.
+        """
+        logger.info("Getting news for %s from %d potential sources", symbol, len(self.sources))
+        
+        collected = []
         for source in self.sources:
-            if not source.get('active', True):
+            if not source.active:
                 continue
+            # Mock data is a last resort, never mixed into real news
+            if collected and source.name == 'Mock Data':
+                break
                 
             try:
-                articles = self._get_news_from_source(source, symbol, limit)
+                while True:
+                    try:
+                        articles = self._get_news_from_source(source, symbol, limit)
+                        break
+                    except RateLimited as e:
+                        if not block:
+                            raise
+                        time.sleep(e.retry_after)
                 
                 if articles:
-                    logger.info(f"✅ Got {len(articles)} articles from {source['name']}")
-                    return articles
+                    logger.info("✅ Got %d articles from %s", len(articles), source.name)
+                    if not self.aggregate_sources:
+                        return articles
+                    collected.append(articles)
                 else:
-                    logger.info(f"⚠️  No articles from {source['name']}, trying next source")
+                    logger.info("⚠️  No articles from %s, trying next source", source.name)
                     
+            except RateLimited:
+                raise
             except Exception as e:
-                logger.error(f"❌ {source['name']} failed: {e}")
+                logger.error("❌ %s failed: %s", source.name, e)
                 continue
         
-        logger.warning(f"❌ All news sources failed for {symbol}")
+        if collected:
+            return _merge_articles(collected, limit)
+        logger.warning("❌ All news sources failed for %s", symbol)
         return []
     
-    def _get_news_from_source(self, source: dict, symbol: str, limit: int) -> List[NewsArticle]:
+    def _get_news_from_source(self, source: Source, symbol: str, limit: int) -> List[NewsArticle]:
         """Get news from a specific source."""
-        source_name = source['name']
-        
-        if source_name == 'Polygon.io':
-            return self._get_polygon_news(source, symbol, limit)
-        elif source_name == 'Yahoo Finance':
-            return self._get_yahoo_news(source, symbol, limit)
-        elif source_name == 'Mock Data':
-            return self._get_mock_news(symbol, limit)
-        else:
-            logger.warning(f"Unknown source: {source_name}")
+        fetch = self._dispatch.get(source.name)
+        if fetch is None:
+            logger.warning("Unknown source: %s", source.name)
             return []
+        return fetch(source, symbol, limit)
     
-    def _get_polygon_news(self, source: dict, symbol: str, limit: int) -> List[NewsArticle]:
+    def _get_polygon_news(self, source: Source, symbol: str, limit: int) -> List[NewsArticle]:
         """Get news from Polygon.io with rate limiting."""
-        client = source['client']
+        client = self._polygon_client(source)
         
-        # Rate limiting check
-        now = time.time()
-        source['request_times'] = [t for t in source.get('request_times', []) if now - t < 60]
-        
-        if len(source['request_times']) >= 4:
-            logger.warning(f"[Polygon.io] Rate limit approached - skipping")
+        # Free tier allows 5 requests per minute; skip to the next source when out
+        if not source.bucket.try_acquire():
+            logger.warning("[Polygon.io] Rate limit approached - skipping")
             return []
         
-        if now - source.get('last_request_time', 0) < source['min_interval']:
-            wait_time = source['min_interval'] - (now - source['last_request_time'])
-            logger.info(f"[Polygon.io] Waiting {wait_time:.1f}s for rate limiting")
-            time.sleep(wait_time)
-        
         try:
-            # Record request
-            source['last_request_time'] = now
-            source['request_times'] = source.get('request_times', []) + [now]
-            
-            logger.info(f"[Polygon.io] Fetching news for {symbol}")
+            logger.info("[Polygon.io] Fetching news for %s", symbol)
             
             news_response = client.list_ticker_news(
                 ticker=symbol,
@@ -188,119 +405,154 @@ class NewsController:
             articles = []
             for article_data in news_response:
                 try:
-                    source_name = 'Unknown'
-                    if hasattr(article_data, 'publisher') and article_data.publisher:
-                        if hasattr(article_data.publisher, 'name'):
-                            source_name = article_data.publisher.name
-                    
-                    article = NewsArticle(
-                        title=getattr(article_data, 'title', 'No title'),
-                        url=getattr(article_data, 'article_url', ''),
-                        published_utc=getattr(article_data, 'published_utc', ''),
-                        source=source_name,
-                        summary=getattr(article_data, 'description', '')[:200] if hasattr(article_data, 'description') else None
-                    )
-                    articles.append(article)
+                    articles.append(self._polygon_article(article_data))
                 except Exception as e:
-                    logger.error(f"[Polygon.io] Error processing article: {e}")
+                    logger.error("[Polygon.io] Error processing article: %s", e)
                     continue
             
             return articles
             
         except Exception as e:
             if "429" in str(e) or "rate" in str(e).lower():
-                logger.warning(f"[Polygon.io] Rate limited - increasing delays")
-                source['min_interval'] = min(30, source['min_interval'] * 1.5)
+                logger.warning("[Polygon.io] Rate limited - draining request credits")
+                source.bucket.penalize(source.bucket.capacity)
             
-            logger.error(f"[Polygon.io] Error: {e}")
+            logger.error("[Polygon.io] Error: %s", e)
             return []
     
-    def _get_yahoo_news(self, source: dict, symbol: str, limit: int) -> List[NewsArticle]:
-        """Get news from Yahoo Finance."""
-        yf = source['yf']
+    def _get_polygon_news_batch(self, source: Source, symbols: List[str],
+                                limit_per: int) -> Dict[str, List[NewsArticle]]:
+        """
+        Get news for several symbols from a single Polygon.io request.
         
-        # Basic rate limiting
-        now = time.time()
-        if now - source.get('last_request_time', 0) < source['min_interval']:
-            wait_time = source['min_interval'] - (now - source['last_request_time'])
-            time.sleep(wait_time)
+        Articles are grouped by the tickers they mention, keeping at most
+        ``limit_per`` per symbol. Symbols without articles are left out.
+        """
+        if not source.bucket.try_acquire():
+            logger.warning("[Polygon.io] Rate limit approached - skipping batch")
+            return {}
         
+        wanted = set(symbols)
+        grouped = defaultdict(list)
         try:
-            source['last_request_time'] = now
-            logger.info(f"[Yahoo Finance] Fetching news for {symbol}")
+            logger.info("[Polygon.io] Fetching news for %d symbols in one request", len(symbols))
+            news_response = self._polygon_client(source).list_ticker_news(
+                limit=min(1000, limit_per * len(symbols)),
+                order="desc",
+                params={"ticker.any_of": ",".join(symbols)}
+            )
             
-            ticker = yf.Ticker(symbol)
-            news_data = ticker.news
+            for article_data in news_response:
+                tickers = [t for t in (getattr(article_data, 'tickers', None) or [])
+                           if t in wanted and len(grouped[t]) < limit_per]
+                if tickers:
+                    try:
+                        article = self._polygon_article(article_data)
+                    except Exception as e:
+                        logger.error("[Polygon.io] Error processing article: %s", e)
+                        continue
+                    for ticker in tickers:
+                        grouped[ticker].append(article)
+                
+                # The client pages lazily; stop once every symbol is full
+                if all(len(grouped[s]) >= limit_per for s in wanted):
+                    break
+        
+        except Exception as e:
+            if "429" in str(e) or "rate" in str(e).lower():
+                logger.warning("[Polygon.io] Rate limited - draining request credits")
+                source.bucket.penalize(source.bucket.capacity)
+            logger.error("[Polygon.io] Batch error: %s", e)
+        
+        return {symbol: articles for symbol, articles in grouped.items() if articles}
+    
+    @staticmethod
+    def _polygon_article(article_data) -> NewsArticle:
+        """Convert a Polygon.io news result to a NewsArticle."""
+        title, url, published, description, publisher = _polygon_fields(article_data)
+        return NewsArticle(
+            title=title or 'No title',
+            url=url or '',
+            published_utc=published or '',
+            source=(publisher and getattr(publisher, 'name', None)) or 'Unknown',
+            summary=_cap(description)
+        )
+    
+    def _get_yahoo_news(self, source: Source, symbol: str, limit: int) -> List[NewsArticle]:
+        """Get news from Yahoo Finance."""
+
+        # Basic rate limiting: claim the slot if it is free, else report the wait
+        with source.lock:
+            now = time.time()
+            ready = source.last_request_time + source.min_interval
+            if ready > now:
+                raise RateLimited(ready - now)
+            source.last_request_time = now
+        
+        try:
+            logger.info("[Yahoo Finance] Fetching news for %s", symbol)
+            
+            ticker = self._yahoo_module(source).Ticker(symbol)
+            # Yahoo answers rate-limited requests with bodies that fail to decode
+            news_data = call_with_backoff(lambda: ticker.news, retry_on=source.retry_on)
             
             articles = []
-            for item in news_data[:limit]:
+            fetched_iso = None
+            for item in news_data:
                 try:
-                    content = item.get('content', {})
+                    content = item.get('content') or _EMPTY
                     
-                    pub_date = content.get('pubDate', '')
+                    pub_date = content.get('pubDate')
                     if not pub_date:
-                        pub_date = datetime.now(timezone.utc).isoformat() + 'Z'
-                    
-                    provider = content.get('provider', {})
-                    source_name = provider.get('displayName', 'Yahoo Finance')
-                    
-                    canonical_url = content.get('canonicalUrl', {})
-                    url = canonical_url.get('url', '') if canonical_url else ''
+                        # Read the clock once per fetch, not once per undated article
+                        if fetched_iso is None:
+                            fetched_iso = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+                        pub_date = fetched_iso
                     
                     article = NewsArticle(
                         title=content.get('title', 'No title'),
-                        url=url,
+                        url=(content.get('canonicalUrl') or _EMPTY).get('url', ''),
                         published_utc=pub_date,
-                        source=source_name,
-                        summary=content.get('summary', '')[:200] if content.get('summary') else None
+                        source=(content.get('provider') or _EMPTY).get('displayName', 'Yahoo Finance'),
+                        summary=_cap(content.get('summary'))
                     )
                     articles.append(article)
                 except Exception as e:
-                    logger.error(f"[Yahoo Finance] Error processing article: {e}")
+                    logger.error("[Yahoo Finance] Error processing article: %s", e)
                     continue
             
-            return articles
+            # Yahoo's feed isn't strictly chronological; keep the newest articles
+            articles.sort(key=_published_key, reverse=True)
+            return articles[:limit]
             
         except Exception as e:
-            logger.error(f"[Yahoo Finance] Error: {e}")
+            logger.error("[Yahoo Finance] Error: %s", e)
             return []
     
     def _get_mock_news(self, symbol: str, limit: int = 5) -> List[NewsArticle]:
         """Generate mock news data when APIs are unavailable."""
         
         # Return empty for crypto and uncommon symbols  
-        if symbol in ['BTC-USD', 'PSLV', 'GOLD', 'SLV', 'ETH-USD']:
-            logger.info(f"[Mock Data] No mock news for {symbol}")
+        if symbol in _NO_MOCK_NEWS_SYMBOLS:
+            logger.info("[Mock Data] No mock news for %s", symbol)
             return []
         
-        mock_articles = [
-            NewsArticle(
-                title=f'{symbol} Earnings Report Shows Strong Performance',
-                url='https://example.com/news/1',
-                published_utc='2025-01-06T14:30:00Z',
-                source='Financial Times (Mock)',
-                summary=f'Latest earnings report for {symbol} shows strong performance across key metrics.'
-            ),
-            NewsArticle(
-                title=f'Technical Analysis: {symbol} Shows Bullish Patterns',
-                url='https://example.com/news/2',
-                published_utc='2025-01-06T13:15:00Z',
-                source='MarketWatch (Mock)',
-                summary='Technical indicators suggest positive momentum for this stock.'
-            )
-        ]
-        
-        logger.info(f"[Mock Data] Generated {min(len(mock_articles), limit)} mock articles for {symbol}")
-        return mock_articles[:limit]
+        mock_articles = _build_mock_articles(symbol, limit)
+        logger.info("[Mock Data] Generated %d mock articles for %s", len(mock_articles), symbol)
+        return list(mock_articles)
     
     # Keep existing cache methods for compatibility
-    def is_news_cache_valid(self, last_update: Optional[datetime]) -> bool:
-        """Check if cached news is still valid (within cache duration)."""
+    def is_news_cache_valid(self, last_update: Optional[datetime],
+                            now: Optional[datetime] = None) -> bool:
+        """Check if cached news is still valid (within cache duration).
+        
+        ``now`` lets callers checking many items share one aware UTC clock read.
+        """
         if not last_update:
             return False
         
         # Ensure both datetimes are timezone-aware for comparison
-        current_time = datetime.now(timezone.utc)
+        current_time = now or datetime.now(timezone.utc)
         
         # If last_update is naive, assume it's UTC
         if last_update.tzinfo is None:
@@ -308,20 +560,49 @@ class NewsController:
         
         return current_time - last_update < self.cache_duration
     
-    def format_news_for_storage(self, articles: List[NewsArticle]) -> dict:
-        """Format news articles for JSON storage in database."""
+    def format_news_for_storage(self, articles: List[NewsArticle],
+                                now: Optional[datetime] = None) -> dict:
+        """Format news articles for JSON storage in database.
+        
+        Each article is stamped with its own ``fetched_at`` epoch so it can
+        expire independently of the rest of the payload. Pass ``now`` (aware
+        UTC) to stamp a whole batch with a single clock read.
+        """
+        now = now or datetime.now(timezone.utc)
+        fetched_at = now.timestamp()
         return {
-            "articles": [article.to_dict() for article in articles],
-            "last_updated": datetime.now(timezone.utc).isoformat()
+            "articles": [
+                dict(zip(_ARTICLE_FIELDS, _article_values(article)), fetched_at=fetched_at)
+                for article in articles
+            ],
+            "last_updated": now.isoformat()
         }
     
-    def parse_stored_news(self, news_data: Optional[dict]) -> List[NewsArticle]:
-        """Parse news data from database storage back to NewsArticle objects."""
+    def format_news_for_storage_bytes(self, articles: List[NewsArticle],
+                                      now: Optional[datetime] = None) -> bytes:
+        """Format news articles for storage as an already-encoded JSON blob."""
+        return orjson.dumps(self.format_news_for_storage(articles, now))
+    
+    def parse_stored_news(self, news_data: Union[dict, bytes, str, None],
+                          max_age: Optional[float] = None) -> List[NewsArticle]:
+        """Parse news data from database storage back to NewsArticle objects.
+        
+        Args:
+            news_data: Stored payload produced by ``format_news_for_storage``,
+                or its JSON encoding from ``format_news_for_storage_bytes``
+            max_age: Drop articles fetched more than this many seconds ago.
+                Articles stored without a ``fetched_at`` stamp are kept.
+        """
+        if isinstance(news_data, (bytes, str)):
+            news_data = orjson.loads(news_data)
         if not news_data or 'articles' not in news_data:
             return []
         
+        cutoff = time.time() - max_age if max_age is not None else None
         articles = []
         for article_dict in news_data['articles']:
+            if cutoff is not None and article_dict.get('fetched_at', cutoff) < cutoff:
+                continue
             try:
                 article = NewsArticle(
                     title=article_dict.get('title', 'No title'),
@@ -332,31 +613,38 @@ class NewsController:
                 )
                 articles.append(article)
             except Exception as e:
-                logger.error(f"Error parsing stored article: {e}")
+                logger.error("Error parsing stored article: %s", e)
                 continue
         
         return articles
     
     def get_cached_or_fresh_news(self, symbol: str, last_update: Optional[datetime], 
-                                cached_news: Optional[dict]) -> tuple[List[NewsArticle], bool]:
+                                cached_news: Union[dict, bytes, str, None],
+                                now: Optional[datetime] = None) -> tuple[List[NewsArticle], bool]:
         """
         Get news either from cache (if valid) or fetch fresh from API.
         
         Returns:
             Tuple of (articles, was_fetched_fresh)
         """
+        if isinstance(cached_news, (bytes, str)):
+            cached_news = orjson.loads(cached_news)
+        
         # Check if cache is valid AND not mock data
-        if self.is_news_cache_valid(last_update) and cached_news:
-            # Check if cached news is mock data - if so, don't use cache
-            articles = self.parse_stored_news(cached_news)
+        if self.is_news_cache_valid(last_update, now) and cached_news:
+            # Expired articles are evicted on read; the rest are still servable
+            articles = self.parse_stored_news(cached_news, max_age=NEWS_TTL_SECONDS)
+            stored_count = len(cached_news.get('articles') or [])
             if articles and any("(Mock)" in article.source for article in articles):
-                logger.info(f"Cached news for {symbol} is mock data - fetching fresh")
+                logger.info("Cached news for %s is mock data - fetching fresh", symbol)
+            elif len(articles) < min(stored_count, self.max_articles_per_symbol):
+                logger.info("Cached news for %s has expired articles - fetching fresh", symbol)
             else:
-                logger.info(f"Using cached news for {symbol}")
+                logger.info("Using cached news for %s", symbol)
                 return articles, False
         
         # Cache is stale, missing, or contains mock data - fetch fresh news
-        logger.info(f"Fetching fresh news for {symbol}")
+        logger.info("Fetching fresh news for %s", symbol)
         articles = self.get_ticker_news(symbol, self.max_articles_per_symbol)
         return articles, True
     
@@ -370,42 +658,50 @@ class NewsController:
         Returns:
             Dictionary mapping symbols to their news articles
         """
-        results = {}
+        results = {symbol: [] for symbol in symbols}
+        if not symbols:
+            return results
+        limit = self.max_articles_per_symbol
         
-        for symbol in symbols:
-            try:
-                articles = self.get_ticker_news(symbol, self.max_articles_per_symbol)
+        # One Polygon request covers every symbol; only the rest are fetched singly
+        polygon = next((source for source in self.sources
+                        if source.name == 'Polygon.io' and source.active), None)
+        if polygon is not None and len(results) > 1:
+            for symbol, articles in self._get_polygon_news_batch(polygon, list(results), limit).items():
                 results[symbol] = articles
+                self._cache_ticker_news(symbol, limit, articles)
+        remaining = [symbol for symbol, articles in results.items() if not articles]
+        
+        if not remaining:
+            return results
+        
+        # Fetches are network-bound, so run them in parallel. A rate-limited
+        # fetch hands its thread back and is resubmitted once the source is free
+        deferred = []  # heap of (ready_at, symbol)
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(remaining))) as executor:
+            pending = {
+                executor.submit(self.get_ticker_news, symbol, limit, block=False): symbol
+                for symbol in remaining
+            }
+            
+            while pending or deferred:
+                now = time.monotonic()
+                while deferred and deferred[0][0] <= now:
+                    symbol = heapq.heappop(deferred)[1]
+                    pending[executor.submit(self.get_ticker_news, symbol, limit, block=False)] = symbol
+                timeout = deferred[0][0] - now if deferred else None
+                if not pending:
+                    time.sleep(timeout)
+                    continue
                 
-                # Small delay between symbols to be respectful
-                time.sleep(1)
-                
-            except Exception as e:
-                logger.error(f"Error fetching news for {symbol}: {e}")
-                results[symbol] = []
+                done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+                for future in done:
+                    symbol = pending.pop(future)
+                    try:
+                        results[symbol] = future.result() or []
+                    except RateLimited as e:
+                        heapq.heappush(deferred, (time.monotonic() + e.retry_after, symbol))
+                    except Exception as e:
+                        logger.error("Error fetching news for %s: %s", symbol, e)
         
         return results
-
-
-# Test the multi-source controller
-if __name__ == "__main__":
-    print("🧪 TESTING MULTI-SOURCE NEWS CONTROLLER")
-    print("=" * 50)
-    
-    controller = NewsController()
-    
-    # Test with different symbols
-    test_symbols = ['AAPL', 'MSFT', 'BTC-USD', 'PSLV']
-    
-    for symbol in test_symbols:
-        print(f"\n📰 Testing {symbol}...")
-        articles = controller.get_ticker_news(symbol, limit=3)
-        
-        if articles:
-            print(f"✅ Got {len(articles)} articles:")
-            for i, article in enumerate(articles, 1):
-                print(f"   {i}. {article.title[:60]}... (Source: {article.source})")
-        else:
-            print(f"❌ No articles found for {symbol}")
-    
-    print("\n🎯 Multi-source controller test complete!")
\ No newline at end of file
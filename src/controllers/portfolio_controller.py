@@ -1,82 +1,82 @@
 """Portfolio business logic and CRUD operations."""
 
-from typing import List, Optional
-from sqlalchemy.orm import Session
-from models.portfolio import Portfolio, Holding
-from pydantic import BaseModel, field_validator
-from controllers.stock_data_controller import StockDataController
+from contextlib import contextmanager
+from functools import cached_property
+from typing import Annotated, List, Optional, Tuple
+from sqlalchemy import and_, case, delete, func, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, load_only, raiseload, selectinload
+from models.database import commit_keeping_loaded
+from models.portfolio import Portfolio, Holding, utc_now
+from pydantic import BaseModel, Field, StringConstraints, field_validator
+from utils.validators import normalize_stock_symbol
+from utils.cache import TTLCache
+
+
+# Portfolio summaries keyed by (portfolio_id, modified_date timestamp). Any change
+# to a portfolio or its holdings bumps modified_date, so stale entries are never
+# hit again and simply age out.
+_summary_cache = TTLCache(maxsize=1024, ttl=60)
+
+# How long prices fetched by one controller are reused for follow-up requests
+# on the same symbols, e.g. a single-holding refresh right after a full refresh.
+PRICE_REUSE_TTL_SECONDS = 30
+
+# Rows per INSERT when importing holdings, keeping statement size bounded
+IMPORT_BATCH_SIZE = 500
+
+
+def _holding_value_columns():
+    """SQL expressions for whether a holding is priced and its current value.
+    
+    Mirrors Holding.current_value as used in valuations: cash counts at face
+    value, and only holdings with a (non-zero) price contribute.
+    """
+    has_price = and_(Holding.last_price.isnot(None), Holding.last_price != 0)
+    value = case(
+        (has_price, case(
+            (Holding.symbol == '$CASH', Holding.shares),
+            else_=Holding.shares * Holding.last_price
+        )),
+        else_=0.0
+    )
+    return has_price, value
+
+
+# Field constraints checked inside pydantic-core, shared by the schemas below
+PortfolioName = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]
+Shares = Annotated[float, Field(ge=0)]
+TargetAllocation = Annotated[float, Field(gt=0, le=100)]
 
 
 class PortfolioCreate(BaseModel):
     """Schema for creating a new portfolio."""
-    name: str
-    
-    @field_validator('name')
-    @classmethod
-    def name_must_not_be_empty(cls, v):
-        if not v or not v.strip():
-            raise ValueError('Portfolio name cannot be empty')
-        return v.strip()
+    name: PortfolioName
 
 
 class PortfolioUpdate(BaseModel):
     """Schema for updating a portfolio."""
-    name: str
-    
-    @field_validator('name')
-    @classmethod
-    def name_must_not_be_empty(cls, v):
-        if not v or not v.strip():
-            raise ValueError('Portfolio name cannot be empty')
-        return v.strip()
+    name: PortfolioName
 
 
 class HoldingCreate(BaseModel):
     """Schema for creating a new holding."""
     symbol: str
-    shares: float
-    target_allocation: float
+    shares: Shares
+    target_allocation: TargetAllocation
     
-    @field_validator('symbol')
+    @field_validator('symbol', mode='before')
     @classmethod
     def symbol_must_be_valid(cls, v):
-        if not v or not v.strip():
-            raise ValueError('Symbol cannot be empty')
-        return v.strip().upper()
-    
-    @field_validator('shares')
-    @classmethod
-    def shares_must_be_positive(cls, v):
-        if v < 0:
-            raise ValueError('Shares must be non-negative')
-        return v
-    
-    @field_validator('target_allocation')
-    @classmethod
-    def allocation_must_be_valid(cls, v):
-        if v <= 0 or v > 100:
-            raise ValueError('Target allocation must be between 0.01 and 100')
-        return v
+        if not isinstance(v, str):
+            return v
+        return normalize_stock_symbol(v)
 
 
 class HoldingUpdate(BaseModel):
     """Schema for updating a holding."""
-    shares: float
-    target_allocation: float
-    
-    @field_validator('shares')
-    @classmethod
-    def shares_must_be_positive(cls, v):
-        if v < 0:
-            raise ValueError('Shares must be non-negative')
-        return v
-    
-    @field_validator('target_allocation')
-    @classmethod
-    def allocation_must_be_valid(cls, v):
-        if v <= 0 or v > 100:
-            raise ValueError('Target allocation must be between 0.01 and 100')
-        return v
+    shares: Shares
+    target_allocation: TargetAllocation
 
 
 class PortfolioController:
@@ -84,31 +84,88 @@ class PortfolioController:
     
     def __init__(self, db: Session):
         self.db = db
-        self.stock_data_controller = StockDataController()
+        self._unit_depth = 0
+        self._price_cache = TTLCache(maxsize=256, ttl=PRICE_REUSE_TTL_SECONDS)
+    
+    @cached_property
+    def stock_data_controller(self):
+        """Price service, created on first use so CRUD-only requests skip it."""
+        from controllers.stock_data_controller import StockDataController
+        return StockDataController()
+    
+    def _commit(self, expire: bool = True) -> None:
+        """
+        Commit, or only flush while inside ``unit_of_work``.
+        
+        Pass ``expire=False`` when the written objects already hold their new
+        state, so returning them doesn't cost a reload.
+        """
+        if self._unit_depth:
+            self.db.flush()
+        elif expire:
+            self.db.commit()
+        else:
+            commit_keeping_loaded(self.db)
+    
+    @contextmanager
+    def unit_of_work(self):
+        """
+        Group several mutations into one transaction with a single commit.
+        
+        Mutators called inside the block flush instead of committing. The
+        block commits once on success and rolls back if it raises; a mutator
+        that fails and rolls back discards the whole unit.
+        """
+        self._unit_depth += 1
+        try:
+            yield self
+        except Exception:
+            self.db.rollback()
+            raise
+        finally:
+            self._unit_depth -= 1
+        if not self._unit_depth:
+            self.db.commit()
     
-    def get_portfolios(self) -> List[Portfolio]:
-        """Get all portfolios."""
-        return self.db.query(Portfolio).order_by(Portfolio.name).all()
+    def get_portfolios(self, load_holdings: bool = True) -> List[Portfolio]:
+        """
+        Get all portfolios.
+        
+        Args:
+            load_holdings: Load every portfolio's holdings with one extra IN
+                query. When False, touching ``holdings`` raises instead of
+                lazily issuing a query per portfolio.
+        """
+        loader = selectinload if load_holdings else raiseload
+        return self.db.query(Portfolio).options(
+            loader(Portfolio.holdings)
+        ).order_by(Portfolio.name).all()
     
     def get_portfolio(self, portfolio_id: int) -> Optional[Portfolio]:
         """Get a specific portfolio by ID."""
         return self.db.query(Portfolio).filter(Portfolio.id == portfolio_id).first()
     
+    def get_portfolio_with_holdings(self, portfolio_id: int) -> Optional[Portfolio]:
+        """Get a portfolio with ``holdings`` loaded by one extra IN query."""
+        return self.db.query(Portfolio).options(selectinload(Portfolio.holdings)).filter(
+            Portfolio.id == portfolio_id
+        ).first()
+    
     def get_portfolio_by_name(self, name: str) -> Optional[Portfolio]:
         """Get a portfolio by name."""
         return self.db.query(Portfolio).filter(Portfolio.name == name).first()
     
     def create_portfolio(self, portfolio: PortfolioCreate) -> Portfolio:
         """Create a new portfolio."""
-        # Check if portfolio with same name already exists
-        existing = self.get_portfolio_by_name(portfolio.name)
-        if existing:
-            raise ValueError(f"Portfolio with name '{portfolio.name}' already exists")
-        
         db_portfolio = Portfolio(name=portfolio.name)
         self.db.add(db_portfolio)
-        self.db.commit()
-        self.db.refresh(db_portfolio)
+        # The unique name index rejects duplicates without a separate lookup;
+        # create_missing_indexes stops startup if an old database can't get it
+        try:
+            self._commit(expire=False)
+        except IntegrityError:
+            self.db.rollback()
+            raise ValueError(f"Portfolio with name '{portfolio.name}' already exists")
         return db_portfolio
     
     def update_portfolio(self, portfolio_id: int, portfolio: PortfolioUpdate) -> Optional[Portfolio]:
@@ -117,17 +174,12 @@ class PortfolioController:
         if not db_portfolio:
             return None
         
-        # Check if new name conflicts with existing portfolio (excluding current one)
-        existing = self.db.query(Portfolio).filter(
-            Portfolio.name == portfolio.name,
-            Portfolio.id != portfolio_id
-        ).first()
-        if existing:
-            raise ValueError(f"Portfolio with name '{portfolio.name}' already exists")
-        
         db_portfolio.name = portfolio.name
-        self.db.commit()
-        self.db.refresh(db_portfolio)
+        try:
+            self._commit(expire=False)
+        except IntegrityError:
+            self.db.rollback()
+            raise ValueError(f"Portfolio with name '{portfolio.name}' already exists")
         return db_portfolio
     
     def delete_portfolio(self, portfolio_id: int) -> bool:
@@ -137,40 +189,93 @@ class PortfolioController:
             return False
         
         self.db.delete(db_portfolio)
-        self.db.commit()
+        self._commit()
         return True
     
     def add_holding(self, portfolio_id: int, holding: HoldingCreate) -> Optional[Holding]:
         """Add a holding to a portfolio."""
-        portfolio = self.get_portfolio(portfolio_id)
-        if not portfolio:
+        db_portfolio = self.db.get(Portfolio, portfolio_id)
+        if db_portfolio is None:
             return None
         
-        # Check if holding with same symbol already exists in this portfolio
-        existing = self.db.query(Holding).filter(
-            Holding.portfolio_id == portfolio_id,
-            Holding.symbol == holding.symbol
-        ).first()
-        if existing:
-            raise ValueError(f"Holding for {holding.symbol} already exists in this portfolio")
-        
+        # Linking the object keeps a loaded portfolio.holdings in step without a reload
         db_holding = Holding(
-            portfolio_id=portfolio_id,
+            portfolio=db_portfolio,
             symbol=holding.symbol,
             shares=holding.shares,
             target_allocation=holding.target_allocation
         )
         self.db.add(db_holding)
-        self.db.commit()
-        self.db.refresh(db_holding)
+        # The unique (portfolio_id, symbol) index, guaranteed at startup, rejects duplicates
+        try:
+            self._commit(expire=False)
+        except IntegrityError:
+            self.db.rollback()
+            raise ValueError(f"Holding for {holding.symbol} already exists in this portfolio")
         return db_holding
     
+    def add_holdings_bulk(self, portfolio_id: int, holdings: List[HoldingCreate]) -> Tuple[int, List[str]]:
+        """
+        Add multiple holdings to a portfolio with a single batched insert.
+        
+        Symbols already in the portfolio (or repeated in ``holdings``) are
+        skipped and reported as errors.
+        
+        Returns:
+            Tuple of (added_count, errors)
+            
+        Raises:
+            ValueError: If the portfolio does not exist
+        """
+        if self.db.get(Portfolio, portfolio_id) is None:
+            raise ValueError("Portfolio not found")
+        
+        existing = {
+            symbol for (symbol,) in self.db.query(Holding.symbol).filter(
+                Holding.portfolio_id == portfolio_id,
+                Holding.symbol.in_({holding.symbol for holding in holdings})
+            ).all()
+        }
+        
+        errors = []
+        rows = []
+        for holding in holdings:
+            if holding.symbol in existing:
+                errors.append(f"Holding for {holding.symbol} already exists in this portfolio")
+                continue
+            existing.add(holding.symbol)
+            rows.append({
+                "portfolio_id": portfolio_id,
+                "symbol": holding.symbol,
+                "shares": holding.shares,
+                "target_allocation": holding.target_allocation
+            })
+        
+        if rows:
+            self.db.bulk_insert_mappings(Holding, rows)
+            # Bulk inserts bypass the flush hooks, so bump the portfolio version here
+            self.db.query(Portfolio).filter(Portfolio.id == portfolio_id).update(
+                {Portfolio.modified_date: utc_now()}, synchronize_session=False
+            )
+            self._commit()
+        
+        return len(rows), errors
+    
     def get_portfolio_holdings(self, portfolio_id: int) -> List[Holding]:
         """Get all holdings for a portfolio."""
         return self.db.query(Holding).filter(
             Holding.portfolio_id == portfolio_id
         ).order_by(Holding.symbol).all()
     
+    def _get_lean_holdings(self, portfolio_id: int) -> List[Holding]:
+        """Get holdings with only the columns valuation needs loaded."""
+        return self.db.query(Holding).options(load_only(
+            Holding.id, Holding.symbol, Holding.shares,
+            Holding.last_price, Holding.target_allocation
+        )).filter(
+            Holding.portfolio_id == portfolio_id
+        ).order_by(Holding.symbol).all()
+    
     def update_holding(self, portfolio_id: int, symbol: str, holding: HoldingUpdate) -> Optional[Holding]:
         """Update an existing holding."""
         db_holding = self.db.query(Holding).filter(
@@ -183,22 +288,22 @@ class PortfolioController:
         
         db_holding.shares = holding.shares
         db_holding.target_allocation = holding.target_allocation
-        self.db.commit()
-        self.db.refresh(db_holding)
+        self._commit(expire=False)
         return db_holding
     
     def delete_holding(self, portfolio_id: int, symbol: str) -> bool:
         """Delete a holding from a portfolio."""
-        db_holding = self.db.query(Holding).filter(
-            Holding.portfolio_id == portfolio_id,
-            Holding.symbol == symbol
-        ).first()
-        
-        if not db_holding:
+        deleted = self.db.execute(
+            delete(Holding).where(Holding.portfolio_id == portfolio_id, Holding.symbol == symbol)
+        ).rowcount
+        if not deleted:
             return False
         
-        self.db.delete(db_holding)
-        self.db.commit()
+        # Bulk statements bypass the flush hooks, so bump the portfolio version here
+        self.db.execute(
+            update(Portfolio).where(Portfolio.id == portfolio_id).values(modified_date=utc_now())
+        )
+        self._commit()
         return True
     
     def import_holdings_from_csv(self, portfolio_id: int, holdings_data: List) -> dict:
@@ -212,32 +317,32 @@ class PortfolioController:
         Returns:
             Dictionary with import results
         """
-        portfolio = self.get_portfolio(portfolio_id)
-        if not portfolio:
+        if self.db.get(Portfolio, portfolio_id) is None:
             raise ValueError("Portfolio not found")
         
-        # Clear existing holdings
-        self.db.query(Holding).filter(Holding.portfolio_id == portfolio_id).delete()
-        
-        # Add new holdings
-        imported_count = 0
+        rows = [
+            {
+                "portfolio_id": portfolio_id,
+                "symbol": holding_data.symbol,
+                "shares": holding_data.shares,
+                "target_allocation": holding_data.allocation
+            }
+            for holding_data in holdings_data
+        ]
+        imported_count = len(rows)
         errors = []
         
-        for holding_data in holdings_data:
-            try:
-                db_holding = Holding(
-                    portfolio_id=portfolio_id,
-                    symbol=holding_data.symbol,
-                    shares=holding_data.shares,
-                    target_allocation=holding_data.allocation
-                )
-                self.db.add(db_holding)
-                imported_count += 1
-            except Exception as e:
-                errors.append(f"Failed to import {holding_data.symbol}: {str(e)}")
-        
         try:
-            self.db.commit()
+            # Replace the existing holdings with one DELETE and batched INSERTs, all
+            # in one transaction; the CSV parser has already rejected bad rows
+            self.db.execute(delete(Holding).where(Holding.portfolio_id == portfolio_id))
+            for start in range(0, len(rows), IMPORT_BATCH_SIZE):
+                self.db.bulk_insert_mappings(Holding, rows[start:start + IMPORT_BATCH_SIZE])
+            # Bulk statements bypass the flush hooks, so bump the portfolio version here
+            self.db.execute(
+                update(Portfolio).where(Portfolio.id == portfolio_id).values(modified_date=utc_now())
+            )
+            self._commit()
         except Exception as e:
             self.db.rollback()
             raise ValueError(f"Failed to save holdings: {str(e)}")
@@ -248,15 +353,21 @@ class PortfolioController:
             "success": len(errors) == 0
         }
     
-    def refresh_portfolio_prices(self, portfolio_id: int) -> dict:
+    def refresh_portfolio_prices(self, portfolio_id: int) -> Optional[dict]:
         """
         Refresh stock prices for all holdings in a portfolio.
         
         Returns:
-            Dictionary with update results and statistics
+            Dictionary with update results and statistics, or None if the
+            portfolio does not exist
         """
-        holdings = self.get_portfolio_holdings(portfolio_id)
+        # Only ids and symbols are needed; skip hydrating full Holding objects
+        holdings = self.db.query(Holding.id, Holding.symbol).filter(
+            Holding.portfolio_id == portfolio_id
+        ).order_by(Holding.symbol).all()
         if not holdings:
+            if self.db.get(Portfolio, portfolio_id) is None:
+                return None
             return {
                 "success": True,
                 "updated_count": 0,
@@ -272,21 +383,28 @@ class PortfolioController:
         # Fetch prices
         price_results = self.stock_data_controller.refresh_portfolio_prices(symbols)
         
-        # Update database with new prices
-        updated_count = 0
+        # Update database with new prices in one batch
+        price_updates = []
         failed_symbols = []
         
         for holding in holdings:
             price_data = price_results.get(holding.symbol)
             if price_data:
-                holding.last_price = price_data.price
-                updated_count += 1
+                self._price_cache.set(holding.symbol, price_data)
+                price_updates.append({"id": holding.id, "last_price": price_data.price})
             else:
                 failed_symbols.append(holding.symbol)
+        updated_count = len(price_updates)
         
         # Commit changes
         try:
-            self.db.commit()
+            if price_updates:
+                self.db.bulk_update_mappings(Holding, price_updates)
+                # Bulk updates bypass the flush hooks, so bump the portfolio version here
+                self.db.query(Portfolio).filter(Portfolio.id == portfolio_id).update(
+                    {Portfolio.modified_date: utc_now()}, synchronize_session=False
+                )
+            self._commit()
         except Exception as e:
             self.db.rollback()
             return {
@@ -313,12 +431,17 @@ class PortfolioController:
         if not holding:
             return {"success": False, "error": "Holding not found"}
         
-        price_data = self.stock_data_controller.get_stock_price(symbol, use_cache=False)
+        # Reuse a price this controller fetched moments ago; otherwise go upstream
+        price_data = self._price_cache.get(symbol)
+        if price_data is None:
+            price_data = self.stock_data_controller.get_stock_price(symbol, use_cache=False)
+            if price_data:
+                self._price_cache.set(symbol, price_data)
         
         if price_data:
             holding.last_price = price_data.price
             try:
-                self.db.commit()
+                self._commit()
                 return {
                     "success": True,
                     "symbol": symbol,
@@ -333,7 +456,7 @@ class PortfolioController:
     
     def get_portfolio_valuation(self, portfolio_id: int) -> dict:
         """Get detailed portfolio valuation and performance metrics."""
-        holdings = self.get_portfolio_holdings(portfolio_id)
+        holdings = self._get_lean_holdings(portfolio_id)
         
         if not holdings:
             return {
@@ -346,52 +469,38 @@ class PortfolioController:
                 "last_updated": None
             }
         
-        total_value = 0.0
-        holdings_breakdown = []
+        # Values first, so allocations and drift can be filled in one pass below
+        values = [holding.current_value if holding.last_price else 0.0 for holding in holdings]
+        total_value = sum(values)
+        inv_total = 100.0 / total_value if total_value > 0 else 0.0
         holdings_with_prices = 0
+        total_target_allocation = 0.0
+        holdings_breakdown = []
+        allocation_drift = []
         
-        for holding in holdings:
+        for holding, current_value in zip(holdings, values):
             if holding.last_price:
-                current_value = holding.current_value
-                total_value += current_value
                 holdings_with_prices += 1
-                
-                holdings_breakdown.append({
-                    "symbol": holding.symbol,
-                    "shares": holding.shares,
-                    "current_price": holding.last_price,
-                    "current_value": current_value,
-                    "target_allocation": holding.target_allocation,
-                    "current_allocation": 0.0  # Will be calculated after total_value
-                })
-            else:
-                holdings_breakdown.append({
-                    "symbol": holding.symbol,
-                    "shares": holding.shares,
-                    "current_price": None,
-                    "current_value": 0.0,
-                    "target_allocation": holding.target_allocation,
-                    "current_allocation": 0.0
-                })
-        
-        # Calculate current allocation percentages
-        if total_value > 0:
-            for holding_data in holdings_breakdown:
-                if holding_data["current_value"] > 0:
-                    holding_data["current_allocation"] = (holding_data["current_value"] / total_value) * 100
-        
-        # Allocation analysis
-        total_target_allocation = sum(h.target_allocation for h in holdings)
-        allocation_drift = []
-        
-        for holding_data in holdings_breakdown:
-            target = holding_data["target_allocation"]
-            current = holding_data["current_allocation"]
-            drift = current - target
+            target = holding.target_allocation
+            total_target_allocation += target
+            current = current_value * inv_total if current_value > 0 else 0.0
+            
+            holdings_breakdown.append({
+                "symbol": holding.symbol,
+                "shares": holding.shares,
+                "current_price": holding.last_price or None,
+                "current_value": current_value,
+                "target_allocation": target,
+                "current_allocation": current
+            })
             
+            # Without any valued holdings every allocation is 0%, so drift is meaningless
+            if not inv_total:
+                continue
+            drift = current - target
             if abs(drift) > 1.0:  # Only show significant drifts
                 allocation_drift.append({
-                    "symbol": holding_data["symbol"],
+                    "symbol": holding.symbol,
                     "target": target,
                     "current": current,
                     "drift": drift
@@ -412,16 +521,18 @@ class PortfolioController:
     
     def validate_portfolio_symbols(self, portfolio_id: int) -> dict:
         """Validate all stock symbols in a portfolio."""
-        holdings = self.get_portfolio_holdings(portfolio_id)
+        symbols = [symbol for (symbol,) in self.db.query(Holding.symbol).filter(
+            Holding.portfolio_id == portfolio_id
+        ).order_by(Holding.symbol)]
         
-        if not holdings:
+        if not symbols:
             return {"valid_symbols": [], "invalid_symbols": [], "all_valid": True}
         
-        symbols = [h.symbol for h in holdings]
         validation_results = self.stock_data_controller.validate_symbols(symbols)
         
-        valid_symbols = [symbol for symbol, is_valid in validation_results.items() if is_valid]
-        invalid_symbols = [symbol for symbol, is_valid in validation_results.items() if not is_valid]
+        valid_symbols, invalid_symbols = [], []
+        for symbol, is_valid in validation_results.items():
+            (valid_symbols if is_valid else invalid_symbols).append(symbol)
         
         return {
             "valid_symbols": valid_symbols,
@@ -430,17 +541,63 @@ class PortfolioController:
             "validation_results": validation_results
         }
     
-    def calculate_portfolio_summary(self, portfolio_id: int) -> dict:
-        """Calculate portfolio summary statistics."""
-        holdings = self.get_portfolio_holdings(portfolio_id)
+    def get_significant_drifts(self, portfolio_id: int, threshold: float = 1.0) -> List[dict]:
+        """
+        Get holdings whose allocation drifts from target by more than ``threshold``.
         
-        total_value = sum(h.current_value for h in holdings if h.last_price)
-        total_target_allocation = sum(h.target_allocation for h in holdings)
+        Allocations are computed in the database with a window over the
+        portfolio total, so only the drifting rows come back. Results match
+        the ``significant_drifts`` of ``get_portfolio_valuation``.
+        """
+        _, value = _holding_value_columns()
+        total = func.sum(value).over()
+        allocations = select(
+            Holding.symbol,
+            Holding.target_allocation.label("target"),
+            case(
+                (value > 0, value * 100.0 / total),
+                else_=0.0
+            ).label("current"),
+            total.label("total")
+        ).where(Holding.portfolio_id == portfolio_id).subquery()
+        drift = allocations.c.current - allocations.c.target
+        
+        rows = self.db.execute(
+            select(allocations.c.symbol, allocations.c.target, allocations.c.current, drift)
+            .where(allocations.c.total > 0, func.abs(drift) > threshold)
+            .order_by(allocations.c.symbol)
+        )
+        return [
+            {"symbol": symbol, "target": target, "current": current, "drift": drift}
+            for symbol, target, current, drift in rows
+        ]
+    
+    def calculate_portfolio_summary(self, portfolio_id: int) -> dict:
+        """Calculate portfolio summary statistics, memoized per portfolio version."""
+        portfolio = self.db.get(Portfolio, portfolio_id)
+        if portfolio is None:
+            return self._compute_portfolio_summary(portfolio_id)
+        
+        cache_key = (portfolio_id, portfolio.modified_date.timestamp())
+        summary = _summary_cache.get_or_set(
+            cache_key, lambda: self._compute_portfolio_summary(portfolio_id)
+        )
+        return dict(summary)
+    
+    def _compute_portfolio_summary(self, portfolio_id: int) -> dict:
+        """Compute portfolio summary statistics with a single aggregate query."""
+        has_price, value = _holding_value_columns()
+        total_holdings, total_value, total_target_allocation, holdings_with_prices = self.db.query(
+            func.count(Holding.id),
+            func.coalesce(func.sum(value), 0.0),
+            func.coalesce(func.sum(Holding.target_allocation), 0.0),
+            func.count(case((has_price, 1)))
+        ).filter(Holding.portfolio_id == portfolio_id).one()
         
         return {
-            "total_holdings": len(holdings),
+            "total_holdings": total_holdings,
             "total_value": total_value,
             "total_target_allocation": total_target_allocation,
             "is_allocation_valid": abs(total_target_allocation - 100.0) < 0.01,
-            "holdings_with_prices": len([h for h in holdings if h.last_price])
-        }
\ No newline at end of file
+            "holdings_with_prices": holdings_with_prices
+        }
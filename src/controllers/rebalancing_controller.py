@@ -1,20 +1,46 @@
 """Portfolio rebalancing controller for analyzing and executing rebalancing transactions."""
 
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Tuple, Union
 from decimal import Decimal, ROUND_HALF_UP
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from sqlalchemy import or_
 from sqlalchemy.orm import Session
+from pydantic import BaseModel, ConfigDict
 from datetime import datetime
 import logging
+import sys
+import numpy as np
 
 from models.portfolio import Portfolio, Holding
 from controllers.portfolio_controller import PortfolioController
 from controllers.stock_data_controller import StockDataController
+from utils.cache import TTLCache
+from utils.rebalancing_kernels import (
+    ACTION_BUY,
+    ACTION_NONE,
+    compute_allocation_drifts,
+    compute_rebalancing_trades
+)
 
 logger = logging.getLogger(__name__)
 
+NO_MARKET_VALUE_ERROR = "Portfolio has no current market value. Please refresh stock prices first."
 
-@dataclass
+# Analyses keyed by (portfolio_id, tolerance, cost_rate, generation threshold,
+# modified_date timestamp). Price refreshes and executed rebalances touch the
+# holdings, which bumps modified_date, so stale analyses are never served.
+_analysis_cache = TTLCache(maxsize=512, ttl=60)
+
+# Summary dicts derived from those analyses, keyed by (portfolio_id, tolerance,
+# cost_rate, modified_date timestamp) and invalidated the same way
+_summary_cache = TTLCache(maxsize=512, ttl=60)
+
+# Analyses are shared through the cache above, so their records are immutable;
+# slots (Python 3.10+) keep the per-holding records small
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_SLOTS)
 class RebalancingTransaction:
     """Represents a single buy/sell transaction for rebalancing."""
     symbol: str
@@ -25,8 +51,13 @@ class RebalancingTransaction:
     transaction_cost: float
     reason: str
 
+    def __post_init__(self):
+        # Interned so the holdings_map lookup in execute_rebalancing can match
+        # by identity, also for transactions built by callers
+        object.__setattr__(self, 'symbol', sys.intern(self.symbol))
+
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class AllocationDrift:
     """Represents the allocation drift for a single holding."""
     symbol: str
@@ -39,7 +70,7 @@ class AllocationDrift:
     value_difference: float
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class RebalancingAnalysis:
     """Complete rebalancing analysis for a portfolio."""
     portfolio_id: int
@@ -51,11 +82,93 @@ class RebalancingAnalysis:
     total_transaction_cost: float
     estimated_final_value: float
     analysis_timestamp: datetime
+    # Columnar copies of the drift fields for vectorized aggregation
+    _drift_array: np.ndarray = field(init=False, repr=False, compare=False)
+    _value_diff_array: np.ndarray = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Frozen, so the derived arrays are set through object.__setattr__
+        object.__setattr__(self, '_drift_array', np.fromiter(
+            (drift.drift for drift in self.allocation_drifts),
+            dtype=np.float64, count=len(self.allocation_drifts)
+        ))
+        object.__setattr__(self, '_value_diff_array', np.fromiter(
+            (drift.value_difference for drift in self.allocation_drifts),
+            dtype=np.float64, count=len(self.allocation_drifts)
+        ))
+    
+    def significant_drift_indices(self, tolerance: float) -> np.ndarray:
+        """Get indices of drifts whose absolute value exceeds the tolerance."""
+        return np.flatnonzero(np.abs(self._drift_array) > tolerance)
+    
+    def total_value_to_trade(self) -> float:
+        """Get the total absolute value difference across all holdings."""
+        return float(np.abs(self._value_diff_array).sum())
+    
+    def max_abs_drift(self) -> float:
+        """Get the largest absolute drift, or 0 for an empty analysis."""
+        return float(np.abs(self._drift_array).max()) if self._drift_array.size else 0
+
+
+class TransactionOut(BaseModel):
+    """Response schema for a rebalancing transaction."""
+    model_config = ConfigDict(from_attributes=True)
+    
+    symbol: str
+    action: str
+    shares: float
+    current_price: float
+    transaction_value: float
+    transaction_cost: float
+    reason: str
+
+
+class DriftOut(BaseModel):
+    """Response schema for a holding's allocation drift."""
+    model_config = ConfigDict(from_attributes=True)
+    
+    symbol: str
+    current_allocation: float
+    target_allocation: float
+    drift: float
+    drift_percentage: float
+    current_value: float
+    target_value: float
+    value_difference: float
+
+
+class AnalysisOut(BaseModel):
+    """Response schema for a complete rebalancing analysis."""
+    model_config = ConfigDict(from_attributes=True)
+    
+    portfolio_id: int
+    total_value: float
+    is_balanced: bool
+    tolerance_threshold: float
+    analysis_timestamp: datetime
+    allocation_drifts: List[DriftOut]
+    transactions: List[TransactionOut]
+    total_transaction_cost: float
+    estimated_final_value: float
+
+
+class TransactionsOut(BaseModel):
+    """Response schema for the rebalancing transactions of a portfolio."""
+    model_config = ConfigDict(from_attributes=True)
+    
+    portfolio_id: int
+    is_balanced: bool
+    transactions: List[TransactionOut]
+    total_transaction_cost: float
+    transaction_count: int
 
 
 class RebalancingController:
     """Controller for portfolio rebalancing operations."""
     
+    # Price service shared by every instance; controllers are created per request
+    _shared_stock_data_controller: Optional[StockDataController] = None
+    
     def __init__(self, db: Session, tolerance_threshold: float = 2.0, transaction_cost_rate: float = 0.005):
         """
         Initialize rebalancing controller.
@@ -69,7 +182,24 @@ class RebalancingController:
         self.tolerance_threshold = tolerance_threshold
         self.transaction_cost_rate = transaction_cost_rate
         self.portfolio_controller = PortfolioController(db)
-        self.stock_data_controller = StockDataController()
+        self.stock_data_controller = self._get_shared_stock_data_controller()
+        # Holdings loaded by this (request-scoped) controller, by portfolio ID
+        self._holdings_cache: Dict[int, List[Holding]] = {}
+    
+    @classmethod
+    def _get_shared_stock_data_controller(cls) -> StockDataController:
+        """Get the price service shared across controller instances."""
+        if cls._shared_stock_data_controller is None:
+            cls._shared_stock_data_controller = StockDataController()
+        return cls._shared_stock_data_controller
+    
+    def _get_holdings(self, portfolio_id: int) -> List[Holding]:
+        """Get a portfolio's holdings, querying at most once per controller."""
+        holdings = self._holdings_cache.get(portfolio_id)
+        if holdings is None:
+            holdings = self.portfolio_controller.get_portfolio_holdings(portfolio_id)
+            self._holdings_cache[portfolio_id] = holdings
+        return holdings
     
     def analyze_portfolio_rebalancing(self, portfolio_id: int, 
                                     custom_tolerance: Optional[float] = None,
@@ -88,27 +218,43 @@ class RebalancingController:
         tolerance = custom_tolerance if custom_tolerance is not None else self.tolerance_threshold
         cost_rate = custom_cost_rate if custom_cost_rate is not None else self.transaction_cost_rate
         
-        # Get portfolio and holdings
+        # Get portfolio; unchanged portfolios are served from the analysis cache
         portfolio = self.portfolio_controller.get_portfolio(portfolio_id)
         if not portfolio:
             raise ValueError(f"Portfolio {portfolio_id} not found")
         
-        holdings = self.portfolio_controller.get_portfolio_holdings(portfolio_id)
+        cache_key = (portfolio_id, tolerance, cost_rate, self.tolerance_threshold,
+                     portfolio.modified_date.timestamp())
+        return _analysis_cache.get_or_set(
+            cache_key, lambda: self._compute_rebalancing_analysis(portfolio_id, tolerance, cost_rate)
+        )
+    
+    def _compute_rebalancing_analysis(self, portfolio_id: int, tolerance: float,
+                                      cost_rate: float) -> RebalancingAnalysis:
+        """Compute a fresh rebalancing analysis from the current holdings."""
+        holdings = self._get_holdings(portfolio_id)
         if not holdings:
             raise ValueError(f"Portfolio {portfolio_id} has no holdings")
         
-        # Calculate current portfolio value
-        total_value = sum(h.current_value for h in holdings if h.last_price)
+        # Gather holdings into arrays once for the numerical kernels; the
+        # portfolio value is their sum, so no separate pass is needed
+        count = len(holdings)
+        current_values = np.fromiter((h.current_value if h.last_price else 0.0 for h in holdings),
+                                     dtype=np.float64, count=count)
+        target_pcts = np.fromiter((h.target_allocation for h in holdings), dtype=np.float64, count=count)
+        prices = np.fromiter((h.last_price or 0.0 for h in holdings), dtype=np.float64, count=count)
+        total_value = float(current_values.sum())
         
         if total_value <= 0:
-            raise ValueError("Portfolio has no current market value. Please refresh stock prices first.")
+            raise ValueError(NO_MARKET_VALUE_ERROR)
         
         # Analyze allocation drifts
-        allocation_drifts = self._calculate_allocation_drifts(holdings, total_value)
+        drift_arrays = compute_allocation_drifts(current_values, target_pcts, total_value)
+        allocation_drifts = self._calculate_allocation_drifts(holdings, current_values, *drift_arrays)
         
         # Determine if rebalancing is needed
-        significant_drifts = [d for d in allocation_drifts if abs(d.drift) > tolerance]
-        is_balanced = len(significant_drifts) == 0
+        drifts, value_differences = drift_arrays[1], drift_arrays[4]
+        is_balanced = not bool(np.any(np.abs(drifts) > tolerance))
         
         # Generate transactions if rebalancing is needed
         transactions = []
@@ -117,7 +263,7 @@ class RebalancingController:
         
         if not is_balanced:
             transactions, total_transaction_cost = self._generate_rebalancing_transactions(
-                holdings, total_value, allocation_drifts, cost_rate
+                holdings, allocation_drifts, drifts, value_differences, prices, cost_rate
             )
             estimated_final_value = total_value - total_transaction_cost
         
@@ -133,71 +279,54 @@ class RebalancingController:
             analysis_timestamp=datetime.now()
         )
     
-    def _calculate_allocation_drifts(self, holdings: List[Holding], total_value: float) -> List[AllocationDrift]:
-        """Calculate allocation drift for each holding."""
-        drifts = []
-        
-        for holding in holdings:
-            current_value = holding.current_value if holding.last_price else 0.0
-            current_allocation = (current_value / total_value * 100) if total_value > 0 else 0.0
-            target_allocation = holding.target_allocation
-            
-            drift = current_allocation - target_allocation
-            drift_percentage = (drift / target_allocation * 100) if target_allocation > 0 else 0.0
-            
-            target_value = total_value * (target_allocation / 100)
-            value_difference = current_value - target_value
-            
-            drifts.append(AllocationDrift(
+    def _calculate_allocation_drifts(self, holdings: List[Holding], current_values: np.ndarray,
+                                     current_allocations: np.ndarray, drifts: np.ndarray,
+                                     drift_percentages: np.ndarray, target_values: np.ndarray,
+                                     value_differences: np.ndarray) -> List[AllocationDrift]:
+        """Wrap the kernel's per-holding drift arrays in AllocationDrift objects."""
+        return [
+            AllocationDrift(
                 symbol=holding.symbol,
                 current_allocation=current_allocation,
-                target_allocation=target_allocation,
+                target_allocation=holding.target_allocation,
                 drift=drift,
                 drift_percentage=drift_percentage,
                 current_value=current_value,
                 target_value=target_value,
                 value_difference=value_difference
-            ))
-        
-        return drifts
+            )
+            for holding, current_value, current_allocation, drift, drift_percentage,
+                target_value, value_difference in zip(
+                holdings, current_values.tolist(), current_allocations.tolist(),
+                drifts.tolist(), drift_percentages.tolist(), target_values.tolist(),
+                value_differences.tolist()
+            )
+        ]
     
-    def _generate_rebalancing_transactions(self, holdings: List[Holding], total_value: float,
-                                         allocation_drifts: List[AllocationDrift], 
+    def _generate_rebalancing_transactions(self, holdings: List[Holding],
+                                         allocation_drifts: List[AllocationDrift],
+                                         drifts: np.ndarray, value_differences: np.ndarray,
+                                         prices: np.ndarray,
                                          cost_rate: float) -> Tuple[List[RebalancingTransaction], float]:
         """Generate buy/sell transactions to achieve target allocation."""
+        # Skip very small transactions (less than 0.1 shares)
+        action_codes, shares, transaction_values, transaction_costs = compute_rebalancing_trades(
+            drifts, value_differences, prices, cost_rate, self.tolerance_threshold, 0.1
+        )
+        
         transactions = []
         total_cost = 0.0
         
-        # Create a map for quick lookup
-        drift_map = {d.symbol: d for d in allocation_drifts}
-        
-        for holding in holdings:
+        # Only holdings that trade or lack a price need any per-holding work
+        for i in np.flatnonzero((action_codes != ACTION_NONE) | (prices <= 0)).tolist():
+            holding = holdings[i]
             if not holding.last_price:
                 logger.warning(f"Skipping {holding.symbol} - no current price available")
                 continue
             
-            drift = drift_map[holding.symbol]
-            
-            # Skip if drift is within tolerance
-            if abs(drift.drift) <= self.tolerance_threshold:
-                continue
-            
-            # Calculate required shares change
-            target_value = drift.target_value
-            current_value = drift.current_value
-            value_difference = target_value - current_value
-            
-            # Calculate shares to buy/sell
-            shares_change = value_difference / holding.last_price
-            action = "BUY" if shares_change > 0 else "SELL"
-            shares_change = abs(shares_change)
-            
-            # Skip very small transactions (less than 0.1 shares)
-            if shares_change < 0.1:
-                continue
-            
-            transaction_value = shares_change * holding.last_price
-            transaction_cost = transaction_value * cost_rate
+            action_code = action_codes[i]
+            drift = allocation_drifts[i]
+            transaction_cost = float(transaction_costs[i])
             total_cost += transaction_cost
             
             # Determine reason for transaction
@@ -208,10 +337,10 @@ class RebalancingController:
             
             transactions.append(RebalancingTransaction(
                 symbol=holding.symbol,
-                action=action,
-                shares=shares_change,
+                action="BUY" if action_code == ACTION_BUY else "SELL",
+                shares=float(shares[i]),
                 current_price=holding.last_price,
-                transaction_value=transaction_value,
+                transaction_value=float(transaction_values[i]),
                 transaction_cost=transaction_cost,
                 reason=reason
             ))
@@ -219,22 +348,37 @@ class RebalancingController:
         return transactions, total_cost
     
     def get_rebalancing_summary(self, portfolio_id: int) -> Dict:
-        """Get a quick summary of rebalancing needs for a portfolio."""
+        """Get a quick summary of rebalancing needs, memoized per portfolio version."""
         try:
-            analysis = self.analyze_portfolio_rebalancing(portfolio_id)
+            portfolio = self.db.get(Portfolio, portfolio_id)
+            cache_key = None
+            if portfolio is not None:
+                cache_key = (portfolio_id, self.tolerance_threshold, self.transaction_cost_rate,
+                             portfolio.modified_date.timestamp())
+                summary = _summary_cache.get(cache_key)
+                if summary is not None:
+                    return dict(summary)
             
-            significant_drifts = [d for d in analysis.allocation_drifts if abs(d.drift) > self.tolerance_threshold]
+            # The memoized totals reveal an unpriced portfolio without loading its holdings
+            totals = self.portfolio_controller.calculate_portfolio_summary(portfolio_id)
+            if totals["total_holdings"] and totals["total_value"] <= 0:
+                raise ValueError(NO_MARKET_VALUE_ERROR)
             
-            return {
+            analysis = self.analyze_portfolio_rebalancing(portfolio_id)
+            
+            summary = {
                 "needs_rebalancing": not analysis.is_balanced,
                 "total_value": analysis.total_value,
                 "tolerance_threshold": analysis.tolerance_threshold,
-                "significant_drifts_count": len(significant_drifts),
-                "max_drift": max([abs(d.drift) for d in analysis.allocation_drifts]) if analysis.allocation_drifts else 0,
+                "significant_drifts_count": len(analysis.significant_drift_indices(self.tolerance_threshold)),
+                "max_drift": analysis.max_abs_drift(),
                 "transaction_count": len(analysis.transactions),
                 "estimated_transaction_cost": analysis.total_transaction_cost,
                 "cost_percentage": (analysis.total_transaction_cost / analysis.total_value * 100) if analysis.total_value > 0 else 0
             }
+            if cache_key is not None:
+                _summary_cache.set(cache_key, summary)
+            return dict(summary)
         except Exception as e:
             logger.error(f"Error calculating rebalancing summary for portfolio {portfolio_id}: {e}")
             return {
@@ -243,19 +387,30 @@ class RebalancingController:
                 "total_value": 0
             }
     
-    def execute_rebalancing(self, portfolio_id: int, transactions: List[RebalancingTransaction],
+    def execute_rebalancing(self, analysis: Union[RebalancingAnalysis, int],
+                          transactions: Optional[List[RebalancingTransaction]] = None,
                           dry_run: bool = True) -> Dict:
         """
         Execute rebalancing transactions by updating portfolio holdings.
         
         Args:
-            portfolio_id: Portfolio to rebalance
-            transactions: List of transactions to execute
+            analysis: Analysis whose transactions should be executed. A portfolio ID
+                is still accepted together with an explicit transactions list.
+            transactions: Transactions to execute (defaults to analysis.transactions)
             dry_run: If True, don't actually update holdings (default: True for safety)
             
         Returns:
             Execution results
         """
+        if isinstance(analysis, RebalancingAnalysis):
+            portfolio_id = analysis.portfolio_id
+            if transactions is None:
+                transactions = analysis.transactions
+        else:
+            portfolio_id = analysis
+            if transactions is None:
+                raise ValueError("transactions are required when executing by portfolio ID")
+        
         if dry_run:
             return {
                 "success": True,
@@ -266,8 +421,19 @@ class RebalancingController:
             }
         
         try:
-            holdings = self.portfolio_controller.get_portfolio_holdings(portfolio_id)
-            holdings_map = {h.symbol: h for h in holdings}
+            # Reuse holdings loaded by the analysis; otherwise load only the traded ones
+            traded_symbols = {t.symbol for t in transactions}
+            cached = self._holdings_cache.get(portfolio_id)
+            if cached is not None:
+                holdings = [h for h in cached if h.symbol in traded_symbols]
+            else:
+                holdings = self.db.query(Holding).filter(
+                    Holding.portfolio_id == portfolio_id,
+                    Holding.symbol.in_(traded_symbols)
+                ).all() if traded_symbols else []
+            # Keys are interned rather than assigning to h.symbol, which would
+            # mark every holding dirty
+            holdings_map = {sys.intern(h.symbol): h for h in holdings}
             
             executed_transactions = []
             total_cost = 0.0
@@ -296,6 +462,7 @@ class RebalancingController:
             
             # Commit changes
             self.db.commit()
+            self._holdings_cache.pop(portfolio_id, None)
             
             # Log the rebalancing execution
             self._log_rebalancing_execution(portfolio_id, executed_transactions, total_cost)
@@ -337,34 +504,50 @@ class RebalancingController:
         warnings = []
         
         # Check if portfolio exists
-        portfolio = self.portfolio_controller.get_portfolio(portfolio_id)
-        if not portfolio:
+        if self.db.get(Portfolio, portfolio_id) is None:
             issues.append("Portfolio not found")
             return {"feasible": False, "issues": issues, "warnings": warnings}
         
+        # Counts and totals come from the (memoized) summary aggregate query
+        totals = self.portfolio_controller.calculate_portfolio_summary(portfolio_id)
+        holdings_count = totals["total_holdings"]
+        holdings_with_prices = totals["holdings_with_prices"]
+        total_value = totals["total_value"]
+        
         # Check if portfolio has holdings
-        holdings = self.portfolio_controller.get_portfolio_holdings(portfolio_id)
-        if not holdings:
+        if not holdings_count:
             issues.append("Portfolio has no holdings")
             return {"feasible": False, "issues": issues, "warnings": warnings}
         
+        # Only holdings missing a price or a target need to be listed by symbol
+        flagged = self.db.query(Holding.symbol, Holding.last_price, Holding.target_allocation).filter(
+            Holding.portfolio_id == portfolio_id,
+            or_(Holding.last_price.is_(None), Holding.last_price == 0, Holding.target_allocation <= 0)
+        ).order_by(Holding.symbol).all()
+        
+        # One pass over the flagged rows fills both symbol lists
+        holdings_without_prices = []
+        zero_targets = []
+        for symbol, last_price, target in flagged:
+            if not last_price:
+                holdings_without_prices.append(symbol)
+            if target <= 0:
+                zero_targets.append(symbol)
+        
         # Check if all holdings have current prices
-        holdings_without_prices = [h.symbol for h in holdings if not h.last_price]
         if holdings_without_prices:
             issues.append(f"Missing current prices for: {', '.join(holdings_without_prices)}")
         
         # Check if target allocations sum to approximately 100%
-        total_target_allocation = sum(h.target_allocation for h in holdings)
+        total_target_allocation = totals["total_target_allocation"]
         if abs(total_target_allocation - 100.0) > 0.1:
             issues.append(f"Target allocations sum to {total_target_allocation:.1f}% instead of 100%")
         
         # Check for zero target allocations
-        zero_targets = [h.symbol for h in holdings if h.target_allocation <= 0]
         if zero_targets:
             warnings.append(f"Holdings with zero target allocation: {', '.join(zero_targets)}")
         
         # Check portfolio value
-        total_value = sum(h.current_value for h in holdings if h.last_price)
         if total_value <= 0:
             issues.append("Portfolio has no current market value")
         elif total_value < 1000:  # Arbitrary minimum for meaningful rebalancing
@@ -377,8 +560,8 @@ class RebalancingController:
             "issues": issues,
             "warnings": warnings,
             "total_value": total_value,
-            "holdings_count": len(holdings),
-            "holdings_with_prices": len([h for h in holdings if h.last_price])
+            "holdings_count": holdings_count,
+            "holdings_with_prices": holdings_with_prices
         }
     
     def _calculate_allocation_drift(self, current_allocation: float, target_allocation: float) -> float:
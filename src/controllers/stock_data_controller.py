@@ -1,17 +1,24 @@
 """Stock data controller for fetching real-time stock prices."""
 
 import yfinance as yf
+import pandas as pd
 import time
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 import logging
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
+from utils.cache import TTLCache
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Whether a symbol exists rarely changes, and portfolios and watchlists across
+# the process share symbols, so validation results are kept for a few hours
+SYMBOL_VALIDITY_TTL_SECONDS = 6 * 60 * 60
+_symbol_validity_cache = TTLCache(maxsize=4096, ttl=SYMBOL_VALIDITY_TTL_SECONDS)
+
 
 @dataclass
 class StockPrice:
@@ -262,6 +269,66 @@ class StockDataController:
         
         return results
     
+    def get_batch_quotes(self, symbols: List[str]) -> Dict[str, Optional[StockPrice]]:
+        """
+        Get latest prices for multiple symbols with a single batched yfinance download.
+        
+        Only the price is populated; use get_stock_price for full quote details.
+        
+        Args:
+            symbols: List of stock symbols
+            
+        Returns:
+            Dictionary mapping symbols to StockPrice objects (None if not returned)
+        """
+        symbols = list(dict.fromkeys(s.upper().strip() for s in symbols))
+        results = {symbol: None for symbol in symbols}
+        
+        if '$CASH' in results:
+            results['$CASH'] = self.get_stock_price('$CASH')
+        tickers = [s for s in symbols if s != '$CASH']
+        if not tickers:
+            return results
+        
+        try:
+            data = yf.download(tickers=tickers, period='5d', interval='1d', auto_adjust=False,
+                               progress=False, threads=True)
+        except Exception as e:
+            logger.error(f"Batch price download failed: {e}")
+            return results
+        
+        if data is None or data.empty or 'Close' not in data.columns.get_level_values(0):
+            return results
+        
+        closes = data['Close']
+        if isinstance(closes, pd.Series):
+            closes = closes.to_frame(name=tickers[0])
+        
+        market_state = self._determine_market_state({})
+        now = datetime.now()
+        for symbol in tickers:
+            if symbol not in closes.columns:
+                continue
+            series = closes[symbol].dropna()
+            if series.empty:
+                continue
+            results[symbol] = StockPrice(
+                symbol=symbol,
+                price=float(series.iloc[-1]),
+                currency='USD',
+                market_cap=None,
+                pe_ratio=None,
+                dividend_yield=None,
+                fifty_two_week_high=None,
+                fifty_two_week_low=None,
+                volume=None,
+                avg_volume=None,
+                market_state=market_state,
+                last_updated=now
+            )
+        
+        return results
+    
     def refresh_portfolio_prices(self, portfolio_holdings: List[str]) -> Dict[str, Optional[StockPrice]]:
         """
         Refresh prices for all holdings in a portfolio.
@@ -274,8 +341,12 @@ class StockDataController:
         """
         logger.info(f"Refreshing prices for {len(portfolio_holdings)} holdings")
         
-        # Force refresh by not using cache
-        results = self.get_multiple_stock_prices(portfolio_holdings, use_cache=False)
+        # Force refresh by not using cache: one batched download for all symbols,
+        # then parallel per-symbol fetches for anything the batch did not return
+        results = self.get_batch_quotes(portfolio_holdings)
+        missing = [symbol for symbol, price in results.items() if price is None]
+        if missing:
+            results.update(self.get_multiple_stock_prices(missing, use_cache=False))
         
         successful_updates = len([r for r in results.values() if r is not None])
         logger.info(f"Successfully updated {successful_updates}/{len(portfolio_holdings)} prices")
@@ -292,32 +363,43 @@ class StockDataController:
         Returns:
             Dictionary mapping symbols to boolean validity
         """
-        results = {}
+        results = {symbol.upper().strip(): False for symbol in symbols}
         
-        for symbol in symbols:
-            symbol = symbol.upper().strip()
-            
+        # Each check is a blocking network call, so overlap them in a thread pool
+        to_check = [symbol for symbol in results if symbol != '$CASH']
+        if '$CASH' in results:
             # Handle cash positions specially
-            if symbol == '$CASH':
-                results[symbol] = True
-                continue
-                
-            try:
-                ticker = yf.Ticker(symbol)
-                info = ticker.info
-                
-                # A valid symbol should have basic info and at least one price field
-                price_fields = ['currentPrice', 'regularMarketPrice', 'previousClose', 'open']
-                has_price = any(info.get(field) is not None for field in price_fields) if info else False
-                is_valid = bool(info and has_price)
-                results[symbol] = is_valid
-                
-            except Exception as e:
-                logger.warning(f"Symbol validation failed for {symbol}: {e}")
-                results[symbol] = False
+            results['$CASH'] = True
+        if to_check:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(to_check))) as executor:
+                for symbol, is_valid in zip(to_check, executor.map(self._validate_symbol, to_check)):
+                    results[symbol] = is_valid
         
         return results
     
+    def _validate_symbol(self, symbol: str) -> bool:
+        """Check a single (normalized) symbol has quote info with a price."""
+        is_valid = _symbol_validity_cache.get(symbol)
+        if is_valid is not None:
+            return is_valid
+        
+        try:
+            ticker = yf.Ticker(symbol)
+            info = ticker.info
+            
+            # A valid symbol should have basic info and at least one price field
+            price_fields = ['currentPrice', 'regularMarketPrice', 'previousClose', 'open']
+            has_price = any(info.get(field) is not None for field in price_fields) if info else False
+            is_valid = bool(info and has_price)
+            
+        except Exception as e:
+            # Lookup errors are usually transient, so they are not cached
+            logger.warning(f"Symbol validation failed for {symbol}: {e}")
+            return False
+        
+        _symbol_validity_cache.set(symbol, is_valid)
+        return is_valid
+    
     def get_market_summary(self) -> dict:
         """Get general market summary information."""
         try:
@@ -373,8 +455,9 @@ class StockDataController:
             return 'UNKNOWN'
     
     def clear_cache(self) -> None:
-        """Clear all cached prices."""
+        """Clear all cached prices and symbol validation results."""
         self.cache.clear()
+        _symbol_validity_cache.clear()
         logger.info("Price cache cleared")
     
     def get_cache_stats(self) -> dict:
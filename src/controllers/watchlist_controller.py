@@ -1,34 +1,35 @@
 """Watchlist business logic and CRUD operations."""
 
-from typing import List, Optional
+from functools import cached_property
+from typing import Annotated, Dict, List, Optional, Tuple
+from sqlalchemy import case, func
 from sqlalchemy.orm import Session
-from models.portfolio import Watchlist, WatchedItem
-from pydantic import BaseModel, field_validator
-from controllers.stock_data_controller import StockDataController
+from models.database import commit_keeping_loaded
+from models.portfolio import Watchlist, WatchedItem, utc_now
+from pydantic import BaseModel, StringConstraints, field_validator
+from utils.validators import normalize_stock_symbol
+
+
+class WatchlistNotFound(LookupError):
+    """Raised when an operation targets a watchlist that does not exist."""
+    
+    def __init__(self, watchlist_id: int):
+        super().__init__(f"Watchlist {watchlist_id} not found")
+        self.watchlist_id = watchlist_id
+
+
+# Checked inside pydantic-core, like PortfolioName in the portfolio schemas
+WatchlistName = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]
 
 
 class WatchlistCreate(BaseModel):
     """Schema for creating a new watchlist."""
-    name: str
-    
-    @field_validator('name')
-    @classmethod
-    def name_must_not_be_empty(cls, v):
-        if not v or not v.strip():
-            raise ValueError('Watchlist name cannot be empty')
-        return v.strip()
+    name: WatchlistName
 
 
 class WatchlistUpdate(BaseModel):
     """Schema for updating a watchlist."""
-    name: str
-    
-    @field_validator('name')
-    @classmethod
-    def name_must_not_be_empty(cls, v):
-        if not v or not v.strip():
-            raise ValueError('Watchlist name cannot be empty')
-        return v.strip()
+    name: WatchlistName
 
 
 class WatchedItemCreate(BaseModel):
@@ -36,12 +37,12 @@ class WatchedItemCreate(BaseModel):
     symbol: str
     notes: Optional[str] = None
     
-    @field_validator('symbol')
+    @field_validator('symbol', mode='before')
     @classmethod
     def symbol_must_be_valid(cls, v):
-        if not v or not v.strip():
-            raise ValueError('Symbol cannot be empty')
-        return v.strip().upper()
+        if not isinstance(v, str):
+            return v
+        return normalize_stock_symbol(v)
     
     @field_validator('notes')
     @classmethod
@@ -68,7 +69,12 @@ class WatchlistController:
     
     def __init__(self, db: Session):
         self.db = db
-        self.stock_data_controller = StockDataController()
+    
+    @cached_property
+    def stock_data_controller(self):
+        """Price service, built on the first price lookup."""
+        from controllers.stock_data_controller import StockDataController
+        return StockDataController()
     
     def get_watchlists(self) -> List[Watchlist]:
         """Get all watchlists."""
@@ -78,6 +84,12 @@ class WatchlistController:
         """Get a specific watchlist by ID."""
         return self.db.query(Watchlist).filter(Watchlist.id == watchlist_id).first()
     
+    def _require_watchlist(self, watchlist_id: int) -> None:
+        """Raise WatchlistNotFound if the watchlist does not exist."""
+        exists = self.db.query(Watchlist.id).filter(Watchlist.id == watchlist_id).first()
+        if exists is None:
+            raise WatchlistNotFound(watchlist_id)
+    
     def get_watchlist_by_name(self, name: str) -> Optional[Watchlist]:
         """Get a watchlist by name."""
         return self.db.query(Watchlist).filter(Watchlist.name == name).first()
@@ -91,8 +103,7 @@ class WatchlistController:
         
         db_watchlist = Watchlist(name=watchlist.name)
         self.db.add(db_watchlist)
-        self.db.commit()
-        self.db.refresh(db_watchlist)
+        commit_keeping_loaded(self.db)
         return db_watchlist
     
     def update_watchlist(self, watchlist_id: int, watchlist: WatchlistUpdate) -> Optional[Watchlist]:
@@ -110,8 +121,7 @@ class WatchlistController:
             raise ValueError(f"Watchlist with name '{watchlist.name}' already exists")
         
         db_watchlist.name = watchlist.name
-        self.db.commit()
-        self.db.refresh(db_watchlist)
+        commit_keeping_loaded(self.db)
         return db_watchlist
     
     def delete_watchlist(self, watchlist_id: int) -> bool:
@@ -148,17 +158,114 @@ class WatchlistController:
         ).count()
         
         db_watched_item = WatchedItem(
-            watchlist_id=watchlist_id,
+            watchlist=watchlist,
             symbol=watched_item.symbol,
             notes=watched_item.notes,
             last_price=current_price,
             order_index=max_order
         )
         self.db.add(db_watched_item)
-        self.db.commit()
-        self.db.refresh(db_watched_item)
+        commit_keeping_loaded(self.db)
         return db_watched_item
     
+    def bulk_add_watched_items(self, watchlist_id: int, symbols: List[str]) -> Tuple[int, List[str]]:
+        """
+        Add multiple symbols to a watchlist with a single batched insert.
+        
+        Prices are not fetched here; callers should refresh the watchlist prices
+        afterwards in one batch.
+        
+        Returns:
+            Tuple of (added_count, errors)
+            
+        Raises:
+            WatchlistNotFound: If the watchlist does not exist
+        """
+        next_order = self.db.query(func.count(WatchedItem.id)).filter(
+            WatchedItem.watchlist_id == watchlist_id
+        ).scalar()
+        if not next_order:
+            self._require_watchlist(watchlist_id)
+        
+        errors = []
+        new_symbols = []
+        
+        # Clean and dedupe once up front so each distinct symbol is validated once
+        cleaned = dict.fromkeys(
+            symbol.strip().upper() for symbol in symbols if symbol and symbol.strip()
+        )
+        for symbol in cleaned:
+            try:
+                new_symbols.append(WatchedItemCreate(symbol=symbol).symbol)
+            except ValueError as e:
+                errors.append(f"{symbol}: {str(e)}")
+        
+        if not new_symbols:
+            return 0, errors
+        
+        existing = {
+            symbol for (symbol,) in self.db.query(WatchedItem.symbol).filter(
+                WatchedItem.watchlist_id == watchlist_id,
+                WatchedItem.symbol.in_(new_symbols)
+            ).all()
+        }
+        for symbol in new_symbols:
+            if symbol in existing:
+                errors.append(f"{symbol}: Stock {symbol} is already in this watchlist")
+        
+        now = utc_now()
+        rows = [
+            {
+                "watchlist_id": watchlist_id,
+                "symbol": symbol,
+                "added_date": now,
+                "order_index": next_order + offset
+            }
+            for offset, symbol in enumerate(s for s in new_symbols if s not in existing)
+        ]
+        
+        if rows:
+            self.db.bulk_insert_mappings(WatchedItem, rows)
+            self.db.commit()
+        
+        return len(rows), errors
+    
+    def bulk_remove_watched_items(self, watchlist_id: int, symbols: List[str]) -> Tuple[int, List[str]]:
+        """
+        Remove multiple symbols from a watchlist with a single batched delete.
+        
+        Returns:
+            Tuple of (removed_count, errors)
+            
+        Raises:
+            WatchlistNotFound: If nothing was removed and the watchlist does not exist
+        """
+        # Dict keys dedupe while keeping the request order for error reporting
+        requested = list(dict.fromkeys(
+            symbol.strip().upper() for symbol in symbols if symbol and symbol.strip()
+        ))
+        
+        existing = set()
+        if requested:
+            existing = {
+                symbol for (symbol,) in self.db.query(WatchedItem.symbol).filter(
+                    WatchedItem.watchlist_id == watchlist_id,
+                    WatchedItem.symbol.in_(requested)
+                ).all()
+            }
+        
+        if not existing:
+            self._require_watchlist(watchlist_id)
+        else:
+            self.db.query(WatchedItem).filter(
+                WatchedItem.watchlist_id == watchlist_id,
+                WatchedItem.symbol.in_(existing)
+            ).delete(synchronize_session=False)
+            self.db.commit()
+        
+        errors = [f"{symbol}: Not found in watchlist" for symbol in requested if symbol not in existing]
+        return len(existing), errors
+    
     def get_watchlist_items(self, watchlist_id: int) -> List[WatchedItem]:
         """Get all watched items for a watchlist, ordered by order_index."""
         return self.db.query(WatchedItem).filter(
@@ -176,8 +283,7 @@ class WatchlistController:
             return None
         
         db_watched_item.notes = watched_item.notes
-        self.db.commit()
-        self.db.refresh(db_watched_item)
+        commit_keeping_loaded(self.db)
         return db_watched_item
     
     def delete_watched_item(self, watchlist_id: int, symbol: str) -> bool:
@@ -194,15 +300,21 @@ class WatchlistController:
         self.db.commit()
         return True
     
-    def refresh_watchlist_prices(self, watchlist_id: int) -> dict:
+    def refresh_watchlist_prices(self, watchlist_id: int) -> Optional[dict]:
         """
         Refresh stock prices for all watched items in a watchlist.
         
         Returns:
-            Dictionary with update results and statistics
+            Dictionary with update results and statistics, or None if the
+            watchlist does not exist
         """
-        watched_items = self.get_watchlist_items(watchlist_id)
+        # Only ids and symbols feed the bulk update; skip hydrating WatchedItem objects
+        watched_items = self.db.query(WatchedItem.id, WatchedItem.symbol).filter(
+            WatchedItem.watchlist_id == watchlist_id
+        ).order_by(WatchedItem.order_index, WatchedItem.symbol).all()
         if not watched_items:
+            if self.db.get(Watchlist, watchlist_id) is None:
+                return None
             return {
                 "success": True,
                 "updated_count": 0,
@@ -218,20 +330,22 @@ class WatchlistController:
         # Fetch prices
         price_results = self.stock_data_controller.refresh_portfolio_prices(symbols)
         
-        # Update database with new prices
-        updated_count = 0
+        # Update database with new prices in one batch
+        price_updates = []
         failed_symbols = []
         
         for watched_item in watched_items:
             price_data = price_results.get(watched_item.symbol)
             if price_data:
-                watched_item.last_price = price_data.price
-                updated_count += 1
+                price_updates.append({"id": watched_item.id, "last_price": price_data.price})
             else:
                 failed_symbols.append(watched_item.symbol)
+        updated_count = len(price_updates)
         
         # Commit changes
         try:
+            if price_updates:
+                self.db.bulk_update_mappings(WatchedItem, price_updates)
             self.db.commit()
         except Exception as e:
             self.db.rollback()
@@ -277,31 +391,75 @@ class WatchlistController:
         else:
             return {"success": False, "error": f"Failed to fetch price for {symbol}"}
     
-    def get_watchlist_summary(self, watchlist_id: int) -> dict:
-        """Get watchlist summary with statistics."""
-        watched_items = self.get_watchlist_items(watchlist_id)
+    def bulk_update_news(self, updates: List[dict]) -> int:
+        """
+        Save cached news for several watched items with one batched update.
         
-        total_items = len(watched_items)
-        items_with_prices = len([item for item in watched_items if item.last_price])
-        items_with_notes = len([item for item in watched_items if item.notes])
+        Args:
+            updates: Dicts with the watched item ``id`` and the ``news_data`` and
+                ``last_news_update`` values to store
+            
+        Returns:
+            Number of watched items updated
+        """
+        if not updates:
+            return 0
         
-        # Calculate some basic statistics
-        prices = [item.last_price for item in watched_items if item.last_price]
-        avg_price = sum(prices) / len(prices) if prices else 0.0
+        self.db.bulk_update_mappings(WatchedItem, updates)
+        self.db.commit()
+        return len(updates)
+    
+    def get_watchlist_item_counts(self) -> Dict[int, int]:
+        """Get the number of watched items per watchlist with a single aggregate query."""
+        return dict(
+            self.db.query(WatchedItem.watchlist_id, func.count(WatchedItem.id))
+            .group_by(WatchedItem.watchlist_id)
+            .all()
+        )
+    
+    def get_watchlist_summaries(self, watchlist_ids: List[int]) -> Dict[int, dict]:
+        """Get summary statistics for several watchlists with a single aggregate query."""
+        has_price = WatchedItem.last_price != 0
+        rows = self.db.query(
+            WatchedItem.watchlist_id,
+            func.count(WatchedItem.id),
+            func.count(case((has_price, 1))),
+            func.count(case((WatchedItem.notes != '', 1))),
+            func.avg(case((has_price, WatchedItem.last_price)))
+        ).filter(
+            WatchedItem.watchlist_id.in_(watchlist_ids)
+        ).group_by(WatchedItem.watchlist_id).all()
+        stats = {row[0]: row[1:] for row in rows}
         
-        return {
-            "total_items": total_items,
-            "items_with_prices": items_with_prices,
-            "items_with_notes": items_with_notes,
-            "price_coverage": items_with_prices / total_items * 100 if total_items > 0 else 0,
-            "average_price": avg_price
-        }
+        summaries = {}
+        for watchlist_id in watchlist_ids:
+            total_items, items_with_prices, items_with_notes, avg_price = stats.get(
+                watchlist_id, (0, 0, 0, None)
+            )
+            summaries[watchlist_id] = {
+                "total_items": total_items,
+                "items_with_prices": items_with_prices,
+                "items_with_notes": items_with_notes,
+                "price_coverage": items_with_prices / total_items * 100 if total_items > 0 else 0,
+                "average_price": avg_price or 0.0
+            }
+        return summaries
+    
+    def get_watchlist_summary(self, watchlist_id: int) -> dict:
+        """Get watchlist summary with statistics."""
+        return self.get_watchlist_summaries([watchlist_id])[watchlist_id]
     
     def validate_watchlist_symbols(self, watchlist_id: int) -> dict:
-        """Validate all stock symbols in a watchlist."""
+        """
+        Validate all stock symbols in a watchlist.
+        
+        Raises:
+            WatchlistNotFound: If the watchlist does not exist
+        """
         watched_items = self.get_watchlist_items(watchlist_id)
         
         if not watched_items:
+            self._require_watchlist(watchlist_id)
             return {"valid_symbols": [], "invalid_symbols": [], "all_valid": True}
         
         symbols = [item.symbol for item in watched_items]
@@ -318,8 +476,15 @@ class WatchlistController:
         }
     
     def get_watchlist_items_with_details(self, watchlist_id: int) -> List[dict]:
-        """Get watched items with detailed information for display."""
+        """
+        Get watched items with detailed information for display.
+        
+        Raises:
+            WatchlistNotFound: If the watchlist does not exist
+        """
         watched_items = self.get_watchlist_items(watchlist_id)
+        if not watched_items:
+            self._require_watchlist(watchlist_id)
         
         return [
             {
@@ -343,10 +508,15 @@ class WatchlistController:
             
         Returns:
             True if successful, False otherwise
+            
+        Raises:
+            WatchlistNotFound: If the watchlist does not exist
         """
         try:
             # Get all watched items for this watchlist
             watched_items = self.get_watchlist_items(watchlist_id)
+            if not watched_items:
+                self._require_watchlist(watchlist_id)
             item_dict = {item.symbol: item for item in watched_items}
             
             # Validate that all symbols in the order exist in the watchlist
@@ -370,6 +540,8 @@ class WatchlistController:
             self.db.commit()
             return True
             
+        except WatchlistNotFound:
+            raise
         except Exception as e:
             self.db.rollback()
             raise ValueError(f"Failed to reorder items: {str(e)}")
\ No newline at end of file
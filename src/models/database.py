@@ -1,9 +1,12 @@
 """Database configuration and session management."""
 
 import os
-from sqlalchemy import create_engine
+import orjson
+from sqlalchemy import DateTime, create_engine, event, inspect
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm.attributes import set_committed_value
 
 # Database configuration
 # Use absolute path to ensure we always use the database in project root
@@ -12,13 +15,56 @@ PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(_
 DATABASE_PATH = os.path.join(PROJECT_ROOT, "data", "portfolio_manager.db")
 DATABASE_URL = os.getenv("DATABASE_URL", f"sqlite:///{DATABASE_PATH}")
 
+
+def _json_dumps(value) -> str:
+    """Serialize a JSON column value with orjson."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def _pool_options(url: str) -> dict:
+    """Connection pool settings for ``url``.
+    
+    Sync FastAPI handlers run on a threadpool of 40 workers, so the default
+    QueuePool (5 + 10 overflow) makes concurrent requests queue for a
+    connection. Size it to cover the threadpool. In-memory SQLite uses a
+    single-connection pool that takes no sizing. Pre-ping and recycling
+    guard against server-side idle timeouts, which SQLite files don't have.
+    """
+    if url.startswith("sqlite") and (":memory:" in url or url.rstrip("/") == "sqlite:"):
+        return {}
+    options = {
+        "pool_size": int(os.getenv("DB_POOL_SIZE", "20")),
+        "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", "20")),
+    }
+    if not url.startswith("sqlite"):
+        options.update(pool_pre_ping=True, pool_recycle=1800)
+    return options
+
+
 # Create database engine
 engine = create_engine(
     DATABASE_URL,
     connect_args={"check_same_thread": False} if "sqlite" in DATABASE_URL else {},
-    echo=False  # Set to True for SQL logging during development
+    echo=False,  # Set to True for SQL logging during development
+    # JSON columns (e.g. cached news) are encoded/decoded with orjson
+    json_serializer=_json_dumps,
+    json_deserializer=orjson.loads,
+    **_pool_options(DATABASE_URL)
 )
 
+if DATABASE_URL.startswith("sqlite"):
+    @event.listens_for(engine, "connect")
+    def _enable_sqlite_wal(dbapi_connection, connection_record):
+        """Use write-ahead logging so writers don't block readers.
+        
+        In WAL mode synchronous=NORMAL is still crash-safe and only syncs at
+        checkpoints, so a commit no longer costs an fsync of its own.
+        """
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.close()
+
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -39,11 +85,69 @@ def get_db():
         db.close()
 
 
+def commit_keeping_loaded(db) -> None:
+    """Commit without expiring the session's loaded objects.
+    
+    For writes whose new state is already on the instances (primary keys
+    and Python-side defaults are filled in by the flush), this saves the
+    SELECT a refresh or the next attribute access would otherwise issue.
+    """
+    written = []
+    
+    def collect_written(session, flush_context):
+        # Still the pre-flush lists here, including objects touched by
+        # before_flush hooks
+        written.extend(session.new)
+        written.extend(session.dirty)
+    
+    expire_on_commit = db.expire_on_commit
+    db.expire_on_commit = False
+    event.listen(db, "after_flush", collect_written)
+    try:
+        db.commit()
+    finally:
+        event.remove(db, "after_flush", collect_written)
+        db.expire_on_commit = expire_on_commit
+    # Naive DateTime columns read back without tzinfo; match that so the
+    # written objects look exactly like freshly loaded ones
+    for obj in written:
+        state = inspect(obj)
+        for attr in state.mapper.column_attrs:
+            column_type = attr.columns[0].type
+            value = state.dict.get(attr.key)
+            if (isinstance(column_type, DateTime) and not column_type.timezone
+                    and value is not None and value.tzinfo is not None):
+                set_committed_value(obj, attr.key, value.replace(tzinfo=None))
+
+
 def create_tables():
     """Create all database tables."""
     # Ensure data directory exists
     os.makedirs(os.path.dirname(DATABASE_PATH), exist_ok=True)
     Base.metadata.create_all(bind=engine)
+    create_missing_indexes()
+
+
+def create_missing_indexes(bind=None):
+    """Create indexes added to models after their tables already existed.
+
+    Raises:
+        RuntimeError: If existing rows violate a new unique index. Controllers
+            rely on these indexes to reject duplicates, so startup stops rather
+            than running without one.
+    """
+    # create_all() skips existing tables entirely, including their new indexes
+    bind = engine if bind is None else bind
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            try:
+                index.create(bind=bind, checkfirst=True)
+            except IntegrityError as e:
+                columns = ", ".join(column.name for column in index.columns)
+                raise RuntimeError(
+                    f"Cannot create unique index {index.name}: table {table.name} has rows "
+                    f"with duplicate ({columns}). Remove the duplicates and restart."
+                ) from e
 
 
 def drop_tables():
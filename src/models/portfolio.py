@@ -1,8 +1,8 @@
 """Portfolio, Holding, Watchlist, and WatchedItem database models."""
 
 from datetime import datetime, timezone
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, JSON
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Index, JSON, event, inspect
+from sqlalchemy.orm import Session, relationship
 from models.database import Base
 
 
@@ -15,14 +15,20 @@ class Portfolio(Base):
     """Portfolio model representing a collection of stock holdings."""
     
     __tablename__ = "portfolios"
+    __table_args__ = (
+        # Portfolio names are unique; the index doubles as the name lookup index
+        Index("ix_portfolios_name_unique", "name", unique=True),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
-    name = Column(String(100), nullable=False, index=True)
+    name = Column(String(100), nullable=False)
     created_date = Column(DateTime, default=utc_now, nullable=False)
     modified_date = Column(DateTime, default=utc_now, onupdate=utc_now, nullable=False)
     
-    # Relationship to holdings
-    holdings = relationship("Holding", back_populates="portfolio", cascade="all, delete-orphan")
+    # Relationship to holdings, kept in symbol order like get_portfolio_holdings
+    holdings = relationship(
+        "Holding", back_populates="portfolio", cascade="all, delete-orphan", order_by="Holding.symbol"
+    )
     
     def __repr__(self):
         return f"<Portfolio(id={self.id}, name='{self.name}')>"
@@ -32,6 +38,10 @@ class Holding(Base):
     """Holding model representing a stock position or cash within a portfolio."""
     
     __tablename__ = "holdings"
+    __table_args__ = (
+        # A symbol appears once per portfolio
+        Index("ix_holdings_pf_sym", "portfolio_id", "symbol", unique=True),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     portfolio_id = Column(Integer, ForeignKey("portfolios.id"), nullable=False)
@@ -72,6 +82,35 @@ class Holding(Base):
         return (self.current_value / total_value) * 100
 
 
+@event.listens_for(Session, "before_flush")
+def touch_portfolios_with_changed_holdings(session, flush_context, instances):
+    """Bump a portfolio's modified_date whenever one of its holdings changes.
+
+    Cached portfolio data is keyed by modified_date, so holding changes must be
+    reflected there as well.
+    """
+    portfolios = set()
+    portfolio_ids = set()
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if not isinstance(obj, Holding):
+            continue
+        # Holdings linked through the relationship have no portfolio_id until
+        # the flush assigns it, so use the loaded portfolio when there is one
+        portfolio = inspect(obj).dict.get('portfolio')
+        if portfolio is not None:
+            portfolios.add(portfolio)
+        elif obj.portfolio_id is not None:
+            portfolio_ids.add(obj.portfolio_id)
+    for portfolio_id in portfolio_ids:
+        portfolio = session.get(Portfolio, portfolio_id)
+        if portfolio is not None:
+            portfolios.add(portfolio)
+    now = utc_now()
+    for portfolio in portfolios:
+        if portfolio not in session.deleted:
+            portfolio.modified_date = now
+
+
 class Watchlist(Base):
     """Watchlist model representing a collection of stocks being tracked."""
     
@@ -93,6 +132,10 @@ class WatchedItem(Base):
     """WatchedItem model representing a stock being tracked in a watchlist."""
     
     __tablename__ = "watched_items"
+    __table_args__ = (
+        # Item lookups always filter on both columns; a symbol appears once per watchlist
+        Index("ix_watched_items_wl_sym", "watchlist_id", "symbol", unique=True),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     watchlist_id = Column(Integer, ForeignKey("watchlists.id"), nullable=False)
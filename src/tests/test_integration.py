@@ -213,6 +213,18 @@ def test_javascript_and_css_assets(client, test_db):
     assert len(css_content) > 100  # Should have actual CSS content
 
 
+def test_html_responses_are_compressed(client, test_db):
+    """Test that large HTML responses are gzip-compressed."""
+    response = client.get("/portfolios/new", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert response.headers.get("content-encoding") == "gzip"
+    assert "<html" in response.text
+    
+    # Small responses are sent uncompressed
+    health_response = client.get("/health", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in health_response.headers
+
+
 def test_health_and_monitoring_endpoints(client, test_db):
     """Test health check and monitoring endpoints."""
     # Test health endpoint
@@ -1,14 +1,22 @@
 """Unit tests for NewsController."""
 
 import pytest
-from unittest.mock import Mock, patch
-from controllers.news_controller import NewsController
+from unittest.mock import Mock, PropertyMock, patch
+from controllers.news_controller import (
+    NewsController, NewsArticle, Source, _news_cache, _article_cache, _empty_news_cache
+)
 
 
 @pytest.fixture
 def mock_news_controller():
     """Create a news controller with mocked dependencies."""
-    return NewsController()
+    _news_cache.clear()
+    _article_cache.clear()
+    _empty_news_cache.clear()
+    yield NewsController()
+    _news_cache.clear()
+    _article_cache.clear()
+    _empty_news_cache.clear()
 
 
 def test_get_ticker_news_with_polygon_success(mock_news_controller):
@@ -278,5 +286,281 @@ def test_mock_news_data_structure(mock_news_controller):
             assert len(item.summary) > 0
 
 
+def test_ticker_news_cached_across_instances(mock_news_controller):
+    """Test fetched news is shared across controllers until refreshed."""
+    article = NewsArticle(
+        title="Cached headline",
+        url="https://example.com/cached",
+        published_utc="2024-01-15T10:30:00Z",
+        source="Example Wire"
+    )
+
+    with patch.object(NewsController, '_fetch_ticker_news', return_value=[article]) as mock_fetch:
+        assert mock_news_controller.get_ticker_news("AAPL") == [article]
+        assert NewsController().get_ticker_news("AAPL") == [article]
+        assert mock_fetch.call_count == 1
+
+        # Forced refresh bypasses the cache
+        mock_news_controller.get_ticker_news("AAPL", use_cache=False)
+        assert mock_fetch.call_count == 2
+
+    # Mock data is never cached
+    with patch.object(NewsController, '_fetch_ticker_news',
+                      return_value=mock_news_controller._get_mock_news("MSFT")) as mock_fetch:
+        mock_news_controller.get_ticker_news("MSFT")
+        mock_news_controller.get_ticker_news("MSFT")
+        assert mock_fetch.call_count == 2
+
+
+def test_cached_news_evicts_expired_articles(mock_news_controller):
+    """Test stored articles past the news TTL are dropped and trigger a refetch."""
+    from datetime import datetime, timezone
+    from controllers.news_controller import NEWS_TTL_SECONDS
+
+    articles = [
+        NewsArticle(title=f"Headline {i}", url=f"https://example.com/{i}",
+                    published_utc="2024-01-15T10:30:00Z", source="Example Wire")
+        for i in range(2)
+    ]
+    stored = mock_news_controller.format_news_for_storage(articles)
+    assert all("fetched_at" in article for article in stored["articles"])
+
+    last_update = datetime.now(timezone.utc)
+    with patch.object(NewsController, '_fetch_ticker_news', return_value=articles) as mock_fetch:
+        cached, was_fetched = mock_news_controller.get_cached_or_fresh_news("AAPL", last_update, stored)
+        assert cached == articles
+        assert not was_fetched
+
+        stored["articles"][0]["fetched_at"] -= NEWS_TTL_SECONDS + 1
+        assert mock_news_controller.parse_stored_news(stored, max_age=NEWS_TTL_SECONDS) == articles[1:]
+        _, was_fetched = mock_news_controller.get_cached_or_fresh_news("AAPL", last_update, stored)
+        assert was_fetched
+        assert mock_fetch.call_count == 1
+
+
+def test_ticker_news_smaller_limit_served_from_cache(mock_news_controller):
+    """Test a smaller limit reuses articles from an earlier, larger fetch."""
+    articles = [
+        NewsArticle(title=f"Headline {i}", url=f"https://example.com/{i}",
+                    published_utc="2024-01-15T10:30:00Z", source="Example Wire")
+        for i in range(5)
+    ]
+
+    with patch.object(NewsController, '_fetch_ticker_news', return_value=articles) as mock_fetch:
+        assert mock_news_controller.get_ticker_news("AAPL", limit=5) == articles
+        assert mock_news_controller.get_ticker_news("AAPL", limit=3) == articles[:3]
+        assert mock_fetch.call_count == 1
+
+        # A larger limit than was fetched needs a new request
+        mock_news_controller.get_ticker_news("AAPL", limit=10)
+        assert mock_fetch.call_count == 2
+
+
+def test_yahoo_news_retries_transient_errors(mock_news_controller):
+    """Test Yahoo news access is retried with backoff on decode errors."""
+    source = Source(name='Yahoo Finance', yf=Mock(), min_interval=0)
+    item = {'content': {'title': 'Recovered headline', 'pubDate': '2024-01-15T10:30:00Z',
+                        'canonicalUrl': {'url': 'https://example.com/recovered'}}}
+    ticker = Mock()
+    type(ticker).news = PropertyMock(side_effect=[ValueError("Expecting value"), [item]])
+    source.yf.Ticker.return_value = ticker
+
+    with patch('utils.retry.time.sleep') as mock_sleep:
+        articles = mock_news_controller._get_yahoo_news(source, "AAPL", 5)
+
+    assert [article.title for article in articles] == ['Recovered headline']
+    assert mock_sleep.call_count == 1
+
+
+def test_refresh_multiple_symbols_news(mock_news_controller):
+    """Test news for several symbols is fetched in parallel without fixed delays."""
+    def fake_news(symbol, limit, block=True):
+        if symbol == "FAIL":
+            raise RuntimeError("boom")
+        return [NewsArticle(title=f"{symbol} news", url=f"https://example.com/{symbol}",
+                            published_utc="2024-01-15T10:30:00Z", source="Example Wire")]
+
+    with patch.object(NewsController, 'get_ticker_news', side_effect=fake_news), \
+            patch('controllers.news_controller.time.sleep') as mock_sleep:
+        results = mock_news_controller.refresh_multiple_symbols_news(["AAPL", "FAIL", "MSFT"])
+
+    assert list(results) == ["AAPL", "FAIL", "MSFT"]
+    assert results["AAPL"][0].title == "AAPL news"
+    assert results["FAIL"] == []
+    mock_sleep.assert_not_called()
+
+
+def test_polygon_news_respects_token_bucket(mock_news_controller):
+    """Test Polygon requests stop once the token bucket is empty and 429s drain it."""
+    from utils.retry import TokenBucket
+
+    client = Mock()
+    client.list_ticker_news.return_value = []
+    source = Source(name='Polygon.io', client=client,
+                    bucket=TokenBucket(capacity=3, refill_frequency=60))
+
+    mock_news_controller._get_polygon_news(source, "AAPL", 5)
+    client.list_ticker_news.side_effect = Exception("429 Too Many Requests")
+    mock_news_controller._get_polygon_news(source, "AAPL", 5)
+    assert client.list_ticker_news.call_count == 2
+
+    # Two credits were spent and the 429 drained the one left
+    assert mock_news_controller._get_polygon_news(source, "AAPL", 5) == []
+    assert client.list_ticker_news.call_count == 2
+
+
+def test_refresh_multiple_symbols_uses_polygon_batch(mock_news_controller):
+    """Test one Polygon request serves several symbols and only the rest fall back."""
+    from utils.retry import TokenBucket
+
+    def polygon_result(title, tickers):
+        publisher = Mock()
+        publisher.name = "Example Wire"
+        return Mock(title=title, article_url=f"https://example.com/{title}",
+                    published_utc="2024-01-15T10:30:00Z", description="Summary",
+                    publisher=publisher, tickers=tickers)
+
+    client = Mock()
+    client.list_ticker_news.return_value = [
+        polygon_result("both", ["AAPL", "MSFT"]),
+        polygon_result("apple", ["AAPL"]),
+        polygon_result("other", ["TSLA"]),
+    ]
+    mock_news_controller.sources = [Source(name='Polygon.io', client=client,
+                                           bucket=TokenBucket(capacity=5, refill_frequency=12))]
+
+    with patch.object(NewsController, 'get_ticker_news', return_value=[]) as mock_single:
+        results = mock_news_controller.refresh_multiple_symbols_news(["AAPL", "MSFT", "GOOG"])
+
+    assert client.list_ticker_news.call_count == 1
+    assert [a.title for a in results["AAPL"]] == ["both", "apple"]
+    assert [a.title for a in results["MSFT"]] == ["both"]
+    assert results["GOOG"] == []
+    mock_single.assert_called_once_with("GOOG", mock_news_controller.max_articles_per_symbol,
+                                        block=False)
+
+
+def test_empty_ticker_news_is_negatively_cached(mock_news_controller):
+    """Test symbols with no news skip the sources until the short negative TTL ends."""
+    with patch.object(NewsController, '_fetch_ticker_news', return_value=[]) as mock_fetch:
+        assert mock_news_controller.get_ticker_news("BTC-USD") == []
+        assert mock_news_controller.get_ticker_news("BTC-USD", limit=3) == []
+        assert mock_fetch.call_count == 1
+
+        # Forced refreshes still go to the sources
+        mock_news_controller.get_ticker_news("BTC-USD", use_cache=False)
+        assert mock_fetch.call_count == 2
+
+
+def test_news_storage_uses_supplied_clock(mock_news_controller):
+    """Test a caller-supplied ``now`` stamps storage and drives cache validity."""
+    from datetime import datetime, timedelta, timezone
+
+    now = datetime(2025, 1, 6, 12, 0, tzinfo=timezone.utc)
+    article = NewsArticle(title="Headline", url="https://example.com/1",
+                          published_utc="2025-01-06T10:00:00Z", source="Example Wire")
+    stored = mock_news_controller.format_news_for_storage([article], now=now)
+
+    assert stored["last_updated"] == now.isoformat()
+    assert stored["articles"][0]["fetched_at"] == now.timestamp()
+    assert mock_news_controller.is_news_cache_valid(now - timedelta(hours=1), now=now)
+    assert not mock_news_controller.is_news_cache_valid(now - timedelta(hours=5), now=now)
+
+
+def test_news_article_is_immutable():
+    """Test articles shared through the caches cannot be mutated in place."""
+    import dataclasses
+
+    article = NewsArticle(title="Headline", url="https://example.com/1",
+                          published_utc="2025-01-06T10:00:00Z", source="Example Wire")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        article.title = "Changed"
+
+
+def test_news_storage_bytes_round_trip(mock_news_controller):
+    """Test the encoded storage blob parses back to the same articles."""
+    articles = [
+        NewsArticle(title="Headline", url="https://example.com/1",
+                    published_utc="2025-01-06T10:00:00Z", source="Example Wire",
+                    summary="Summary")
+    ]
+    blob = mock_news_controller.format_news_for_storage_bytes(articles)
+
+    assert isinstance(blob, bytes)
+    assert mock_news_controller.parse_stored_news(blob) == articles
+    assert mock_news_controller.parse_stored_news(blob.decode()) == articles
+
+
+def test_parse_iso_handles_utc_suffix():
+    """Test ISO timestamps parse to aware UTC and bad input yields None."""
+    from datetime import datetime, timezone
+    from controllers.news_controller import _parse_iso
+
+    expected = datetime(2025, 1, 6, 14, 30, tzinfo=timezone.utc)
+    assert _parse_iso("2025-01-06T14:30:00Z") == expected
+    assert _parse_iso("2025-01-06T14:30:00+00:00") == expected
+    assert _parse_iso("2025-01-06T14:30:00") == expected
+    assert _parse_iso("") is None
+    assert _parse_iso("not a date") is None
+
+
+def test_aggregated_sources_are_merged_without_duplicates(mock_news_controller):
+    """Test aggregate mode merges real sources by URL, newest first, without mock data."""
+    def article(url, published, source):
+        return NewsArticle(title=url, url=url, published_utc=published, source=source)
+
+    polygon = [article("https://example.com/a", "2025-01-06T10:00:00Z", "Polygon"),
+               article("https://example.com/b", "2025-01-05T10:00:00Z", "Polygon")]
+    yahoo = [article("https://example.com/b", "2025-01-05T10:00:00Z", "Yahoo"),
+             article("https://example.com/c", "2025-01-07T10:00:00Z", "Yahoo")]
+    fetched = {'Polygon.io': polygon, 'Yahoo Finance': yahoo}
+
+    mock_news_controller.aggregate_sources = True
+    mock_news_controller.sources = [Source(name='Polygon.io'), Source(name='Yahoo Finance'),
+                                    Source(name='Mock Data')]
+    with patch.object(NewsController, '_get_news_from_source',
+                      side_effect=lambda source, symbol, limit: fetched[source.name]):
+        articles = mock_news_controller.get_ticker_news("AAPL", use_cache=False)
+
+    assert [a.url for a in articles] == ["https://example.com/c", "https://example.com/a",
+                                         "https://example.com/b"]
+    assert articles[2].source == "Polygon"
+
+
+def test_refresh_multiple_symbols_reschedules_rate_limited_fetches(mock_news_controller):
+    """Test a rate-limited fetch frees its worker and is resubmitted after the wait."""
+    from utils.retry import RateLimited
+
+    attempts = []
+
+    def fake_news(symbol, limit, block=True):
+        assert not block
+        attempts.append(symbol)
+        if symbol == "MSFT" and attempts.count("MSFT") == 1:
+            raise RateLimited(0.05)
+        return [NewsArticle(title=f"{symbol} news", url=f"https://example.com/{symbol}",
+                            published_utc="2024-01-15T10:30:00Z", source="Example Wire")]
+
+    with patch.object(NewsController, 'get_ticker_news', side_effect=fake_news):
+        results = mock_news_controller.refresh_multiple_symbols_news(["AAPL", "MSFT"])
+
+    assert attempts.count("MSFT") == 2
+    assert results["MSFT"][0].title == "MSFT news"
+    assert results["AAPL"][0].title == "AAPL news"
+
+
+def test_yahoo_news_reports_rate_limit_without_sleeping(mock_news_controller):
+    """Test a Yahoo fetch inside the minimum interval raises RateLimited."""
+    from utils.retry import RateLimited
+    import time
+
+    source = Source(name='Yahoo Finance', yf=Mock(), min_interval=2,
+                    last_request_time=time.time())
+    with pytest.raises(RateLimited) as exc_info:
+        mock_news_controller._get_yahoo_news(source, "AAPL", 5)
+    assert 0 < exc_info.value.retry_after <= 2
+    source.yf.Ticker.assert_not_called()
+
+
 if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
\ No newline at end of file
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,490 @@
+"""Unit tests for PortfolioController."""
+
+import pytest
+from controllers.portfolio_controller import (
+    PortfolioController,
+    PortfolioCreate,
+    PortfolioUpdate,
+    HoldingCreate,
+    HoldingUpdate
+)
+from models.portfolio import Portfolio
+
+
+def test_portfolio_summary_is_cached_until_holdings_change(client, test_db):
+    """Test portfolio summary is memoized and invalidated by holding changes."""
+    from models.database import TestingSessionLocal
+    db = TestingSessionLocal()
+
+    try:
+        controller = PortfolioController(db)
+        portfolio = controller.create_portfolio(PortfolioCreate(name="Summary Portfolio"))
+        holding = controller.add_holding(
+            portfolio.id, HoldingCreate(symbol="$CASH", shares=1000.0, target_allocation=100.0)
+        )
+        holding.last_price = 1.0
+        db.commit()
+
+        summary = controller.calculate_portfolio_summary(portfolio.id)
+        assert summary["total_holdings"] == 1
+        assert summary["total_value"] == 1000.0
+
+        # Same portfolio version is served from the cache
+        calls = []
+        original = controller._compute_portfolio_summary
+        controller._compute_portfolio_summary = lambda pid: calls.append(pid) or original(pid)
+        assert controller.calculate_portfolio_summary(portfolio.id) == summary
+        assert calls == []
+
+        # Updating a holding bumps the portfolio's modified_date and misses the cache
+        previous_modified = db.get(Portfolio, portfolio.id).modified_date
+        controller.update_holding(
+            portfolio.id, "$CASH", HoldingUpdate(shares=2500.0, target_allocation=100.0)
+        )
+        assert db.get(Portfolio, portfolio.id).modified_date > previous_modified
+
+        summary = controller.calculate_portfolio_summary(portfolio.id)
+        assert calls == [portfolio.id]
+        assert summary["total_value"] == 2500.0
+
+        # Adding a holding does the same
+        previous_modified = db.get(Portfolio, portfolio.id).modified_date
+        controller.add_holding(
+            portfolio.id, HoldingCreate(symbol="AAPL", shares=10.0, target_allocation=50.0)
+        )
+        assert db.get(Portfolio, portfolio.id).modified_date > previous_modified
+
+        summary = controller.calculate_portfolio_summary(portfolio.id)
+        assert calls == [portfolio.id, portfolio.id]
+        assert summary["total_holdings"] == 2
+    finally:
+        db.close()
+
+
+def test_portfolio_summary_nonexistent_portfolio(client, test_db):
+    """Test portfolio summary for a missing portfolio is empty."""
+    from models.database import TestingSessionLocal
+    db = TestingSessionLocal()
+
+    try:
+        controller = PortfolioController(db)
+        summary = controller.calculate_portfolio_summary(999)
+
+        assert summary["total_holdings"] == 0
+        assert summary["total_value"] == 0
+    finally:
+        db.close()
+
+
+def test_refresh_prices_nonexistent_portfolio(client, test_db):
+    """Test refreshing prices for a missing portfolio returns None."""
+    from models.database import TestingSessionLocal
+    db = TestingSessionLocal()
+
+    try:
+        controller = PortfolioController(db)
+        assert controller.refresh_portfolio_prices(999) is None
+
+        portfolio = controller.create_portfolio(PortfolioCreate(name="Empty Portfolio"))
+        result = controller.refresh_portfolio_prices(portfolio.id)
+        assert result["success"] is True
+        assert result["total_count"] == 0
+    finally:
+        db.close()
+
+
+def test_single_holding_price_reuses_recent_fetch(client, test_db):
+    """Test a single-holding update right after a refresh skips the upstream call."""
+    from unittest.mock import MagicMock
+    from models.database import TestingSessionLocal
+    db = TestingSessionLocal()
+
+    try:
+        controller = PortfolioController(db)
+        portfolio = controller.create_portfolio(PortfolioCreate(name="Price Reuse Portfolio"))
+        controller.add_holding(portfolio.id, HoldingCreate(symbol="AAPL", shares=1, target_allocation=100.0))
+        stocks = controller.stock_data_controller = MagicMock()
+        stocks.refresh_portfolio_prices.return_value = {"AAPL": MagicMock(price=150.0)}
+
+        assert controller.refresh_portfolio_prices(portfolio.id)["updated_count"] == 1
+        result = controller.update_single_holding_price(portfolio.id, "AAPL")
+        assert result["price"] == 150.0
+        stocks.get_stock_price.assert_not_called()
+
+        controller._price_cache.clear()
+        stocks.get_stock_price.return_value = MagicMock(price=155.0)
+        assert controller.update_single_holding_price(portfolio.id, "AAPL")["price"] == 155.0
+        assert controller.update_single_holding_price(portfolio.id, "AAPL")["price"] == 155.0
+        stocks.get_stock_price.assert_called_once_with("AAPL", use_cache=False)
+    finally:
+        db.close()
+
+
+
+def test_add_holdings_bulk(client, test_db):
+    """Test bulk-adding holdings skips existing symbols and bumps the portfolio version."""
+    from models.database import TestingSessionLocal
+    db = TestingSessionLocal()
+
+    try:
+        controller = PortfolioController(db)
+        with pytest.raises(ValueError):
+            controller.add_holdings_bulk(999, [])
+
+        portfolio = controller.create_portfolio(PortfolioCreate(name="Bulk Portfolio"))
+        controller.add_holding(
+            portfolio.id, HoldingCreate(symbol="AAPL", shares=10, target_allocation=50.0)
+        )
+        previous_modified = db.get(Portfolio, portfolio.id).modified_date
+
+        added_count, errors = controller.add_holdings_bulk(portfolio.id, [
+            HoldingCreate(symbol="AAPL", shares=5, target_allocation=10.0),
+            HoldingCreate(symbol="MSFT", shares=20, target_allocation=30.0),
+            HoldingCreate(symbol="BND", shares=100, target_allocation=20.0),
+        ])
+
+        assert added_count == 2
+        assert errors == ["Holding for AAPL already exists in this portfolio"]
+        holdings = controller.get_portfolio_holdings(portfolio.id)
+        assert [h.symbol for h in holdings] == ["AAPL", "BND", "MSFT"]
+        assert holdings[0].shares == 10
+        db.expire_all()
+        assert db.get(Portfolio, portfolio.id).modified_date > previous_modified
+    finally:
+        db.close()
+
+
+def test_import_holdings_from_csv_replaces_holdings(client, test_db):
+    """Test a CSV import replaces the portfolio's holdings in one batch."""
+    from models.database import TestingSessionLocal
+    from utils.csv_parser import CSVHoldingData
+    db = TestingSessionLocal()
+
+    try:
+        controller = PortfolioController(db)
+        with pytest.raises(ValueError):
+            controller.import_holdings_from_csv(999, [])
+
+        portfolio = controller.create_portfolio(PortfolioCreate(name="Import Portfolio"))
+        controller.add_holding(
+            portfolio.id, HoldingCreate(symbol="AAPL", shares=10, target_allocation=100.0)
+        )
+        previous_modified = db.get(Portfolio, portfolio.id).modified_date
+
+        result = controller.import_holdings_from_csv(portfolio.id, [
+            CSVHoldingData(symbol="MSFT", shares=20, allocation=60.0),
+            CSVHoldingData(symbol="BND", shares=100, allocation=40.0),
+        ])
+
+        assert result == {"imported_count": 2, "errors": [], "success": True}
+        holdings = controller.get_portfolio_holdings(portfolio.id)
+        assert [(h.symbol, h.shares, h.target_allocation) for h in holdings] == [
+            ("BND", 100, 40.0), ("MSFT", 20, 60.0)
+        ]
+        db.expire_all()
+        assert db.get(Portfolio, portfolio.id).modified_date > previous_modified
+
+        # Large imports are inserted in batches within the same transaction
+        from unittest.mock import patch
+        symbols = [f"S{i}" for i in range(5)]
+        with patch("controllers.portfolio_controller.IMPORT_BATCH_SIZE", 2), \
+                patch.object(db, "bulk_insert_mappings", wraps=db.bulk_insert_mappings) as mock_insert:
+            result = controller.import_holdings_from_csv(portfolio.id, [
+                CSVHoldingData(symbol=symbol, shares=1, allocation=20.0) for symbol in symbols
+            ])
+        assert result["imported_count"] == 5
+        assert [len(c.args[1]) for c in mock_insert.call_args_list] == [2, 2, 1]
+        assert [h.symbol for h in controller.get_portfolio_holdings(portfolio.id)] == symbols
+    finally:
+        db.close()
+
+
+def test_get_portfolios_eager_loads_holdings(client, test_db):
+    """Test portfolio lists load holdings up front or refuse lazy loads."""
+    from sqlalchemy import inspect
+    from sqlalchemy.exc import InvalidRequestError
+    from models.database import TestingSessionLocal
+    db = TestingSessionLocal()
+
+    try:
+        controller = PortfolioController(db)
+        portfolio = controller.create_portfolio(PortfolioCreate(name="Eager Portfolio"))
+        controller.add_holding(
+            portfolio.id, HoldingCreate(symbol="AAPL", shares=10, target_allocation=100.0)
+        )
+        db.expire_all()
+
+        portfolios = controller.get_portfolios()
+        assert all("holdings" not in inspect(p).unloaded for p in portfolios)
+        assert [len(p.holdings) for p in portfolios] == [1]
+
+        db.expire_all()
+        portfolios = controller.get_portfolios(load_holdings=False)
+        with pytest.raises(InvalidRequestError):
+            portfolios[0].holdings
+
+        controller.add_holding(
+            portfolio.id, HoldingCreate(symbol="$CASH", shares=100.0, target_allocation=10.0)
+        )
+        db.expire_all()
+        loaded = controller.get_portfolio_with_holdings(portfolio.id)
+        assert "holdings" not in inspect(loaded).unloaded
+        assert [h.symbol for h in loaded.holdings] == ["$CASH", "AAPL"]
+        assert controller.get_portfolio_with_holdings(999) is None
+    finally:
+        db.close()
+
+
+def test_unique_constraints_reject_duplicates(client, test_db):
+    """Test duplicate names and symbols are rejected by the database constraints."""
+    from models.database import TestingSessionLocal
+    db = TestingSessionLocal()
+
+    try:
+        controller = PortfolioController(db)
+        first = controller.create_portfolio(PortfolioCreate(name="First"))
+        second = controller.create_portfolio(PortfolioCreate(name="Second"))
+
+        with pytest.raises(ValueError, match="already exists"):
+            controller.update_portfolio(second.id, PortfolioUpdate(name="First"))
+        assert controller.update_portfolio(first.id, PortfolioUpdate(name="First")).name == "First"
+
+        holding = HoldingCreate(symbol="AAPL", shares=10, target_allocation=100.0)
+        assert controller.add_holding(999, holding) is None
+        controller.add_holding(first.id, holding)
+        with pytest.raises(ValueError, match="already exists"):
+            controller.add_holding(first.id, holding)
+
+        previous_modified = db.get(Portfolio, first.id).modified_date
+        assert controller.delete_holding(first.id, "AAPL")
+        assert not controller.delete_holding(first.id, "AAPL")
+        assert controller.get_portfolio_holdings(first.id) == []
+        db.expire_all()
+        assert db.get(Portfolio, first.id).modified_date > previous_modified
+    finally:
+        db.close()
+
+
+def test_portfolio_valuation_allocations_and_drift(client, test_db):
+    """Test valuation computes allocations, drift and price coverage."""
+    from models.database import TestingSessionLocal
+    db = TestingSessionLocal()
+
+    try:
+        controller = PortfolioController(db)
+        portfolio = controller.create_portfolio(PortfolioCreate(name="Valuation Portfolio"))
+        for symbol, shares, target in [("$CASH", 250.0, 25.0), ("AAPL", 5, 50.0), ("MSFT", 1, 25.0)]:
+            controller.add_holding(
+                portfolio.id, HoldingCreate(symbol=symbol, shares=shares, target_allocation=target)
+            )
+        for holding in controller.get_portfolio_holdings(portfolio.id):
+            holding.last_price = {"$CASH": 1.0, "AAPL": 150.0}.get(holding.symbol)
+        db.commit()
+
+        valuation = controller.get_portfolio_valuation(portfolio.id)
+
+        assert valuation["total_value"] == 1000.0
+        breakdown = {row["symbol"]: row for row in valuation["holdings_breakdown"]}
+        assert breakdown["$CASH"]["current_allocation"] == pytest.approx(25.0)
+        assert breakdown["AAPL"]["current_allocation"] == pytest.approx(75.0)
+        assert breakdown["MSFT"]["current_price"] is None
+        assert breakdown["MSFT"]["current_allocation"] == 0.0
+        drifts = {d["symbol"]: d["drift"] for d in valuation["allocation_analysis"]["significant_drifts"]}
+        assert drifts == {"AAPL": pytest.approx(25.0), "MSFT": pytest.approx(-25.0)}
+        assert valuation["allocation_analysis"]["is_allocation_valid"]
+        assert controller.get_significant_drifts(portfolio.id) == [
+            {"symbol": d["symbol"], "target": d["target"], "current": pytest.approx(d["current"]),
+             "drift": pytest.approx(d["drift"])}
+            for d in valuation["allocation_analysis"]["significant_drifts"]
+        ]
+        assert [d["symbol"] for d in controller.get_significant_drifts(portfolio.id, threshold=30.0)] == []
+        assert valuation["holdings_with_prices"] == 2
+
+        summary = controller.calculate_portfolio_summary(portfolio.id)
+        assert summary == {
+            "total_holdings": 3,
+            "total_value": pytest.approx(1000.0),
+            "total_target_allocation": pytest.approx(100.0),
+            "is_allocation_valid": True,
+            "holdings_with_prices": 2
+        }
+
+        # Valuation loads only the columns it reads
+        from sqlalchemy import inspect
+        db.expunge_all()
+        lean = controller._get_lean_holdings(portfolio.id)
+        assert [h.symbol for h in lean] == ["$CASH", "AAPL", "MSFT"]
+        assert all(inspect(h).unloaded == {"portfolio_id", "portfolio"} for h in lean)
+    finally:
+        db.close()
+
+
+def test_portfolio_valuation_without_prices_reports_no_drift(client, test_db):
+    """Test an unpriced portfolio lists its holdings but no allocation drift."""
+    from models.database import TestingSessionLocal
+    db = TestingSessionLocal()
+
+    try:
+        controller = PortfolioController(db)
+        portfolio = controller.create_portfolio(PortfolioCreate(name="Unpriced Portfolio"))
+        for symbol, target in [("AAPL", 60.0), ("MSFT", 40.0)]:
+            controller.add_holding(
+                portfolio.id, HoldingCreate(symbol=symbol, shares=1, target_allocation=target)
+            )
+
+        valuation = controller.get_portfolio_valuation(portfolio.id)
+
+        assert valuation["total_value"] == 0.0
+        assert [row["current_allocation"] for row in valuation["holdings_breakdown"]] == [0.0, 0.0]
+        assert valuation["allocation_analysis"]["significant_drifts"] == []
+        assert valuation["price_coverage"] == 0
+        assert controller.get_significant_drifts(portfolio.id) == []
+    finally:
+        db.close()
+
+
+def test_holding_lookups_use_composite_index():
+    """Test holding lookups seek the (portfolio_id, symbol) index, also on old tables."""
+    from sqlalchemy import create_engine, inspect, text
+    from models.database import Base, create_missing_indexes
+
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.exec_driver_sql("DROP INDEX ix_holdings_pf_sym")
+    create_missing_indexes(bind=engine)
+    assert "ix_holdings_pf_sym" in {index["name"] for index in inspect(engine).get_indexes("holdings")}
+
+    with engine.connect() as conn:
+        for query in ("SELECT * FROM holdings WHERE portfolio_id = 1 AND symbol = 'AAPL'",
+                      "SELECT * FROM holdings WHERE portfolio_id = 1 ORDER BY symbol"):
+            plan = " ".join(row[-1] for row in conn.execute(text(f"EXPLAIN QUERY PLAN {query}")))
+            assert "USING INDEX ix_holdings_pf_sym" in plan
+            assert "TEMP B-TREE" not in plan
+
+
+@pytest.mark.parametrize("index_name, rows", [
+    ("ix_portfolios_name_unique", [
+        "INSERT INTO portfolios (name, created_date, modified_date) VALUES ('Dup', '2025-01-01', '2025-01-01')",
+    ] * 2),
+    ("ix_holdings_pf_sym", [
+        "INSERT INTO portfolios (id, name, created_date, modified_date) VALUES (1, 'Old', '2025-01-01', '2025-01-01')",
+    ] + [
+        "INSERT INTO holdings (portfolio_id, symbol, shares, target_allocation) VALUES (1, 'AAPL', 1, 50)",
+    ] * 2),
+])
+def test_duplicates_on_old_tables_stop_startup(index_name, rows):
+    """Test duplicate rows that block a unique index fail startup instead of being ignored."""
+    from sqlalchemy import create_engine
+    from models.database import Base, create_missing_indexes
+
+    # Without the index, duplicate names and symbols would be inserted silently
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.exec_driver_sql(f"DROP INDEX {index_name}")
+        for row in rows:
+            conn.exec_driver_sql(row)
+
+    with pytest.raises(RuntimeError, match=index_name):
+        create_missing_indexes(bind=engine)
+
+
+def test_engine_pool_sized_for_request_threads():
+    """Test file databases get a pool sized for the request threadpool."""
+    from sqlalchemy import create_engine
+    from models.database import _pool_options
+
+    assert _pool_options("sqlite:///:memory:") == {}
+    assert _pool_options("sqlite:///data/app.db") == {"pool_size": 20, "max_overflow": 20}
+    server = _pool_options("postgresql://user@db/portfolios")
+    assert server["pool_pre_ping"] and server["pool_recycle"] == 1800
+
+    engine = create_engine("sqlite:///data/app.db", **_pool_options("sqlite:///data/app.db"))
+    assert engine.pool.size() == 20
+
+
+def test_unit_of_work_commits_once(client, test_db):
+    """Test mutations inside a unit of work share one commit and roll back together."""
+    from unittest.mock import patch
+    from models.database import TestingSessionLocal
+    db = TestingSessionLocal()
+
+    try:
+        controller = PortfolioController(db)
+        portfolio = controller.create_portfolio(PortfolioCreate(name="Unit Portfolio"))
+
+        with patch.object(db, "commit", wraps=db.commit) as mock_commit:
+            with controller.unit_of_work():
+                controller.add_holding(
+                    portfolio.id, HoldingCreate(symbol="AAPL", shares=10, target_allocation=60.0)
+                )
+                controller.add_holding(
+                    portfolio.id, HoldingCreate(symbol="MSFT", shares=5, target_allocation=40.0)
+                )
+        assert mock_commit.call_count == 1
+
+        with pytest.raises(ValueError):
+            with controller.unit_of_work():
+                controller.delete_holding(portfolio.id, "AAPL")
+                controller.add_holding(
+                    portfolio.id, HoldingCreate(symbol="MSFT", shares=1, target_allocation=40.0)
+                )
+        assert [h.symbol for h in controller.get_portfolio_holdings(portfolio.id)] == ["AAPL", "MSFT"]
+    finally:
+        db.close()
+
+
+def test_stock_data_controller_created_on_first_use(client, test_db):
+    """Test CRUD-only controllers never build the price service."""
+    from controllers.stock_data_controller import StockDataController
+    from models.database import TestingSessionLocal
+    db = TestingSessionLocal()
+
+    try:
+        controller = PortfolioController(db)
+        controller.create_portfolio(PortfolioCreate(name="Lazy Portfolio"))
+        assert "stock_data_controller" not in vars(controller)
+
+        stocks = controller.stock_data_controller
+        assert isinstance(stocks, StockDataController)
+        assert controller.stock_data_controller is stocks
+    finally:
+        db.close()
+
+
+def test_writes_return_objects_without_reloading(client, test_db):
+    """Test created and updated objects are readable without another SELECT."""
+    from sqlalchemy import event
+    from models.database import TestingSessionLocal
+    db = TestingSessionLocal()
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    engine = db.get_bind()
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        controller = PortfolioController(db)
+        portfolio = controller.create_portfolio(PortfolioCreate(name="Write Portfolio"))
+        holding = controller.add_holding(
+            portfolio.id, HoldingCreate(symbol="AAPL", shares=10, target_allocation=100.0)
+        )
+        holding = controller.update_holding(
+            portfolio.id, "AAPL", HoldingUpdate(shares=12, target_allocation=100.0)
+        )
+
+        statements.clear()
+        assert (portfolio.name, holding.symbol, holding.shares) == ("Write Portfolio", "AAPL", 12)
+        assert portfolio.modified_date.tzinfo is None
+        assert statements == []
+        assert portfolio.holdings == [holding]
+
+        # Kept objects match what a fresh load returns
+        modified = portfolio.modified_date
+        db.expire_all()
+        assert portfolio.modified_date == modified
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+        db.close()
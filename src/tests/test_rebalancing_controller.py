@@ -346,5 +346,256 @@ def test_high_tolerance_vs_low_tolerance(setup_test_portfolio):
         db.close()
 
 
+def test_analysis_cached_until_portfolio_changes(setup_test_portfolio):
+    """Test rebalancing analysis is reused until the portfolio's holdings change."""
+    portfolio, mock_prices = setup_test_portfolio
+    from models.database import TestingSessionLocal
+    db = TestingSessionLocal()
+    
+    try:
+        rebalancing_controller = RebalancingController(db)
+        first = rebalancing_controller.analyze_portfolio_rebalancing(portfolio.id)
+        second = rebalancing_controller.analyze_portfolio_rebalancing(portfolio.id)
+        assert second is first
+        
+        # Cached analyses are shared, so their records cannot be changed in place
+        from dataclasses import FrozenInstanceError
+        with pytest.raises(FrozenInstanceError):
+            first.is_balanced = True
+        with pytest.raises(FrozenInstanceError):
+            first.allocation_drifts[0].drift = 0.0
+        
+        # Different settings are cached separately
+        other = rebalancing_controller.analyze_portfolio_rebalancing(portfolio.id, custom_tolerance=50.0)
+        assert other is not first
+        assert other.is_balanced is True
+        
+        # Changing a price invalidates the cached analysis
+        holding = db.query(Holding).filter(
+            Holding.portfolio_id == portfolio.id, Holding.symbol == "AAPL"
+        ).first()
+        holding.last_price = 300.0
+        db.commit()
+        
+        refreshed = rebalancing_controller.analyze_portfolio_rebalancing(portfolio.id)
+        assert refreshed is not first
+        assert refreshed.total_value == first.total_value + 10 * 150.0
+    finally:
+        db.close()
+
+
+def test_execute_rebalancing_from_analysis(setup_test_portfolio):
+    """Test executing the transactions of an existing analysis."""
+    portfolio, mock_prices = setup_test_portfolio
+    from models.database import TestingSessionLocal
+    db = TestingSessionLocal()
+    
+    try:
+        rebalancing_controller = RebalancingController(db)
+        analysis = rebalancing_controller.analyze_portfolio_rebalancing(portfolio.id)
+        assert analysis.transactions
+        
+        dry_run = rebalancing_controller.execute_rebalancing(analysis)
+        assert dry_run["executed"] is False
+        assert dry_run["transactions_count"] == len(analysis.transactions)
+        
+        result = rebalancing_controller.execute_rebalancing(analysis, dry_run=False)
+        assert result["success"] is True
+        assert result["transactions_count"] == len(analysis.transactions)
+        
+        # Executed trades bring the portfolio back into balance
+        rebalanced = rebalancing_controller.analyze_portfolio_rebalancing(portfolio.id)
+        assert rebalanced.is_balanced is True
+        
+        # Portfolio ID form still requires an explicit transactions list
+        with pytest.raises(ValueError):
+            rebalancing_controller.execute_rebalancing(portfolio.id)
+    finally:
+        db.close()
+
+
+def test_transaction_symbols_interned():
+    """Test transaction symbols are interned for holdings_map lookups."""
+    import sys
+    from controllers.rebalancing_controller import RebalancingTransaction
+    
+    symbol = "".join(["AA", "PL"])
+    transaction = RebalancingTransaction(
+        symbol=symbol, action="BUY", shares=1.0, current_price=10.0,
+        transaction_value=10.0, transaction_cost=0.0, reason="test"
+    )
+    assert transaction.symbol is sys.intern("AAPL")
+
+
+def test_execute_reuses_holdings_loaded_by_analysis(setup_test_portfolio):
+    """Test analyze then execute in one controller loads the holdings once."""
+    from sqlalchemy import event
+    from controllers.rebalancing_controller import _analysis_cache
+    portfolio, mock_prices = setup_test_portfolio
+    from models.database import TestingSessionLocal
+    db = TestingSessionLocal()
+    holdings_queries = []
+    
+    def record(conn, cursor, statement, *args):
+        if "FROM holdings" in statement:
+            holdings_queries.append(statement)
+    
+    engine = db.get_bind()
+    _analysis_cache.clear()
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        rebalancing_controller = RebalancingController(db)
+        analysis = rebalancing_controller.analyze_portfolio_rebalancing(portfolio.id)
+        result = rebalancing_controller.execute_rebalancing(analysis, dry_run=False)
+        
+        assert result["transactions_count"] == len(analysis.transactions) > 0
+        assert len(holdings_queries) == 1
+        
+        # Executing changes the holdings, so the next analysis reloads them
+        assert rebalancing_controller.analyze_portfolio_rebalancing(portfolio.id).is_balanced
+        assert len(holdings_queries) > 1
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+        db.close()
+
+
+def test_feasibility_and_summary_from_totals(setup_test_portfolio):
+    """Test feasibility and summary checks use portfolio totals before holdings."""
+    from unittest.mock import patch
+    portfolio, mock_prices = setup_test_portfolio
+    from models.database import TestingSessionLocal
+    db = TestingSessionLocal()
+    
+    try:
+        rebalancing_controller = RebalancingController(db)
+        assert rebalancing_controller.validate_rebalancing_feasibility(999)["issues"] == ["Portfolio not found"]
+        
+        feasibility = rebalancing_controller.validate_rebalancing_feasibility(portfolio.id)
+        assert feasibility["feasible"] is True
+        assert feasibility["holdings_count"] == feasibility["holdings_with_prices"] == 4
+        analysis = rebalancing_controller.analyze_portfolio_rebalancing(portfolio.id)
+        assert feasibility["total_value"] == pytest.approx(analysis.total_value)
+        
+        for holding in db.query(Holding).filter(Holding.portfolio_id == portfolio.id):
+            if holding.symbol in ("AAPL", "TSLA"):
+                holding.last_price = None
+        db.commit()
+        feasibility = rebalancing_controller.validate_rebalancing_feasibility(portfolio.id)
+        assert feasibility["issues"] == ["Missing current prices for: AAPL, TSLA"]
+        assert feasibility["holdings_with_prices"] == 2
+        
+        for holding in db.query(Holding).filter(Holding.portfolio_id == portfolio.id):
+            holding.last_price = None
+        db.commit()
+        with patch.object(rebalancing_controller.portfolio_controller, "get_portfolio_holdings") as mock_holdings:
+            summary = rebalancing_controller.get_rebalancing_summary(portfolio.id)
+        assert "no current market value" in summary["error"]
+        mock_holdings.assert_not_called()
+    finally:
+        db.close()
+
+
+def test_rebalancing_summary_memoized_per_portfolio_version(setup_test_portfolio):
+    """Test summaries are reused until the portfolio changes."""
+    from unittest.mock import patch
+    portfolio, mock_prices = setup_test_portfolio
+    from models.database import TestingSessionLocal
+    db = TestingSessionLocal()
+    
+    try:
+        rebalancing_controller = RebalancingController(db)
+        summary = rebalancing_controller.get_rebalancing_summary(portfolio.id)
+        assert summary["needs_rebalancing"] is True
+        assert summary["max_drift"] > rebalancing_controller.tolerance_threshold
+        
+        with patch.object(rebalancing_controller, "analyze_portfolio_rebalancing") as mock_analyze:
+            assert rebalancing_controller.get_rebalancing_summary(portfolio.id) == summary
+            assert RebalancingController(db, transaction_cost_rate=0.01).get_rebalancing_summary(
+                portfolio.id
+            )["estimated_transaction_cost"] != summary["estimated_transaction_cost"]
+        mock_analyze.assert_not_called()
+        
+        rebalancing_controller.execute_rebalancing(
+            rebalancing_controller.analyze_portfolio_rebalancing(portfolio.id), dry_run=False
+        )
+        assert rebalancing_controller.get_rebalancing_summary(portfolio.id)["needs_rebalancing"] is False
+    finally:
+        db.close()
+
+
+def test_analysis_drift_aggregates(setup_test_portfolio):
+    """Test vectorized drift aggregates match the per-holding drifts."""
+    portfolio, mock_prices = setup_test_portfolio
+    from models.database import TestingSessionLocal
+    db = TestingSessionLocal()
+    
+    try:
+        rebalancing_controller = RebalancingController(db)
+        analysis = rebalancing_controller.analyze_portfolio_rebalancing(portfolio.id)
+        drifts = analysis.allocation_drifts
+        
+        assert analysis.total_value_to_trade() == pytest.approx(
+            sum(abs(drift.value_difference) for drift in drifts)
+        )
+        for tolerance in (0.0, 2.0, 100.0):
+            indices = analysis.significant_drift_indices(tolerance)
+            assert [drifts[i].symbol for i in indices] == [
+                drift.symbol for drift in drifts if abs(drift.drift) > tolerance
+            ]
+    finally:
+        db.close()
+
+
+def test_rebalancing_kernels():
+    """Test the drift and trade kernels on a small set of holdings."""
+    import numpy as np
+    from utils.rebalancing_kernels import (
+        ACTION_BUY, ACTION_NONE, ACTION_SELL,
+        compute_allocation_drifts, compute_rebalancing_trades
+    )
+    
+    current_values = np.array([600.0, 400.0, 0.0])
+    target_pcts = np.array([50.0, 50.0, 0.0])
+    prices = np.array([10.0, 20.0, 0.0])
+    
+    current_allocations, drifts, drift_percentages, target_values, value_differences = (
+        compute_allocation_drifts(current_values, target_pcts, 1000.0)
+    )
+    assert current_allocations.tolist() == [60.0, 40.0, 0.0]
+    assert drifts.tolist() == [10.0, -10.0, 0.0]
+    assert drift_percentages.tolist() == [20.0, -20.0, 0.0]
+    assert target_values.tolist() == [500.0, 500.0, 0.0]
+    assert value_differences.tolist() == [100.0, -100.0, 0.0]
+    
+    action_codes, shares, transaction_values, transaction_costs = compute_rebalancing_trades(
+        drifts, value_differences, prices, 0.01, 2.0, 0.1
+    )
+    assert action_codes.tolist() == [ACTION_SELL, ACTION_BUY, ACTION_NONE]
+    assert shares.tolist() == [10.0, 5.0, 0.0]
+    assert transaction_values.tolist() == [100.0, 100.0, 0.0]
+    assert transaction_costs.tolist() == [1.0, 1.0, 0.0]
+    
+    # Unpriced holdings and trades under min_shares are left alone
+    action_codes, shares, _, _ = compute_rebalancing_trades(
+        np.array([5.0, -5.0, 5.0]), np.array([50.0, -0.5, 50.0]),
+        np.array([10.0, 10.0, 0.0]), 0.0, 2.0, 0.1
+    )
+    assert action_codes.tolist() == [ACTION_SELL, ACTION_NONE, ACTION_NONE]
+    assert shares.tolist() == [5.0, 0.0, 0.0]
+
+
+def test_controllers_share_price_service():
+    """Test per-request controllers reuse one StockDataController."""
+    from models.database import TestingSessionLocal
+    db = TestingSessionLocal()
+    
+    try:
+        first = RebalancingController(db)
+        second = RebalancingController(db, tolerance_threshold=5.0)
+        assert first.stock_data_controller is second.stock_data_controller
+    finally:
+        db.close()
+
+
 if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
\ No newline at end of file
+    pytest.main([__file__, "-v"])
@@ -4,6 +4,7 @@ import pytest
 import sys
 import os
 import io
+from datetime import datetime
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -14,7 +15,7 @@ from sqlalchemy.orm import sessionmaker
 
 from web_server.app import app
 from models.database import get_db, Base
-from models.portfolio import Portfolio, Holding
+from models.portfolio import Portfolio, Holding, WatchedItem
 from utils.csv_parser import CSVPortfolioParser
 from controllers.portfolio_controller import PortfolioController, PortfolioCreate, HoldingCreate
 
@@ -120,6 +121,35 @@ AAPL,200,50.0"""
     assert "Duplicate symbol" in str(errors)
 
 
+def test_csv_parser_ragged_rows():
+    """Test CSV parser keeps ragged and badly quoted rows to themselves."""
+    parser = CSVPortfolioParser()
+
+    # Extra fields are ignored
+    holdings_data, errors, warnings = parser.parse_csv_content(
+        "Symbol,Shares,Allocation\nAAPL,10,50\nMSFT,5,50,extra\n"
+    )
+    assert errors == []
+    assert [(h.symbol, h.shares, h.allocation) for h in holdings_data] == [
+        ("AAPL", 10.0, 50.0), ("MSFT", 5.0, 50.0)
+    ]
+    assert all(isinstance(h.shares, float) and isinstance(h.allocation, float) for h in holdings_data)
+
+    # An extra field on the first data row doesn't shift the columns
+    holdings_data, errors, warnings = parser.parse_csv_content(
+        "Symbol,Shares,Allocation\nAAPL,10,50,extra\nMSFT,5,x\n"
+    )
+    assert [h.symbol for h in holdings_data] == ["AAPL"]
+    assert errors == ["Row 3, Allocation: Invalid allocation value: 'x'"]
+
+    # An unbalanced quote only fails the rows it swallows
+    holdings_data, errors, warnings = parser.parse_csv_content(
+        'Symbol,Shares,Allocation\nAAPL,10,50\n"MSFT,5,50\nGOOG,1,10\n'
+    )
+    assert [h.symbol for h in holdings_data] == ["AAPL"]
+    assert errors and all(error.startswith("Row 3") for error in errors)
+
+
 def test_holdings_api_create(client, test_db, sample_portfolio):
     """Test creating a holding via API."""
     holding_data = {
@@ -137,6 +167,73 @@ def test_holdings_api_create(client, test_db, sample_portfolio):
     assert data["target_allocation"] == 50.0
 
 
+def test_portfolio_api_json_response(client, test_db, sample_portfolio):
+    """Test portfolio API returns JSON with ISO-formatted dates."""
+    response = client.get(f"/api/portfolios/{sample_portfolio.id}")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    
+    data = response.json()
+    assert data["name"] == "Test Portfolio"
+    assert datetime.fromisoformat(data["modified_date"])
+    assert data["summary"]["total_holdings"] == 0
+
+
+def test_rebalancing_api_analysis(client, test_db, sample_portfolio):
+    """Test rebalancing analysis API serializes the full analysis."""
+    db = TestingSessionLocal()
+    try:
+        db.add_all([
+            Holding(portfolio_id=sample_portfolio.id, symbol="AAPL", shares=10,
+                    target_allocation=50.0, last_price=150.0),
+            Holding(portfolio_id=sample_portfolio.id, symbol="$CASH", shares=500,
+                    target_allocation=50.0, last_price=1.0)
+        ])
+        db.commit()
+    finally:
+        db.close()
+    
+    response = client.get(f"/api/rebalancing/portfolios/{sample_portfolio.id}/analysis")
+    assert response.status_code == 200
+    
+    data = response.json()
+    assert data["portfolio_id"] == sample_portfolio.id
+    assert data["total_value"] == 2000.0
+    assert data["is_balanced"] is False
+    assert datetime.fromisoformat(data["analysis_timestamp"])
+    assert {d["symbol"] for d in data["allocation_drifts"]} == {"AAPL", "$CASH"}
+    assert set(data["transactions"][0]) == {
+        "symbol", "action", "shares", "current_price",
+        "transaction_value", "transaction_cost", "reason"
+    }
+    
+    response = client.get(f"/api/rebalancing/portfolios/{sample_portfolio.id}/transactions")
+    assert response.status_code == 200
+    assert response.json()["transaction_count"] == len(data["transactions"])
+    
+    response = client.get(f"/api/rebalancing/portfolios/{sample_portfolio.id}/allocation-chart-data")
+    assert response.status_code == 200
+    chart = response.json()
+    assert chart["symbols"] == [d["symbol"] for d in data["allocation_drifts"]]
+    assert chart["current_values"] == [d["current_value"] for d in data["allocation_drifts"]]
+    assert chart["target_allocations"] == [50.0, 50.0]
+    
+    response = client.post(f"/api/rebalancing/portfolios/{sample_portfolio.id}/rebalance-preview")
+    assert response.status_code == 200
+    preview = response.json()
+    assert preview["impact"]["total_value_to_trade"] == 1000.0
+    assert {d["symbol"] for d in preview["significant_drifts"]} == {"AAPL", "$CASH"}
+    
+    response = client.post(
+        f"/api/rebalancing/portfolios/{sample_portfolio.id}/rebalance-preview?tolerance=50"
+    )
+    preview = response.json()
+    assert preview["impact"]["is_balanced"] is True
+    assert preview["impact"]["total_value_to_trade"] == 0.0
+    assert preview["impact"]["estimated_final_value"] == 2000.0
+    assert preview["significant_drifts"] == []
+
+
 def test_holdings_api_list(client, test_db, sample_portfolio):
     """Test listing holdings via API."""
     # First create a holding
@@ -257,6 +354,87 @@ def test_holdings_web_form_create(client, test_db, sample_portfolio):
     assert "AAPL" in response.text
 
 
+def test_holdings_web_form_missing_portfolio(client, test_db):
+    """Test web form mutations on a missing portfolio return 404."""
+    response = client.post("/portfolios/999/edit", data={"name": "Renamed"})
+    assert response.status_code == 404
+    
+    response = client.post("/portfolios/999/edit", data={"name": "   "})
+    assert response.status_code == 404
+    
+    form_data = {
+        "symbol": "AAPL",
+        "shares": 100,
+        "target_allocation": 50.0
+    }
+    response = client.post("/portfolios/999/holdings", data=form_data)
+    assert response.status_code == 404
+    
+    response = client.post("/portfolios/999/refresh-prices", follow_redirects=False)
+    assert response.status_code == 404
+
+
+def test_watchlist_api_missing_watchlist(client, test_db):
+    """Test watchlist item actions on a missing watchlist return 404."""
+    for response in (
+        client.get("/api/watchlists/999/items"),
+        client.get("/api/watchlists/999/validate-symbols"),
+        client.post("/api/watchlists/999/bulk-add", json=["AAPL"]),
+        client.request("DELETE", "/api/watchlists/999/bulk-remove", json=["AAPL"]),
+        client.post("/api/watchlists/999/reorder", json=[]),
+    ):
+        assert response.status_code == 404
+        assert response.json() == {"detail": "Watchlist not found"}
+    
+    watchlist = client.post("/api/watchlists/", json={"name": "Empty Watchlist"}).json()
+    response = client.get(f"/api/watchlists/{watchlist['id']}/items")
+    assert response.status_code == 200
+    assert response.json() == []
+
+
+def test_watchlist_item_news_lookup(client, test_db):
+    """Test news endpoints find the watched item or return 404."""
+    watchlist = client.post("/api/watchlists/", json={"name": "News Watchlist"}).json()
+    db = TestingSessionLocal()
+    try:
+        db.add(WatchedItem(watchlist_id=watchlist["id"], symbol="AAPL"))
+        db.commit()
+    finally:
+        db.close()
+    
+    response = client.get(f"/api/watchlists/{watchlist['id']}/items/AAPL/test-news")
+    assert response.json()["symbol"] == "AAPL"
+    assert response.json()["has_news_data"] is False
+    assert response.json()["articles"] == [{
+        "title": "Test News for AAPL",
+        "url": "https://example.com/test",
+        "published_utc": "2025-01-06T15:00:00Z",
+        "source": "Test Source",
+        "summary": "This is a test article to verify the news system is working."
+    }]
+    
+    response = client.get(f"/api/watchlists/{watchlist['id']}/items/MSFT/test-news")
+    assert response.json()["error"] == "Watched item not found"
+    
+    response = client.get(f"/api/watchlists/{watchlist['id']}/items/MSFT/news")
+    assert response.status_code == 404
+    
+    db = TestingSessionLocal()
+    try:
+        db.add(WatchedItem(watchlist_id=watchlist["id"], symbol="MSFT", news_data={
+            "articles": [{"title": "Mock", "source": "MarketWatch (Mock)"}]
+        }))
+        db.commit()
+    finally:
+        db.close()
+    
+    response = client.post(f"/api/watchlists/{watchlist['id']}/clear-mock-news")
+    assert response.json()["cleared_count"] == 1
+    assert response.json()["total_items"] == 2
+    response = client.get(f"/api/watchlists/{watchlist['id']}/items/MSFT/test-news")
+    assert response.json()["has_news_data"] is False
+
+
 def test_csv_import_web_form_display(client, test_db, sample_portfolio):
     """Test CSV import form display."""
     response = client.get(f"/portfolios/{sample_portfolio.id}/import")
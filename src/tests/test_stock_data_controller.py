@@ -9,7 +9,9 @@ from datetime import datetime, date, timedelta
 @pytest.fixture
 def mock_stock_controller():
     """Create a stock data controller for testing."""
-    return StockDataController()
+    controller = StockDataController()
+    controller.clear_cache()
+    return controller
 
 
 def test_get_current_price_success(mock_stock_controller):
@@ -347,5 +349,72 @@ def test_error_handling_robustness(mock_stock_controller):
             assert price is None
 
 
+def test_refresh_prices_uses_batch_download(mock_stock_controller):
+    """Test price refresh uses one batched download and falls back per symbol."""
+    import pandas as pd
+    import numpy as np
+    
+    dates = pd.date_range(start='2024-01-15', periods=2)
+    columns = pd.MultiIndex.from_product([['Close', 'Open'], ['AAPL', 'MSFT', 'BAD']])
+    mock_df = pd.DataFrame(
+        np.array([[149.0, 320.0, np.nan, 148.0, 319.0, np.nan],
+                  [150.0, np.nan, np.nan, 149.0, 321.0, np.nan]]),
+        index=dates,
+        columns=columns
+    )
+    
+    with patch('yfinance.download', return_value=mock_df) as mock_download, \
+         patch.object(mock_stock_controller, 'get_stock_price', return_value=None) as mock_get_price:
+        prices = mock_stock_controller.refresh_portfolio_prices(["AAPL", "msft", "BAD", "$CASH"])
+    
+    assert mock_download.call_count == 1
+    assert mock_download.call_args.kwargs['tickers'] == ["AAPL", "MSFT", "BAD"]
+    assert prices["AAPL"].price == 150.0
+    assert prices["MSFT"].price == 320.0  # Last non-missing close
+    assert prices["BAD"] is None
+    
+    # Only $CASH and the symbol missing from the batch were fetched individually
+    fetched = {c.args[0] for c in mock_get_price.call_args_list}
+    assert fetched == {"$CASH", "BAD"}
+
+
+def test_validate_symbols_checks_in_parallel(mock_stock_controller):
+    """Test symbols are validated concurrently, normalized, with cash always valid."""
+    def fake_ticker(symbol):
+        ticker = Mock()
+        if symbol == "BAD":
+            ticker.info = {}
+        elif symbol == "ERR":
+            type(ticker).info = property(lambda self: (_ for _ in ()).throw(RuntimeError("boom")))
+        else:
+            ticker.info = {'regularMarketPrice': 100.0}
+        return ticker
+
+    with patch('yfinance.Ticker', side_effect=fake_ticker) as mock_ticker:
+        results = mock_stock_controller.validate_symbols(["aapl", "BAD", "ERR", "$cash"])
+
+    assert results == {"AAPL": True, "BAD": False, "ERR": False, "$CASH": True}
+    assert mock_ticker.call_count == 3
+
+
+def test_validate_symbols_reuses_results_across_controllers(mock_stock_controller):
+    """Test validation results are shared process-wide, except lookup errors."""
+    def fake_ticker(symbol):
+        ticker = Mock()
+        if symbol == "ERR":
+            type(ticker).info = property(lambda self: (_ for _ in ()).throw(RuntimeError("boom")))
+        else:
+            ticker.info = {'regularMarketPrice': 100.0} if symbol == "AAPL" else {}
+        return ticker
+
+    with patch('yfinance.Ticker', side_effect=fake_ticker) as mock_ticker:
+        mock_stock_controller.validate_symbols(["AAPL", "BAD", "ERR"])
+        results = StockDataController().validate_symbols(["aapl", "BAD", "ERR"])
+
+    assert results == {"AAPL": True, "BAD": False, "ERR": False}
+    assert [c.args[0] for c in mock_ticker.call_args_list].count("ERR") == 2
+    assert mock_ticker.call_count == 4
+
+
 if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
\ No newline at end of file
+    pytest.main([__file__, "-v"])
@@ -34,6 +34,11 @@ class TestPortfolioValidation:
         # Should be trimmed or accepted depending on validation rules
         assert len(portfolio_data.name) <= 300
     
+    def test_portfolio_name_is_trimmed(self):
+        """Test surrounding whitespace is stripped from portfolio names."""
+        assert PortfolioCreate(name="  Growth  ").name == "Growth"
+        assert PortfolioUpdate(name="\tIncome\n").name == "Income"
+    
     def test_portfolio_update_valid(self):
         """Test valid portfolio update data."""
         update_data = PortfolioUpdate(name="Updated Portfolio")
@@ -59,6 +64,16 @@ class TestHoldingValidation:
         with pytest.raises(ValidationError):
             HoldingCreate(symbol="", shares=10.0, target_allocation=25.0)
     
+    def test_holding_create_symbol_format(self):
+        """Test holding symbol format validation."""
+        assert HoldingCreate(symbol=" brk.b ", shares=1.0, target_allocation=25.0).symbol == "BRK.B"
+        assert HoldingCreate(symbol="$cash", shares=1.0, target_allocation=25.0).symbol == "$CASH"
+        
+        with pytest.raises(ValidationError):
+            HoldingCreate(symbol="AA PL", shares=10.0, target_allocation=25.0)
+        with pytest.raises(ValidationError):
+            HoldingCreate(symbol="TOOLONGSYMBOL", shares=10.0, target_allocation=25.0)
+    
     def test_holding_create_negative_shares(self):
         """Test holding creation with negative shares."""
         with pytest.raises(ValidationError):
@@ -94,6 +109,13 @@ class TestHoldingValidation:
         )
         assert holding_data.shares == 2.5
     
+    def test_holding_update_bounds(self):
+        """Test share and allocation bounds on holding updates."""
+        with pytest.raises(ValidationError) as exc_info:
+            HoldingUpdate(shares=-1.0, target_allocation=0.0)
+        assert {e["type"] for e in exc_info.value.errors()} == {"greater_than_equal", "greater_than"}
+        assert HoldingUpdate(shares=0.0, target_allocation=100.0).target_allocation == 100.0
+    
     def test_holding_update_valid(self):
         """Test valid holding update data."""
         update_data = HoldingUpdate(shares=15.0, target_allocation=30.0)
@@ -169,6 +191,11 @@ class TestBusinessLogicValidation:
         invalid_allocations = [25.0, 30.0, 25.0]  # Sums to 80%
         invalid_total = sum(invalid_allocations)
         assert abs(invalid_total - 100.0) > 0.01
+        
+        from utils.validators import validate_allocation_sum
+        assert validate_allocation_sum(allocations) == (True, 100.0)
+        assert validate_allocation_sum(invalid_allocations) == (False, 80.0)
+        assert validate_allocation_sum([]) == (False, 0.0)
     
     def test_portfolio_value_calculation(self):
         """Test portfolio value calculation logic."""
@@ -238,6 +265,15 @@ class TestDataSanitization:
         assert normalize_symbol("") is None
         assert normalize_symbol(None) is None
     
+    def test_file_extension_validation(self):
+        """Test upload file extension validation."""
+        from utils.validators import CSV_EXTENSIONS, validate_file_extension
+        
+        assert validate_file_extension("holdings.CSV") is True
+        assert validate_file_extension("holdings.csv", CSV_EXTENSIONS) is True
+        assert validate_file_extension("holdings.xlsx", CSV_EXTENSIONS) is False
+        assert validate_file_extension("holdings", CSV_EXTENSIONS) is False
+    
     def test_name_sanitization(self):
         """Test name field sanitization."""
         def sanitize_name(name):
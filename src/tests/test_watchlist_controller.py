@@ -7,7 +7,8 @@ from controllers.watchlist_controller import (
     WatchlistCreate,
     WatchlistUpdate,
     WatchedItemCreate,
-    WatchedItemUpdate
+    WatchedItemUpdate,
+    WatchlistNotFound
 )
 from models.portfolio import Watchlist, WatchedItem
 
@@ -59,8 +60,10 @@ def test_create_watchlist_empty_name(client, test_db):
     try:
         controller = WatchlistController(db)
         
-        with pytest.raises(ValueError, match="cannot be empty"):
+        with pytest.raises(ValueError, match="at least 1 character"):
             WatchlistCreate(name="")
+        with pytest.raises(ValueError, match="at least 1 character"):
+            WatchlistUpdate(name="   ")
     finally:
         db.close()
 
@@ -229,6 +232,84 @@ def test_add_duplicate_watched_item(client, test_db):
         db.close()
 
 
+def test_bulk_add_watched_items(client, test_db):
+    """Test bulk adding symbols skips duplicates and reports invalid symbols."""
+    from models.database import TestingSessionLocal
+    db = TestingSessionLocal()
+    
+    try:
+        controller = WatchlistController(db)
+        watchlist = controller.create_watchlist(WatchlistCreate(name="Tech Stocks"))
+        controller.bulk_add_watched_items(watchlist.id, ["AAPL"])
+        
+        added_count, errors = controller.bulk_add_watched_items(
+            watchlist.id, ["aapl", "msft", " googl ", "MSFT", "", "BAD SYMBOL"]
+        )
+        
+        assert added_count == 2
+        assert len(errors) == 2
+        assert any("already in this watchlist" in e for e in errors)
+        
+        items = controller.get_watchlist_items(watchlist.id)
+        assert [item.symbol for item in items] == ["AAPL", "MSFT", "GOOGL"]
+        assert [item.order_index for item in items] == [0, 1, 2]
+        assert all(item.added_date is not None for item in items)
+    finally:
+        db.close()
+
+
+def test_bulk_remove_watched_items(client, test_db):
+    """Test bulk removing symbols deletes matches and reports missing ones."""
+    from models.database import TestingSessionLocal
+    db = TestingSessionLocal()
+    
+    try:
+        controller = WatchlistController(db)
+        watchlist = controller.create_watchlist(WatchlistCreate(name="Tech Stocks"))
+        controller.bulk_add_watched_items(watchlist.id, ["AAPL", "MSFT", "GOOGL"])
+        
+        removed_count, errors = controller.bulk_remove_watched_items(
+            watchlist.id, [" aapl", "AAPL", "TSLA", "", "googl"]
+        )
+        
+        assert removed_count == 2
+        assert errors == ["TSLA: Not found in watchlist"]
+        assert [item.symbol for item in controller.get_watchlist_items(watchlist.id)] == ["MSFT"]
+        
+        assert controller.bulk_remove_watched_items(watchlist.id, ["AAPL"]) == (
+            0, ["AAPL: Not found in watchlist"]
+        )
+        with pytest.raises(WatchlistNotFound):
+            controller.bulk_remove_watched_items(999, ["AAPL"])
+    finally:
+        db.close()
+
+
+def test_item_actions_on_missing_watchlist(client, test_db):
+    """Test item actions raise WatchlistNotFound only when the watchlist is absent."""
+    from models.database import TestingSessionLocal
+    db = TestingSessionLocal()
+    
+    try:
+        controller = WatchlistController(db)
+        
+        with pytest.raises(WatchlistNotFound):
+            controller.get_watchlist_items_with_details(999)
+        with pytest.raises(WatchlistNotFound):
+            controller.validate_watchlist_symbols(999)
+        with pytest.raises(WatchlistNotFound):
+            controller.bulk_add_watched_items(999, ["AAPL"])
+        with pytest.raises(WatchlistNotFound):
+            controller.reorder_watchlist_items(999, [])
+        
+        watchlist = controller.create_watchlist(WatchlistCreate(name="Empty"))
+        assert controller.get_watchlist_items_with_details(watchlist.id) == []
+        assert controller.validate_watchlist_symbols(watchlist.id)["all_valid"] is True
+        assert controller.reorder_watchlist_items(watchlist.id, []) is True
+    finally:
+        db.close()
+
+
 def test_get_watchlist_items(client, test_db):
     """Test getting watched items for a watchlist."""
     from models.database import TestingSessionLocal
@@ -318,5 +399,140 @@ def test_get_watchlist_summary(client, test_db):
         db.close()
 
 
+def test_get_watchlist_summaries_and_counts(client, test_db):
+    """Test aggregate summaries and item counts across watchlists."""
+    from models.database import TestingSessionLocal
+    db = TestingSessionLocal()
+    
+    try:
+        controller = WatchlistController(db)
+        tech = controller.create_watchlist(WatchlistCreate(name="Tech Stocks"))
+        empty = controller.create_watchlist(WatchlistCreate(name="Empty"))
+        controller.bulk_add_watched_items(tech.id, ["AAPL", "GOOGL", "MSFT"])
+        
+        items = {item.symbol: item for item in controller.get_watchlist_items(tech.id)}
+        items["AAPL"].last_price = 150.0
+        items["GOOGL"].last_price = 250.0
+        items["AAPL"].notes = "Core holding"
+        db.commit()
+        
+        summaries = controller.get_watchlist_summaries([tech.id, empty.id])
+        assert summaries[tech.id]["total_items"] == 3
+        assert summaries[tech.id]["items_with_prices"] == 2
+        assert summaries[tech.id]["items_with_notes"] == 1
+        assert summaries[tech.id]["average_price"] == pytest.approx(200.0)
+        assert summaries[tech.id]["price_coverage"] == pytest.approx(200 / 3)
+        assert summaries[empty.id] == {
+            "total_items": 0,
+            "items_with_prices": 0,
+            "items_with_notes": 0,
+            "price_coverage": 0,
+            "average_price": 0.0
+        }
+        
+        assert controller.get_watchlist_item_counts() == {tech.id: 3}
+    finally:
+        db.close()
+
+
+def test_watched_item_symbol_unique_per_watchlist(client, test_db):
+    """Test the composite index rejects duplicate symbols and is backfilled on old tables."""
+    from sqlalchemy import create_engine, inspect
+    from sqlalchemy.exc import IntegrityError
+    from models.database import TestingSessionLocal, Base, create_missing_indexes
+    db = TestingSessionLocal()
+    
+    try:
+        watchlist = WatchlistController(db).create_watchlist(WatchlistCreate(name="Unique"))
+        db.add_all([
+            WatchedItem(watchlist_id=watchlist.id, symbol="AAPL"),
+            WatchedItem(watchlist_id=watchlist.id, symbol="AAPL")
+        ])
+        with pytest.raises(IntegrityError):
+            db.commit()
+        db.rollback()
+    finally:
+        db.close()
+    
+    # Tables created before the index existed get it on the next startup
+    legacy_engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(bind=legacy_engine)
+    with legacy_engine.begin() as conn:
+        conn.exec_driver_sql("DROP INDEX ix_watched_items_wl_sym")
+    
+    create_missing_indexes(bind=legacy_engine)
+    index_names = {index["name"] for index in inspect(legacy_engine).get_indexes("watched_items")}
+    assert "ix_watched_items_wl_sym" in index_names
+    
+    # Duplicates already in the table stop startup instead of leaving the index out
+    duplicate_engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(bind=duplicate_engine)
+    with duplicate_engine.begin() as conn:
+        conn.exec_driver_sql("DROP INDEX ix_watched_items_wl_sym")
+        conn.exec_driver_sql("INSERT INTO watchlists (id, name, created_date, modified_date) "
+                             "VALUES (1, 'Old', '2025-01-01', '2025-01-01')")
+        for _ in range(2):
+            conn.exec_driver_sql("INSERT INTO watched_items (watchlist_id, symbol, added_date, order_index) "
+                                 "VALUES (1, 'AAPL', '2025-01-01', 0)")
+    
+    with pytest.raises(RuntimeError, match="ix_watched_items_wl_sym"):
+        create_missing_indexes(bind=duplicate_engine)
+
+
+def test_bulk_update_news(client, test_db):
+    """Test saving news for several watched items in one batch."""
+    from models.database import TestingSessionLocal
+    db = TestingSessionLocal()
+    
+    try:
+        controller = WatchlistController(db)
+        watchlist = controller.create_watchlist(WatchlistCreate(name="News"))
+        controller.bulk_add_watched_items(watchlist.id, ["AAPL", "MSFT"])
+        aapl, msft = controller.get_watchlist_items(watchlist.id)
+        
+        assert controller.bulk_update_news([]) == 0
+        updated_at = datetime(2025, 1, 6, 15, 0)
+        assert controller.bulk_update_news([
+            {"id": aapl.id, "news_data": {"articles": []}, "last_news_update": updated_at},
+            {"id": msft.id, "news_data": None, "last_news_update": None}
+        ]) == 2
+        
+        aapl, msft = controller.get_watchlist_items(watchlist.id)
+        assert aapl.news_data == {"articles": []}
+        assert aapl.last_news_update == updated_at
+        assert msft.news_data is None
+    finally:
+        db.close()
+
+
+def test_refresh_watchlist_prices(client, test_db):
+    """Test refreshing prices bulk-updates items and reports failed symbols."""
+    from unittest.mock import MagicMock
+    from models.database import TestingSessionLocal
+    db = TestingSessionLocal()
+    
+    try:
+        controller = WatchlistController(db)
+        assert controller.refresh_watchlist_prices(999) is None
+        
+        watchlist = controller.create_watchlist(WatchlistCreate(name="Refresh List"))
+        assert controller.refresh_watchlist_prices(watchlist.id)["total_count"] == 0
+        
+        stocks = controller.stock_data_controller = MagicMock()
+        stocks.get_stock_price.return_value = None
+        controller.bulk_add_watched_items(watchlist.id, ["AAPL", "NOPE"])
+        stocks.refresh_portfolio_prices.return_value = {"AAPL": MagicMock(price=190.0), "NOPE": None}
+        
+        result = controller.refresh_watchlist_prices(watchlist.id)
+        
+        assert result["updated_count"] == 1
+        assert result["failed_symbols"] == ["NOPE"]
+        db.expire_all()
+        prices = {item.symbol: item.last_price for item in controller.get_watchlist_items(watchlist.id)}
+        assert prices == {"AAPL": 190.0, "NOPE": None}
+    finally:
+        db.close()
+
+
 if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
\ No newline at end of file
+    pytest.main([__file__, "-v"])
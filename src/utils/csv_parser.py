@@ -3,6 +3,8 @@
 import csv
 import io
 from typing import List, Dict, Any, Tuple
+
+import pandas as pd
 from pydantic import BaseModel, field_validator, ValidationError
 
 
@@ -103,41 +105,57 @@ class CSVPortfolioParser:
                 if lower_name in required_lower:
                     column_mapping[lower_name] = actual_name
             
+            # Tokenize with the csv module so ragged or badly quoted rows only
+            # affect themselves; short rows read as None, extra fields are ignored
+            symbol_cells, shares_cells, allocation_cells, blank_rows = [], [], [], []
+            for row in csv_reader:
+                blank_rows.append(not any(row.values()) or all(not str(v).strip() for v in row.values()))
+                symbol_cells.append((row.get(column_mapping['symbol']) or '').strip())
+                shares_cells.append((row.get(column_mapping['shares']) or '').strip())
+                allocation_cells.append((row.get(column_mapping['allocation']) or '').strip())
+            
+            symbol_col = pd.Series(symbol_cells, dtype=object)
+            shares_col = pd.Series(shares_cells, dtype=object)
+            allocation_col = pd.Series(allocation_cells, dtype=object)
+            
+            # Vectorized validation; rows that fail any check are re-validated one
+            # by one below so they report exactly the same errors as before
+            symbols = symbol_col.str.upper()
+            shares = pd.to_numeric(shares_col.mask(shares_col == '', '0'), errors='coerce')
+            allocations = pd.to_numeric(allocation_col.mask(allocation_col == '', '0'), errors='coerce')
+            clean = (
+                symbols.str.len().between(1, 10) & symbols.str.isalnum()
+                & (shares >= 0)
+                & (allocations > 0) & (allocations <= 100)
+            )
+            
             # Process rows
-            row_number = 1  # Header is row 0
             symbols_seen = set()
             total_allocation = 0.0
             
-            for row in csv_reader:
-                row_number += 1
+            rows = zip(
+                symbol_col.tolist(), shares_col.tolist(), allocation_col.tolist(),
+                symbols.tolist(), shares.tolist(), allocations.tolist(),
+                clean.tolist(), blank_rows
+            )
+            # Header is row 1, so data rows start at 2
+            for row_number, row in enumerate(rows, start=2):
+                symbol, shares_str, allocation_str, clean_symbol, shares_value, allocation_value, is_clean, is_blank = row
                 
                 try:
                     # Skip empty rows
-                    if not any(row.values()) or all(not str(v).strip() for v in row.values()):
+                    if is_blank:
                         continue
                     
-                    # Extract data using case-insensitive mapping
-                    symbol = row[column_mapping['symbol']].strip() if row.get(column_mapping['symbol']) else ''
-                    shares_str = row[column_mapping['shares']].strip() if row.get(column_mapping['shares']) else ''
-                    allocation_str = row[column_mapping['allocation']].strip() if row.get(column_mapping['allocation']) else ''
-                    
-                    # Convert to appropriate types
-                    try:
-                        shares = float(shares_str) if shares_str else 0.0
-                    except ValueError:
-                        raise CSVValidationError(f"Invalid shares value: '{shares_str}'", row_number, "Shares")
-                    
-                    try:
-                        allocation = float(allocation_str) if allocation_str else 0.0
-                    except ValueError:
-                        raise CSVValidationError(f"Invalid allocation value: '{allocation_str}'", row_number, "Allocation")
-                    
-                    # Validate data
-                    holding_data = CSVHoldingData(
-                        symbol=symbol,
-                        shares=shares,
-                        allocation=allocation
-                    )
+                    if is_clean:
+                        # Still validated, so clean rows get the same float fields
+                        holding_data = CSVHoldingData(
+                            symbol=clean_symbol,
+                            shares=float(shares_value),
+                            allocation=float(allocation_value)
+                        )
+                    else:
+                        holding_data = self._parse_row(row_number, symbol, shares_str, allocation_str)
                     
                     # Check for duplicate symbols
                     if holding_data.symbol in symbols_seen:
@@ -176,6 +194,27 @@ class CSVPortfolioParser:
         
         return holdings_data, self.errors, self.warnings
     
+    def _parse_row(self, row_number: int, symbol: str, shares_str: str,
+                   allocation_str: str) -> CSVHoldingData:
+        """Convert and validate a single row's stripped cells."""
+        # Convert to appropriate types
+        try:
+            shares = float(shares_str) if shares_str else 0.0
+        except ValueError:
+            raise CSVValidationError(f"Invalid shares value: '{shares_str}'", row_number, "Shares")
+        
+        try:
+            allocation = float(allocation_str) if allocation_str else 0.0
+        except ValueError:
+            raise CSVValidationError(f"Invalid allocation value: '{allocation_str}'", row_number, "Allocation")
+        
+        # Validate data
+        return CSVHoldingData(
+            symbol=symbol,
+            shares=shares,
+            allocation=allocation
+        )
+    
     def validate_file_size(self, content: str, max_size_mb: int = 1) -> bool:
         """Validate file size."""
         size_mb = len(content.encode('utf-8')) / (1024 * 1024)
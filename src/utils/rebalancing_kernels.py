@@ -0,0 +1,98 @@
+"""Numerical kernels for portfolio rebalancing analysis.
+
+The kernels operate on float64 arrays with one element per holding. When
+numba is installed they are JIT-compiled (and cached on disk); otherwise they
+run as plain Python/NumPy with identical results.
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Fallback no-op decorator used when numba is not installed."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+# Action codes returned by compute_rebalancing_trades
+ACTION_NONE = 0
+ACTION_BUY = 1
+ACTION_SELL = -1
+
+
+@njit(cache=True)
+def compute_allocation_drifts(current_values: np.ndarray, target_pcts: np.ndarray,
+                              total_value: float) -> Tuple[np.ndarray, ...]:
+    """
+    Calculate allocation drift metrics for each holding.
+
+    Args:
+        current_values: Current market value of each holding
+        target_pcts: Target allocation of each holding in percent
+        total_value: Total portfolio value
+
+    Returns:
+        Tuple of (current_allocations, drifts, drift_percentages,
+        target_values, value_differences)
+    """
+    n = current_values.shape[0]
+    current_allocations = np.zeros(n)
+    drifts = np.empty(n)
+    drift_percentages = np.zeros(n)
+    target_values = np.empty(n)
+    value_differences = np.empty(n)
+
+    for i in range(n):
+        if total_value > 0:
+            current_allocations[i] = current_values[i] / total_value * 100
+        drifts[i] = current_allocations[i] - target_pcts[i]
+        if target_pcts[i] > 0:
+            drift_percentages[i] = drifts[i] / target_pcts[i] * 100
+        target_values[i] = total_value * (target_pcts[i] / 100)
+        value_differences[i] = current_values[i] - target_values[i]
+
+    return current_allocations, drifts, drift_percentages, target_values, value_differences
+
+
+@njit(cache=True)
+def compute_rebalancing_trades(drifts: np.ndarray, value_differences: np.ndarray,
+                               prices: np.ndarray, cost_rate: float, tolerance: float,
+                               min_shares: float) -> Tuple[np.ndarray, ...]:
+    """
+    Calculate the trade needed to bring each holding back to its target.
+
+    Holdings without a price, within tolerance, or needing fewer than
+    ``min_shares`` shares get ACTION_NONE and zero shares/value/cost.
+
+    Args:
+        drifts: Allocation drift of each holding in percentage points
+        value_differences: Current value minus target value of each holding
+        prices: Current price of each holding (0 if unknown)
+        cost_rate: Transaction cost as a fraction of trade value
+        tolerance: Drift threshold in percentage points
+        min_shares: Smallest share change worth trading
+
+    Returns:
+        Tuple of (action_codes, shares, transaction_values, transaction_costs)
+    """
+    # Boolean masks instead of per-holding branches, so without numba this is
+    # still a handful of vectorized ufunc calls
+    priced = prices > 0
+    shares_change = -value_differences / np.where(priced, prices, 1.0)
+    shares_abs = np.abs(shares_change)
+    keep = priced & (np.abs(drifts) > tolerance) & (shares_abs >= min_shares)
+
+    buy = shares_change > 0
+    action_codes = ((ACTION_BUY * buy + ACTION_SELL * ~buy) * keep).astype(np.int8)
+    shares = shares_abs * keep
+    transaction_values = shares * prices
+    transaction_costs = transaction_values * cost_rate
+
+    return action_codes, shares, transaction_values, transaction_costs
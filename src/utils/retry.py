@@ -0,0 +1,89 @@
+"""Retry and rate-limiting helpers for calls to external APIs."""
+
+import random
+import threading
+import time
+from typing import Callable, Tuple, Type, TypeVar
+
+T = TypeVar("T")
+
+
+def call_with_backoff(
+    func: Callable[[], T],
+    retry_on: Tuple[Type[BaseException], ...] = (Exception,),
+    attempts: int = 4,
+    base_delay: float = 0.5,
+    max_delay: float = 16.0,
+) -> T:
+    """
+    Call ``func``, retrying with randomized exponential backoff.
+
+    Each retry sleeps a random time between 0 and ``base_delay * 2**n`` (capped
+    at ``max_delay``), which spreads out bursts of requests hitting a rate limit.
+
+    Args:
+        func: Zero-argument callable to invoke
+        retry_on: Exception types that trigger a retry
+        attempts: Total number of attempts before the last error is re-raised
+        base_delay: Upper bound of the first backoff window, in seconds
+        max_delay: Largest backoff window, in seconds
+
+    Returns:
+        The value returned by ``func``
+    """
+    for attempt in range(attempts):
+        try:
+            return func()
+        except retry_on:
+            if attempt == attempts - 1:
+                raise
+            time.sleep(random.uniform(0, min(max_delay, base_delay * 2 ** attempt)))
+
+
+class RateLimited(Exception):
+    """Raised instead of sleeping when a rate limit means a call must wait.
+
+    ``retry_after`` is the number of seconds until the call may be retried.
+    """
+
+    def __init__(self, retry_after: float):
+        super().__init__(f"Rate limited; retry after {retry_after:.2f}s")
+        self.retry_after = retry_after
+
+
+class TokenBucket:
+    """Thread-safe token bucket that refills ``refill_amount`` credits every
+    ``refill_frequency`` seconds, up to ``capacity``.
+
+    Credits are topped up lazily on each acquire, so there is no background
+    timer and no request history to scan.
+    """
+
+    def __init__(self, capacity: int, refill_frequency: float, refill_amount: int = 1):
+        self.capacity = capacity
+        self.refill_frequency = refill_frequency
+        self.refill_amount = refill_amount
+        self._tokens = float(capacity)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        rate = self.refill_amount / self.refill_frequency
+        self._tokens = min(self.capacity, self._tokens + (now - self._last_refill) * rate)
+        self._last_refill = now
+
+    def try_acquire(self, credits: int = 1) -> bool:
+        """Take ``credits`` if available without waiting; return whether it succeeded."""
+        with self._lock:
+            self._refill()
+            if self._tokens >= credits:
+                self._tokens -= credits
+                return True
+            return False
+
+    def penalize(self, credits: int) -> None:
+        """Drain up to ``credits`` tokens, e.g. after the server reports a rate limit."""
+        with self._lock:
+            self._refill()
+            self._tokens = max(0.0, self._tokens - credits)
@@ -1,9 +1,23 @@
 """Validation utilities for the Portfolio Manager application."""
 
 import re
-from typing import Optional
+from functools import lru_cache
+from typing import AbstractSet, Optional
 
+import numpy as np
 
+# Prefer google-re2's linear-time DFA matcher when installed; stdlib re otherwise.
+try:
+    import re2 as _regex
+except ImportError:
+    _regex = re
+
+# Compiled once at import time; these are hit on every form submission/upload.
+_SYMBOL_RE = _regex.compile(r'^[A-Z0-9][A-Z0-9.\-]{0,9}$')
+CSV_EXTENSIONS = frozenset({'.csv'})
+
+
+@lru_cache(maxsize=4096)
 def validate_stock_symbol(symbol: str) -> bool:
     """
     Validate a stock symbol.
@@ -24,15 +38,30 @@ def validate_stock_symbol(symbol: str) -> bool:
     if symbol == '$CASH':
         return True
     
-    # Check length (1-10 characters)
-    if len(symbol) < 1 or len(symbol) > 10:
-        return False
+    # 1-10 characters: letters, numbers, and share-class separators (BRK.B, BRK-B)
+    return _SYMBOL_RE.match(symbol) is not None
+
+
+def normalize_stock_symbol(symbol: str) -> str:
+    """
+    Normalize and validate a stock symbol for use in Pydantic validators.
     
-    # Check that it contains only letters and numbers
-    if not re.match(r'^[A-Z0-9]+$', symbol):
-        return False
+    Args:
+        symbol: Raw symbol as entered by the user
+        
+    Returns:
+        Stripped, upper-cased symbol
+        
+    Raises:
+        ValueError: If the symbol is empty or malformed
+    """
+    if not symbol or not symbol.strip():
+        raise ValueError('Symbol cannot be empty')
     
-    return True
+    symbol = symbol.strip().upper()
+    if symbol != '$CASH' and not _SYMBOL_RE.match(symbol):
+        raise ValueError(f'Invalid stock symbol: {symbol}')
+    return symbol
 
 
 def validate_allocation_sum(allocations: list) -> tuple[bool, float]:
@@ -45,7 +74,8 @@ def validate_allocation_sum(allocations: list) -> tuple[bool, float]:
     Returns:
         Tuple of (is_valid, total_sum)
     """
-    total = sum(allocations)
+    # Summed in C; CSV uploads can carry thousands of rows
+    total = float(np.fromiter(allocations, dtype=np.float64, count=len(allocations)).sum())
     is_valid = abs(total - 100.0) <= 0.01
     return is_valid, total
 
@@ -99,19 +129,19 @@ def sanitize_portfolio_name(name: str) -> str:
     return name
 
 
-def validate_file_extension(filename: str, allowed_extensions: list = None) -> bool:
+def validate_file_extension(filename: str, allowed_extensions: Optional[AbstractSet[str]] = None) -> bool:
     """
     Validate file extension.
     
     Args:
         filename: Name of the file
-        allowed_extensions: List of allowed extensions (default: ['.csv'])
+        allowed_extensions: Set of allowed extensions (default: CSV_EXTENSIONS)
         
     Returns:
         True if valid, False otherwise
     """
     if allowed_extensions is None:
-        allowed_extensions = ['.csv']
+        allowed_extensions = CSV_EXTENSIONS
     
     if not filename:
         return False
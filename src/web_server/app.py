@@ -9,7 +9,8 @@ from fastapi import FastAPI, Request, Depends, HTTPException, Form, UploadFile,
 load_dotenv()
 from fastapi.templating import Jinja2Templates
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse, RedirectResponse, JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import HTMLResponse, RedirectResponse, JSONResponse, ORJSONResponse
 from sqlalchemy.orm import Session
 from typing import List, Optional
 
@@ -23,14 +24,15 @@ from controllers.portfolio_controller import (
     HoldingUpdate
 )
 from utils.csv_parser import CSVPortfolioParser
-from utils.validators import validate_file_extension
+from utils.validators import CSV_EXTENSIONS, validate_file_extension
 from controllers.rebalancing_controller import RebalancingController
 from controllers.watchlist_controller import (
     WatchlistController,
     WatchlistCreate,
     WatchlistUpdate,
     WatchedItemCreate,
-    WatchedItemUpdate
+    WatchedItemUpdate,
+    WatchlistNotFound
 )
 from web_server.routes.portfolios import router as portfolios_router
 from web_server.routes.stock_data import router as stock_data_router
@@ -50,9 +52,23 @@ app = FastAPI(
     title="Portfolio Manager",
     description="A web-based stock portfolio management and rebalancing application",
     version="0.1.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
+# Compress responses (rendered portfolio tables are highly redundant HTML).
+# Prefer Brotli when brotli-asgi is installed; it falls back to gzip itself.
+try:
+    from brotli_asgi import BrotliMiddleware
+    app.add_middleware(BrotliMiddleware, minimum_size=512)
+except ImportError:
+    app.add_middleware(GZipMiddleware, minimum_size=512)
+
+@app.exception_handler(WatchlistNotFound)
+async def watchlist_not_found_handler(request: Request, exc: WatchlistNotFound):
+    """Map missing watchlists raised by controller actions to a 404."""
+    return ORJSONResponse(status_code=404, content={"detail": "Watchlist not found"})
+
 # Include API routers
 app.include_router(portfolios_router)
 app.include_router(stock_data_router)
@@ -83,7 +99,8 @@ async def home(request: Request):
 async def list_portfolios(request: Request, db: Session = Depends(get_db)):
     """Display list of all portfolios."""
     controller = PortfolioController(db)
-    portfolios = controller.get_portfolios()
+    # Summaries come from the cached summary query, not the holdings relationship
+    portfolios = controller.get_portfolios(load_holdings=False)
     
     # Calculate summary for each portfolio
     portfolio_summaries = []
@@ -133,12 +150,12 @@ async def create_portfolio(
 async def view_portfolio(request: Request, portfolio_id: int, db: Session = Depends(get_db)):
     """Display portfolio details."""
     controller = PortfolioController(db)
-    portfolio = controller.get_portfolio(portfolio_id)
+    portfolio = controller.get_portfolio_with_holdings(portfolio_id)
     
     if not portfolio:
         raise HTTPException(status_code=404, detail="Portfolio not found")
     
-    holdings = controller.get_portfolio_holdings(portfolio_id)
+    holdings = portfolio.holdings
     summary = controller.calculate_portfolio_summary(portfolio_id)
     
     return templates.TemplateResponse(request, "portfolios/detail.html", {
@@ -173,16 +190,17 @@ async def update_portfolio_web(
 ):
     """Update a portfolio via web form."""
     controller = PortfolioController(db)
-    portfolio = controller.get_portfolio(portfolio_id)
-    
-    if not portfolio:
-        raise HTTPException(status_code=404, detail="Portfolio not found")
     
     try:
         portfolio_data = PortfolioUpdate(name=name)
         updated_portfolio = controller.update_portfolio(portfolio_id, portfolio_data)
+        if not updated_portfolio:
+            raise HTTPException(status_code=404, detail="Portfolio not found")
         return RedirectResponse(url=f"/portfolios/{portfolio_id}?renamed={name}", status_code=303)
     except ValueError as e:
+        portfolio = controller.get_portfolio(portfolio_id)
+        if not portfolio:
+            raise HTTPException(status_code=404, detail="Portfolio not found")
         return templates.TemplateResponse(request, "portfolios/edit.html", {
             "request": request,
             "portfolio": portfolio,
@@ -244,7 +262,7 @@ async def import_csv_upload(
     
     try:
         # Validate file type
-        if not validate_file_extension(file.filename, ['.csv']):
+        if not validate_file_extension(file.filename, CSV_EXTENSIONS):
             errors.append("Only CSV files are allowed")
         else:
             # Read and process file
@@ -318,10 +336,6 @@ async def create_holding_web(
 ):
     """Create a new holding via web form."""
     controller = PortfolioController(db)
-    portfolio = controller.get_portfolio(portfolio_id)
-    
-    if not portfolio:
-        raise HTTPException(status_code=404, detail="Portfolio not found")
     
     try:
         holding_data = HoldingCreate(
@@ -329,9 +343,13 @@ async def create_holding_web(
             shares=shares,
             target_allocation=target_allocation
         )
-        controller.add_holding(portfolio_id, holding_data)
+        if not controller.add_holding(portfolio_id, holding_data):
+            raise HTTPException(status_code=404, detail="Portfolio not found")
         return RedirectResponse(url=f"/portfolios/{portfolio_id}?added={symbol}", status_code=303)
     except ValueError as e:
+        portfolio = controller.get_portfolio(portfolio_id)
+        if not portfolio:
+            raise HTTPException(status_code=404, detail="Portfolio not found")
         return templates.TemplateResponse(request, "portfolios/holding_form.html", {
             "request": request,
             "portfolio": portfolio,
@@ -347,12 +365,12 @@ async def create_holding_web(
 async def edit_holding_form(request: Request, portfolio_id: int, symbol: str, db: Session = Depends(get_db)):
     """Display form to edit a holding."""
     controller = PortfolioController(db)
-    portfolio = controller.get_portfolio(portfolio_id)
+    portfolio = controller.get_portfolio_with_holdings(portfolio_id)
     
     if not portfolio:
         raise HTTPException(status_code=404, detail="Portfolio not found")
     
-    holdings = controller.get_portfolio_holdings(portfolio_id)
+    holdings = portfolio.holdings
     holding = next((h for h in holdings if h.symbol == symbol), None)
     
     if not holding:
@@ -379,10 +397,6 @@ async def update_holding_web(
 ):
     """Update a holding via web form."""
     controller = PortfolioController(db)
-    portfolio = controller.get_portfolio(portfolio_id)
-    
-    if not portfolio:
-        raise HTTPException(status_code=404, detail="Portfolio not found")
     
     try:
         holding_data = HoldingUpdate(
@@ -396,6 +410,9 @@ async def update_holding_web(
         
         return RedirectResponse(url=f"/portfolios/{portfolio_id}?updated={symbol}", status_code=303)
     except ValueError as e:
+        portfolio = controller.get_portfolio(portfolio_id)
+        if not portfolio:
+            raise HTTPException(status_code=404, detail="Portfolio not found")
         return templates.TemplateResponse(request, "portfolios/holding_form.html", {
             "request": request,
             "portfolio": portfolio,
@@ -424,11 +441,9 @@ async def refresh_portfolio_prices_web(portfolio_id: int, db: Session = Depends(
     """Refresh all portfolio prices via web interface."""
     controller = PortfolioController(db)
     
-    portfolio = controller.get_portfolio(portfolio_id)
-    if not portfolio:
-        raise HTTPException(status_code=404, detail="Portfolio not found")
-    
     result = controller.refresh_portfolio_prices(portfolio_id)
+    if result is None:
+        raise HTTPException(status_code=404, detail="Portfolio not found")
     
     if result["success"]:
         message = f"refreshed={result['updated_count']}&failed={result['failed_count']}"
@@ -523,14 +538,12 @@ async def list_watchlists(request: Request, db: Session = Depends(get_db)):
     controller = WatchlistController(db)
     watchlists = controller.get_watchlists()
     
-    # Calculate summary for each watchlist
-    watchlist_summaries = []
-    for watchlist in watchlists:
-        summary = controller.get_watchlist_summary(watchlist.id)
-        watchlist_summaries.append({
-            "watchlist": watchlist,
-            "summary": summary
-        })
+    # Calculate summaries for all watchlists in one query
+    summaries = controller.get_watchlist_summaries([w.id for w in watchlists])
+    watchlist_summaries = [
+        {"watchlist": watchlist, "summary": summaries[watchlist.id]}
+        for watchlist in watchlists
+    ]
     
     return templates.TemplateResponse(request, "watchlists/list.html", {
         "request": request,
@@ -611,16 +624,17 @@ async def update_watchlist_web(
 ):
     """Update a watchlist via web form."""
     controller = WatchlistController(db)
-    watchlist = controller.get_watchlist(watchlist_id)
-    
-    if not watchlist:
-        raise HTTPException(status_code=404, detail="Watchlist not found")
     
     try:
         watchlist_data = WatchlistUpdate(name=name)
         updated_watchlist = controller.update_watchlist(watchlist_id, watchlist_data)
+        if not updated_watchlist:
+            raise HTTPException(status_code=404, detail="Watchlist not found")
         return RedirectResponse(url=f"/watchlists/{watchlist_id}?renamed={name}", status_code=303)
     except ValueError as e:
+        watchlist = controller.get_watchlist(watchlist_id)
+        if not watchlist:
+            raise HTTPException(status_code=404, detail="Watchlist not found")
         return templates.TemplateResponse(request, "watchlists/edit.html", {
             "request": request,
             "watchlist": watchlist,
@@ -667,19 +681,19 @@ async def create_watched_item_web(
 ):
     """Create a new watched item via web form."""
     controller = WatchlistController(db)
-    watchlist = controller.get_watchlist(watchlist_id)
-    
-    if not watchlist:
-        raise HTTPException(status_code=404, detail="Watchlist not found")
     
     try:
         watched_item_data = WatchedItemCreate(
             symbol=symbol,
             notes=notes if notes else None
         )
-        controller.add_watched_item(watchlist_id, watched_item_data)
+        if not controller.add_watched_item(watchlist_id, watched_item_data):
+            raise HTTPException(status_code=404, detail="Watchlist not found")
         return RedirectResponse(url=f"/watchlists/{watchlist_id}?added={symbol}", status_code=303)
     except ValueError as e:
+        watchlist = controller.get_watchlist(watchlist_id)
+        if not watchlist:
+            raise HTTPException(status_code=404, detail="Watchlist not found")
         return templates.TemplateResponse(request, "watchlists/item_form.html", {
             "request": request,
             "watchlist": watchlist,
@@ -724,10 +738,6 @@ async def update_watched_item_web(
 ):
     """Update a watched item via web form."""
     controller = WatchlistController(db)
-    watchlist = controller.get_watchlist(watchlist_id)
-    
-    if not watchlist:
-        raise HTTPException(status_code=404, detail="Watchlist not found")
     
     try:
         watched_item_data = WatchedItemUpdate(
@@ -740,6 +750,9 @@ async def update_watched_item_web(
         
         return RedirectResponse(url=f"/watchlists/{watchlist_id}?updated={symbol}", status_code=303)
     except ValueError as e:
+        watchlist = controller.get_watchlist(watchlist_id)
+        if not watchlist:
+            raise HTTPException(status_code=404, detail="Watchlist not found")
         return templates.TemplateResponse(request, "watchlists/item_form.html", {
             "request": request,
             "watchlist": watchlist,
@@ -767,11 +780,9 @@ async def refresh_watchlist_prices_web(watchlist_id: int, db: Session = Depends(
     """Refresh all watchlist prices via web interface."""
     controller = WatchlistController(db)
     
-    watchlist = controller.get_watchlist(watchlist_id)
-    if not watchlist:
-        raise HTTPException(status_code=404, detail="Watchlist not found")
-    
     result = controller.refresh_watchlist_prices(watchlist_id)
+    if result is None:
+        raise HTTPException(status_code=404, detail="Watchlist not found")
     
     if result["success"]:
         message = f"refreshed={result['updated_count']}&failed={result['failed_count']}"
@@ -810,8 +821,8 @@ async def api_list_portfolios(db: Session = Depends(get_db)):
         {
             "id": p.id,
             "name": p.name,
-            "created_date": p.created_date.isoformat(),
-            "modified_date": p.modified_date.isoformat(),
+            "created_date": p.created_date,
+            "modified_date": p.modified_date,
             "holdings_count": len(p.holdings)
         }
         for p in portfolios
@@ -14,7 +14,7 @@ from controllers.portfolio_controller import (
     PortfolioUpdate
 )
 from utils.csv_parser import CSVPortfolioParser
-from utils.validators import validate_file_extension
+from utils.validators import CSV_EXTENSIONS, validate_file_extension
 
 router = APIRouter(prefix="/api/portfolios", tags=["portfolios"])
 
@@ -29,8 +29,8 @@ async def list_portfolios(db: Session = Depends(get_db)):
         {
             "id": p.id,
             "name": p.name,
-            "created_date": p.created_date.isoformat(),
-            "modified_date": p.modified_date.isoformat(),
+            "created_date": p.created_date,
+            "modified_date": p.modified_date,
             "holdings_count": len(p.holdings)
         }
         for p in portfolios
@@ -51,8 +51,8 @@ async def get_portfolio(portfolio_id: int, db: Session = Depends(get_db)):
     return {
         "id": portfolio.id,
         "name": portfolio.name,
-        "created_date": portfolio.created_date.isoformat(),
-        "modified_date": portfolio.modified_date.isoformat(),
+        "created_date": portfolio.created_date,
+        "modified_date": portfolio.modified_date,
         "summary": summary
     }
 
@@ -67,7 +67,7 @@ async def create_portfolio(portfolio: PortfolioCreate, db: Session = Depends(get
         return {
             "id": new_portfolio.id,
             "name": new_portfolio.name,
-            "created_date": new_portfolio.created_date.isoformat(),
+            "created_date": new_portfolio.created_date,
             "message": "Portfolio created successfully"
         }
     except ValueError as e:
@@ -91,7 +91,7 @@ async def update_portfolio(
         return {
             "id": updated_portfolio.id,
             "name": updated_portfolio.name,
-            "modified_date": updated_portfolio.modified_date.isoformat(),
+            "modified_date": updated_portfolio.modified_date,
             "message": "Portfolio updated successfully"
         }
     except ValueError as e:
@@ -115,10 +115,11 @@ async def get_holdings(portfolio_id: int, db: Session = Depends(get_db)):
     """Get all holdings for a portfolio."""
     controller = PortfolioController(db)
     
-    if not controller.get_portfolio(portfolio_id):
+    portfolio = controller.get_portfolio_with_holdings(portfolio_id)
+    if not portfolio:
         raise HTTPException(status_code=404, detail="Portfolio not found")
     
-    holdings = controller.get_portfolio_holdings(portfolio_id)
+    holdings = portfolio.holdings
     
     return [
         {
@@ -208,7 +209,7 @@ async def import_csv(
         raise HTTPException(status_code=404, detail="Portfolio not found")
     
     # Validate file type
-    if not validate_file_extension(file.filename, ['.csv']):
+    if not validate_file_extension(file.filename, CSV_EXTENSIONS):
         raise HTTPException(status_code=400, detail="Only CSV files are allowed")
     
     try:
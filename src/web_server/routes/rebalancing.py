@@ -6,17 +6,35 @@ from sqlalchemy.orm import Session
 from typing import List, Optional
 
 from models.database import get_db
-from controllers.rebalancing_controller import RebalancingController, RebalancingTransaction
+from controllers.rebalancing_controller import (
+    RebalancingController,
+    RebalancingTransaction,
+    AnalysisOut,
+    TransactionsOut
+)
 
 router = APIRouter(prefix="/api/rebalancing", tags=["rebalancing"])
 
+# Routes doing blocking database or analysis work are plain ``def`` so FastAPI
+# runs them in its threadpool instead of stalling the event loop.
 
-@router.get("/portfolios/{portfolio_id}/analysis")
-async def analyze_portfolio_rebalancing(
-    portfolio_id: int,
+
+def get_rebalancing_controller(
     tolerance: Optional[float] = None,
     transaction_cost_rate: Optional[float] = None,
     db: Session = Depends(get_db)
+) -> RebalancingController:
+    """Build the request's rebalancing controller from the optional query settings."""
+    return RebalancingController(db, tolerance_threshold=tolerance or 2.0,
+                                 transaction_cost_rate=transaction_cost_rate or 0.005)
+
+
+@router.get("/portfolios/{portfolio_id}/analysis", response_model=AnalysisOut)
+def analyze_portfolio_rebalancing(
+    portfolio_id: int,
+    tolerance: Optional[float] = None,
+    transaction_cost_rate: Optional[float] = None,
+    controller: RebalancingController = Depends(get_rebalancing_controller)
 ):
     """
     Analyze portfolio for rebalancing needs.
@@ -27,51 +45,13 @@ async def analyze_portfolio_rebalancing(
         transaction_cost_rate: Custom transaction cost rate as decimal (default: 0.005)
     """
     try:
-        controller = RebalancingController(db, tolerance_threshold=tolerance or 2.0, 
-                                         transaction_cost_rate=transaction_cost_rate or 0.005)
-        
-        analysis = controller.analyze_portfolio_rebalancing(
+        # Serialized through AnalysisOut by pydantic-core
+        return controller.analyze_portfolio_rebalancing(
             portfolio_id, 
             custom_tolerance=tolerance,
             custom_cost_rate=transaction_cost_rate
         )
         
-        # Convert to JSON-serializable format
-        return {
-            "portfolio_id": analysis.portfolio_id,
-            "total_value": analysis.total_value,
-            "is_balanced": analysis.is_balanced,
-            "tolerance_threshold": analysis.tolerance_threshold,
-            "analysis_timestamp": analysis.analysis_timestamp.isoformat(),
-            "allocation_drifts": [
-                {
-                    "symbol": drift.symbol,
-                    "current_allocation": drift.current_allocation,
-                    "target_allocation": drift.target_allocation,
-                    "drift": drift.drift,
-                    "drift_percentage": drift.drift_percentage,
-                    "current_value": drift.current_value,
-                    "target_value": drift.target_value,
-                    "value_difference": drift.value_difference
-                }
-                for drift in analysis.allocation_drifts
-            ],
-            "transactions": [
-                {
-                    "symbol": tx.symbol,
-                    "action": tx.action,
-                    "shares": tx.shares,
-                    "current_price": tx.current_price,
-                    "transaction_value": tx.transaction_value,
-                    "transaction_cost": tx.transaction_cost,
-                    "reason": tx.reason
-                }
-                for tx in analysis.transactions
-            ],
-            "total_transaction_cost": analysis.total_transaction_cost,
-            "estimated_final_value": analysis.estimated_final_value
-        }
-        
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
@@ -79,9 +59,11 @@ async def analyze_portfolio_rebalancing(
 
 
 @router.get("/portfolios/{portfolio_id}/summary")
-async def get_rebalancing_summary(portfolio_id: int, db: Session = Depends(get_db)):
+def get_rebalancing_summary(
+    portfolio_id: int,
+    controller: RebalancingController = Depends(get_rebalancing_controller)
+):
     """Get a quick summary of rebalancing needs for a portfolio."""
-    controller = RebalancingController(db)
     summary = controller.get_rebalancing_summary(portfolio_id)
     
     if "error" in summary:
@@ -91,20 +73,22 @@ async def get_rebalancing_summary(portfolio_id: int, db: Session = Depends(get_d
 
 
 @router.post("/portfolios/{portfolio_id}/validate")
-async def validate_rebalancing_feasibility(portfolio_id: int, db: Session = Depends(get_db)):
+def validate_rebalancing_feasibility(
+    portfolio_id: int,
+    controller: RebalancingController = Depends(get_rebalancing_controller)
+):
     """Validate if rebalancing is feasible for a portfolio."""
-    controller = RebalancingController(db)
     validation = controller.validate_rebalancing_feasibility(portfolio_id)
     return validation
 
 
 @router.post("/portfolios/{portfolio_id}/execute")
-async def execute_rebalancing(
+def execute_rebalancing(
     portfolio_id: int,
     dry_run: bool = True,
     tolerance: Optional[float] = None,
     transaction_cost_rate: Optional[float] = None,
-    db: Session = Depends(get_db)
+    controller: RebalancingController = Depends(get_rebalancing_controller)
 ):
     """
     Execute rebalancing transactions for a portfolio.
@@ -116,9 +100,6 @@ async def execute_rebalancing(
         transaction_cost_rate: Custom transaction cost rate
     """
     try:
-        controller = RebalancingController(db, tolerance_threshold=tolerance or 2.0,
-                                         transaction_cost_rate=transaction_cost_rate or 0.005)
-        
         # First analyze to get transactions
         analysis = controller.analyze_portfolio_rebalancing(
             portfolio_id,
@@ -136,7 +117,7 @@ async def execute_rebalancing(
             }
         
         # Execute the transactions
-        result = controller.execute_rebalancing(portfolio_id, analysis.transactions, dry_run)
+        result = controller.execute_rebalancing(analysis, dry_run=dry_run)
         return result
         
     except ValueError as e:
@@ -145,18 +126,15 @@ async def execute_rebalancing(
         raise HTTPException(status_code=500, detail=f"Error executing rebalancing: {str(e)}")
 
 
-@router.get("/portfolios/{portfolio_id}/transactions")
-async def get_rebalancing_transactions(
+@router.get("/portfolios/{portfolio_id}/transactions", response_model=TransactionsOut)
+def get_rebalancing_transactions(
     portfolio_id: int,
     tolerance: Optional[float] = None,
     transaction_cost_rate: Optional[float] = None,
-    db: Session = Depends(get_db)
+    controller: RebalancingController = Depends(get_rebalancing_controller)
 ):
     """Get rebalancing transactions for a portfolio without executing them."""
     try:
-        controller = RebalancingController(db, tolerance_threshold=tolerance or 2.0,
-                                         transaction_cost_rate=transaction_cost_rate or 0.005)
-        
         analysis = controller.analyze_portfolio_rebalancing(
             portfolio_id,
             custom_tolerance=tolerance,
@@ -166,18 +144,7 @@ async def get_rebalancing_transactions(
         return {
             "portfolio_id": portfolio_id,
             "is_balanced": analysis.is_balanced,
-            "transactions": [
-                {
-                    "symbol": tx.symbol,
-                    "action": tx.action,
-                    "shares": tx.shares,
-                    "current_price": tx.current_price,
-                    "transaction_value": tx.transaction_value,
-                    "transaction_cost": tx.transaction_cost,
-                    "reason": tx.reason
-                }
-                for tx in analysis.transactions
-            ],
+            "transactions": analysis.transactions,
             "total_transaction_cost": analysis.total_transaction_cost,
             "transaction_count": len(analysis.transactions)
         }
@@ -189,32 +156,35 @@ async def get_rebalancing_transactions(
 
 
 @router.get("/portfolios/{portfolio_id}/allocation-chart-data")
-async def get_allocation_chart_data(portfolio_id: int, db: Session = Depends(get_db)):
+def get_allocation_chart_data(
+    portfolio_id: int,
+    controller: RebalancingController = Depends(get_rebalancing_controller)
+):
     """Get data for allocation comparison charts."""
     try:
-        controller = RebalancingController(db)
         analysis = controller.analyze_portfolio_rebalancing(portfolio_id)
         
-        # Prepare data for pie charts
+        # Prepare columnar data for pie charts (one array per field, not one dict per holding)
+        symbols = []
         current_allocations = []
+        current_values = []
         target_allocations = []
+        target_values = []
         
         for drift in analysis.allocation_drifts:
             if drift.current_value > 0:  # Only include holdings with value
-                current_allocations.append({
-                    "symbol": drift.symbol,
-                    "allocation": drift.current_allocation,
-                    "value": drift.current_value
-                })
-                target_allocations.append({
-                    "symbol": drift.symbol,
-                    "allocation": drift.target_allocation,
-                    "value": drift.target_value
-                })
+                symbols.append(drift.symbol)
+                current_allocations.append(drift.current_allocation)
+                current_values.append(drift.current_value)
+                target_allocations.append(drift.target_allocation)
+                target_values.append(drift.target_value)
         
         return {
+            "symbols": symbols,
             "current_allocations": current_allocations,
+            "current_values": current_values,
             "target_allocations": target_allocations,
+            "target_values": target_values,
             "total_value": analysis.total_value,
             "is_balanced": analysis.is_balanced
         }
@@ -238,7 +208,7 @@ async def get_rebalancing_defaults():
 
 
 @router.post("/portfolios/{portfolio_id}/rebalance-preview")
-async def preview_rebalancing_impact(
+def preview_rebalancing_impact(
     portfolio_id: int,
     tolerance: float = 2.0,
     transaction_cost_rate: float = 0.005,
@@ -253,16 +223,33 @@ async def preview_rebalancing_impact(
                                          transaction_cost_rate=transaction_cost_rate)
         
         analysis = controller.analyze_portfolio_rebalancing(portfolio_id)
+        settings = {
+            "tolerance_threshold": tolerance,
+            "transaction_cost_rate": transaction_cost_rate
+        }
+        
+        # Nothing to trade and no drift beyond tolerance; skip the drift aggregation
+        if analysis.is_balanced:
+            return {
+                "settings": settings,
+                "impact": {
+                    "is_balanced": True,
+                    "transactions_needed": 0,
+                    "total_transaction_cost": 0.0,
+                    "cost_percentage": 0,
+                    "total_value_to_trade": 0.0,
+                    "estimated_final_value": analysis.estimated_final_value
+                },
+                "significant_drifts": []
+            }
         
         # Calculate some additional metrics for preview
-        total_value_change = sum(abs(drift.value_difference) for drift in analysis.allocation_drifts)
+        drifts = analysis.allocation_drifts
+        total_value_change = analysis.total_value_to_trade()
         cost_percentage = (analysis.total_transaction_cost / analysis.total_value * 100) if analysis.total_value > 0 else 0
         
         return {
-            "settings": {
-                "tolerance_threshold": tolerance,
-                "transaction_cost_rate": transaction_cost_rate
-            },
+            "settings": settings,
             "impact": {
                 "is_balanced": analysis.is_balanced,
                 "transactions_needed": len(analysis.transactions),
@@ -273,12 +260,11 @@ async def preview_rebalancing_impact(
             },
             "significant_drifts": [
                 {
-                    "symbol": drift.symbol,
-                    "drift": drift.drift,
-                    "drift_percentage": drift.drift_percentage
+                    "symbol": drifts[i].symbol,
+                    "drift": drifts[i].drift,
+                    "drift_percentage": drifts[i].drift_percentage
                 }
-                for drift in analysis.allocation_drifts
-                if abs(drift.drift) > tolerance
+                for i in analysis.significant_drift_indices(tolerance)
             ]
         }
         
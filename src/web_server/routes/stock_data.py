@@ -93,13 +93,10 @@ async def refresh_portfolio_prices(portfolio_id: int, db: Session = Depends(get_
     """Refresh prices for all holdings in a portfolio."""
     controller = PortfolioController(db)
     
-    # Check if portfolio exists
-    portfolio = controller.get_portfolio(portfolio_id)
-    if not portfolio:
-        raise HTTPException(status_code=404, detail="Portfolio not found")
-    
     # Refresh prices
     result = controller.refresh_portfolio_prices(portfolio_id)
+    if result is None:
+        raise HTTPException(status_code=404, detail="Portfolio not found")
     
     if not result["success"]:
         raise HTTPException(status_code=500, detail=result.get("error", "Failed to refresh prices"))
@@ -136,6 +133,19 @@ async def get_portfolio_valuation(portfolio_id: int, db: Session = Depends(get_d
     return controller.get_portfolio_valuation(portfolio_id)
 
 
+@router.get("/portfolios/{portfolio_id}/drift")
+async def get_portfolio_drift(portfolio_id: int, threshold: float = 1.0, db: Session = Depends(get_db)):
+    """Get holdings whose allocation drifts from target by more than the threshold."""
+    controller = PortfolioController(db)
+    
+    # Check if portfolio exists
+    portfolio = controller.get_portfolio(portfolio_id)
+    if not portfolio:
+        raise HTTPException(status_code=404, detail="Portfolio not found")
+    
+    return controller.get_significant_drifts(portfolio_id, threshold)
+
+
 @router.get("/portfolios/{portfolio_id}/validate-symbols")
 async def validate_portfolio_symbols(portfolio_id: int, db: Session = Depends(get_db)):
     """Validate all stock symbols in a portfolio."""
@@ -1,8 +1,10 @@
 """Watchlist-related API routes."""
 
 from fastapi import APIRouter, Depends, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
+from sqlalchemy import bindparam, select
 from sqlalchemy.orm import Session
+from types import MappingProxyType
 from typing import List
 from datetime import datetime, timezone
 
@@ -12,27 +14,41 @@ from controllers.watchlist_controller import (
     WatchedItemCreate, 
     WatchedItemUpdate,
     WatchlistCreate,
-    WatchlistUpdate
+    WatchlistUpdate,
+    WatchlistNotFound
 )
 from controllers.news_controller import NewsController
 from models.portfolio import WatchedItem
 
 router = APIRouter(prefix="/api/watchlists", tags=["watchlists"])
 
+# Routes doing blocking database, price or news work are plain ``def`` so FastAPI
+# runs them in its threadpool instead of stalling the event loop.
+
+# Shared across requests so source rate-limit state and the news cache persist
+_news_controller = NewsController()
+
+# Reused by the news endpoints so the compiled statement is served from the cache
+_watched_item_stmt = select(WatchedItem).where(
+    WatchedItem.watchlist_id == bindparam("watchlist_id"),
+    WatchedItem.symbol == bindparam("symbol")
+).limit(1)
+
 
 @router.get("/", response_model=List[dict])
-async def list_watchlists(db: Session = Depends(get_db)):
+def list_watchlists(db: Session = Depends(get_db)):
     """Get all watchlists."""
     controller = WatchlistController(db)
     watchlists = controller.get_watchlists()
+    item_counts = controller.get_watchlist_item_counts()
     
     return [
         {
             "id": w.id,
             "name": w.name,
-            "created_date": w.created_date.isoformat(),
-            "modified_date": w.modified_date.isoformat(),
-            "items_count": len(w.watched_items)
+            "created_date": w.created_date,
+            "modified_date": w.modified_date,
+            "items_count": item_counts.get(w.id, 0)
         }
         for w in watchlists
     ]
@@ -52,8 +68,8 @@ async def get_watchlist(watchlist_id: int, db: Session = Depends(get_db)):
     return {
         "id": watchlist.id,
         "name": watchlist.name,
-        "created_date": watchlist.created_date.isoformat(),
-        "modified_date": watchlist.modified_date.isoformat(),
+        "created_date": watchlist.created_date,
+        "modified_date": watchlist.modified_date,
         "summary": summary
     }
 
@@ -68,7 +84,7 @@ async def create_watchlist(watchlist: WatchlistCreate, db: Session = Depends(get
         return {
             "id": new_watchlist.id,
             "name": new_watchlist.name,
-            "created_date": new_watchlist.created_date.isoformat(),
+            "created_date": new_watchlist.created_date,
             "message": "Watchlist created successfully"
         }
     except ValueError as e:
@@ -92,7 +108,7 @@ async def update_watchlist(
         return {
             "id": updated_watchlist.id,
             "name": updated_watchlist.name,
-            "modified_date": updated_watchlist.modified_date.isoformat(),
+            "modified_date": updated_watchlist.modified_date,
             "message": "Watchlist updated successfully"
         }
     except ValueError as e:
@@ -112,13 +128,10 @@ async def delete_watchlist(watchlist_id: int, db: Session = Depends(get_db)):
 
 # Watched Items endpoints
 @router.get("/{watchlist_id}/items", response_model=List[dict])
-async def get_watched_items(watchlist_id: int, db: Session = Depends(get_db)):
+def get_watched_items(watchlist_id: int, db: Session = Depends(get_db)):
     """Get all watched items for a watchlist."""
     controller = WatchlistController(db)
     
-    if not controller.get_watchlist(watchlist_id):
-        raise HTTPException(status_code=404, detail="Watchlist not found")
-    
     items = controller.get_watchlist_items_with_details(watchlist_id)
     return items
 
@@ -140,7 +153,7 @@ async def create_watched_item(
         return {
             "symbol": new_watched_item.symbol,
             "notes": new_watched_item.notes,
-            "added_date": new_watched_item.added_date.isoformat(),
+            "added_date": new_watched_item.added_date,
             "message": "Stock added to watchlist successfully"
         }
     except ValueError as e:
@@ -184,14 +197,13 @@ async def delete_watched_item(watchlist_id: int, symbol: str, db: Session = Depe
 
 # Price update endpoints
 @router.post("/{watchlist_id}/refresh-prices")
-async def refresh_watchlist_prices(watchlist_id: int, db: Session = Depends(get_db)):
+def refresh_watchlist_prices(watchlist_id: int, db: Session = Depends(get_db)):
     """Refresh prices for all items in a watchlist."""
     controller = WatchlistController(db)
     
-    if not controller.get_watchlist(watchlist_id):
-        raise HTTPException(status_code=404, detail="Watchlist not found")
-    
     result = controller.refresh_watchlist_prices(watchlist_id)
+    if result is None:
+        raise HTTPException(status_code=404, detail="Watchlist not found")
     
     if not result["success"]:
         raise HTTPException(status_code=500, detail=result.get("error", "Failed to refresh prices"))
@@ -200,7 +212,7 @@ async def refresh_watchlist_prices(watchlist_id: int, db: Session = Depends(get_
 
 
 @router.post("/{watchlist_id}/items/{symbol}/refresh-price")
-async def refresh_single_item_price(
+def refresh_single_item_price(
     watchlist_id: int, 
     symbol: str, 
     db: Session = Depends(get_db)
@@ -221,20 +233,17 @@ async def refresh_single_item_price(
 
 # Validation endpoints
 @router.get("/{watchlist_id}/validate-symbols")
-async def validate_watchlist_symbols(watchlist_id: int, db: Session = Depends(get_db)):
+def validate_watchlist_symbols(watchlist_id: int, db: Session = Depends(get_db)):
     """Validate all stock symbols in a watchlist."""
     controller = WatchlistController(db)
     
-    if not controller.get_watchlist(watchlist_id):
-        raise HTTPException(status_code=404, detail="Watchlist not found")
-    
     validation_result = controller.validate_watchlist_symbols(watchlist_id)
     return validation_result
 
 
 # Bulk operations
 @router.post("/{watchlist_id}/bulk-add")
-async def bulk_add_items(
+def bulk_add_items(
     watchlist_id: int,
     symbols: List[str],
     db: Session = Depends(get_db)
@@ -242,26 +251,12 @@ async def bulk_add_items(
     """Add multiple symbols to a watchlist at once with automatic price fetching."""
     controller = WatchlistController(db)
     
-    if not controller.get_watchlist(watchlist_id):
-        raise HTTPException(status_code=404, detail="Watchlist not found")
-    
-    added_count = 0
-    errors = []
-    
-    for symbol in symbols:
-        try:
-            symbol = symbol.strip().upper()
-            if not symbol:
-                continue
-                
-            watched_item = WatchedItemCreate(symbol=symbol)
-            result = controller.add_watched_item(watchlist_id, watched_item)
-            if result:
-                added_count += 1
-        except ValueError as e:
-            errors.append(f"{symbol}: {str(e)}")
-        except Exception as e:
-            errors.append(f"{symbol}: Unexpected error - {str(e)}")
+    try:
+        added_count, errors = controller.bulk_add_watched_items(watchlist_id, symbols)
+    except WatchlistNotFound:
+        raise
+    except Exception as e:
+        added_count, errors = 0, [f"Unexpected error - {str(e)}"]
     
     # If items were added successfully, refresh prices for the watchlist
     if added_count > 0:
@@ -281,7 +276,7 @@ async def bulk_add_items(
 
 
 @router.delete("/{watchlist_id}/bulk-remove")
-async def bulk_remove_items(
+def bulk_remove_items(
     watchlist_id: int,
     symbols: List[str],
     db: Session = Depends(get_db)
@@ -289,24 +284,7 @@ async def bulk_remove_items(
     """Remove multiple symbols from a watchlist at once."""
     controller = WatchlistController(db)
     
-    if not controller.get_watchlist(watchlist_id):
-        raise HTTPException(status_code=404, detail="Watchlist not found")
-    
-    removed_count = 0
-    errors = []
-    
-    for symbol in symbols:
-        try:
-            symbol = symbol.strip().upper()
-            if not symbol:
-                continue
-                
-            if controller.delete_watched_item(watchlist_id, symbol):
-                removed_count += 1
-            else:
-                errors.append(f"{symbol}: Not found in watchlist")
-        except Exception as e:
-            errors.append(f"{symbol}: Unexpected error - {str(e)}")
+    removed_count, errors = controller.bulk_remove_watched_items(watchlist_id, symbols)
     
     return {
         "removed_count": removed_count,
@@ -319,78 +297,78 @@ async def bulk_remove_items(
 
 # News endpoints
 @router.get("/{watchlist_id}/items/{symbol}/news")
-async def get_item_news(watchlist_id: int, symbol: str, db: Session = Depends(get_db)):
+def get_item_news(watchlist_id: int, symbol: str, db: Session = Depends(get_db)):
     """Get news for a specific watched item."""
-    watchlist_controller = WatchlistController(db)
-    news_controller = NewsController()
+    news_controller = _news_controller
     
     # Find the watched item
-    watched_item = db.query(WatchedItem).filter(
-        WatchedItem.watchlist_id == watchlist_id,
-        WatchedItem.symbol == symbol
-    ).first()
+    watched_item = db.execute(
+        _watched_item_stmt, {"watchlist_id": watchlist_id, "symbol": symbol}
+    ).scalar_one_or_none()
     
     if not watched_item:
         raise HTTPException(status_code=404, detail="Watched item not found")
     
     # Get cached or fresh news
+    now = datetime.now(timezone.utc)
     articles, was_fetched = news_controller.get_cached_or_fresh_news(
         symbol, 
         watched_item.last_news_update, 
-        watched_item.news_data
+        watched_item.news_data,
+        now=now
     )
     
     # Update cache if we fetched fresh news (but don't cache mock data)
     if was_fetched and articles:
         # Only cache if it's not mock data
         if not any("(Mock)" in article.source for article in articles):
-            watched_item.news_data = news_controller.format_news_for_storage(articles)
-            watched_item.last_news_update = datetime.now(timezone.utc)
+            watched_item.news_data = news_controller.format_news_for_storage(articles, now=now)
+            watched_item.last_news_update = now
             db.commit()
     
-    return {
+    # Already plain JSON types, so skip jsonable_encoder and hand it to orjson
+    return ORJSONResponse(content={
         "symbol": symbol,
         "articles": [article.to_dict() for article in articles],
         "cached": not was_fetched,
-        "last_updated": watched_item.last_news_update.isoformat() if watched_item.last_news_update else None,
+        "last_updated": watched_item.last_news_update,
         "count": len(articles)
-    }
+    })
 
 
 @router.post("/{watchlist_id}/items/{symbol}/refresh-news")
-async def refresh_item_news(watchlist_id: int, symbol: str, db: Session = Depends(get_db)):
+def refresh_item_news(watchlist_id: int, symbol: str, db: Session = Depends(get_db)):
     """Force refresh news for a specific watched item."""
-    watchlist_controller = WatchlistController(db)
-    news_controller = NewsController()
+    news_controller = _news_controller
     
     # Find the watched item
-    watched_item = db.query(WatchedItem).filter(
-        WatchedItem.watchlist_id == watchlist_id,
-        WatchedItem.symbol == symbol
-    ).first()
+    watched_item = db.execute(
+        _watched_item_stmt, {"watchlist_id": watchlist_id, "symbol": symbol}
+    ).scalar_one_or_none()
     
     if not watched_item:
         raise HTTPException(status_code=404, detail="Watched item not found")
     
     # Force fetch fresh news
-    articles = news_controller.get_ticker_news(symbol)
+    articles = news_controller.get_ticker_news(symbol, use_cache=False)
+    now = datetime.now(timezone.utc)
     
     # Update cache (but don't cache mock data)
     if articles:
         # Only cache if it's not mock data
         if not any("(Mock)" in article.source for article in articles):
-            watched_item.news_data = news_controller.format_news_for_storage(articles)
-            watched_item.last_news_update = datetime.now(timezone.utc)
+            watched_item.news_data = news_controller.format_news_for_storage(articles, now=now)
+            watched_item.last_news_update = now
             db.commit()
         
-        return {
+        return ORJSONResponse(content={
             "symbol": symbol,
             "articles": [article.to_dict() for article in articles],
             "updated": True,
-            "last_updated": watched_item.last_news_update.isoformat(),
+            "last_updated": watched_item.last_news_update,
             "count": len(articles),
             "message": f"Refreshed {len(articles)} news articles for {symbol}"
-        }
+        })
     else:
         return {
             "symbol": symbol,
@@ -401,29 +379,29 @@ async def refresh_item_news(watchlist_id: int, symbol: str, db: Session = Depend
         }
 
 
+# Static part of the debug endpoint's mock article, built once at import
+_TEST_NEWS_ARTICLE = MappingProxyType({
+    "url": "https://example.com/test",
+    "published_utc": "2025-01-06T15:00:00Z",
+    "source": "Test Source",
+    "summary": "This is a test article to verify the news system is working."
+})
+
+
 # Debug endpoint to test connectivity
 @router.get("/{watchlist_id}/items/{symbol}/test-news")
 async def test_news_endpoint(watchlist_id: int, symbol: str, db: Session = Depends(get_db)):
     """Simple test endpoint to verify connectivity and data."""
     # Find the watched item
-    watched_item = db.query(WatchedItem).filter(
-        WatchedItem.watchlist_id == watchlist_id,
-        WatchedItem.symbol == symbol
-    ).first()
+    watched_item = db.execute(
+        _watched_item_stmt, {"watchlist_id": watchlist_id, "symbol": symbol}
+    ).scalar_one_or_none()
     
     if not watched_item:
         return {"error": "Watched item not found", "symbol": symbol, "watchlist_id": watchlist_id}
     
     # Return basic info and mock news
-    mock_articles = [
-        {
-            "title": f"Test News for {symbol}",
-            "url": "https://example.com/test",
-            "published_utc": "2025-01-06T15:00:00Z",
-            "source": "Test Source",
-            "summary": "This is a test article to verify the news system is working."
-        }
-    ]
+    mock_articles = [{"title": f"Test News for {symbol}", **_TEST_NEWS_ARTICLE}]
     
     return {
         "symbol": symbol,
@@ -432,7 +410,7 @@ async def test_news_endpoint(watchlist_id: int, symbol: str, db: Session = Depen
         "cached": True,
         "count": len(mock_articles),
         "has_news_data": watched_item.news_data is not None,
-        "last_news_update": watched_item.last_news_update.isoformat() if watched_item.last_news_update else None,
+        "last_news_update": watched_item.last_news_update,
         "test": True
     }
 
@@ -440,30 +418,28 @@ async def test_news_endpoint(watchlist_id: int, symbol: str, db: Session = Depen
 @router.post("/{watchlist_id}/clear-mock-news")
 async def clear_mock_news_cache(watchlist_id: int, db: Session = Depends(get_db)):
     """Clear cached mock news data for all items in a watchlist."""
-    # Find all watched items in the watchlist
-    watched_items = db.query(WatchedItem).filter(
+    controller = WatchlistController(db)
+    
+    # Find all watched items in the watchlist (only the columns needed here)
+    watched_items = db.query(WatchedItem.id, WatchedItem.news_data).filter(
         WatchedItem.watchlist_id == watchlist_id
     ).all()
     
-    cleared_count = 0
+    updates = []
     
-    for watched_item in watched_items:
+    for item_id, news_data in watched_items:
         # Check if the item has cached mock news
-        if watched_item.news_data and watched_item.news_data.get('articles'):
-            articles_data = watched_item.news_data.get('articles', [])
+        if news_data and news_data.get('articles'):
             has_mock_news = any(
                 article.get('source', '').endswith('(Mock)') 
-                for article in articles_data
+                for article in news_data['articles']
             )
             
             if has_mock_news:
                 # Clear the cached mock news
-                watched_item.news_data = None
-                watched_item.last_news_update = None
-                cleared_count += 1
+                updates.append({"id": item_id, "news_data": None, "last_news_update": None})
     
-    if cleared_count > 0:
-        db.commit()
+    cleared_count = controller.bulk_update_news(updates)
     
     return {
         "success": True,
@@ -483,9 +459,6 @@ async def reorder_watchlist_items(
     """Reorder watched items in a watchlist."""
     controller = WatchlistController(db)
     
-    if not controller.get_watchlist(watchlist_id):
-        raise HTTPException(status_code=404, detail="Watchlist not found")
-    
     try:
         success = controller.reorder_watchlist_items(watchlist_id, symbol_order)
         if success: